@@ -0,0 +1,105 @@
+"""
+Authentication from the access token's claims alone.
+
+Tokens issued by ``LoginAPIView``/``RefreshTokenAPIView`` carry the user's
+``role``, and that plus the user id is all the API views check, so
+``ClaimsJWTAuthentication`` builds ``request.user`` from the token instead
+of querying ``CustomUser`` on every request. ``username`` and ``is_staff``
+come from a short-lived per-user cache of a few columns, and any other
+attribute loads the full user from the database on first access. Tokens
+without a ``role`` claim (issued before it existed) take the regular
+database path.
+
+Role changes and deactivation are picked up when the refresh token is next
+exchanged, i.e. within ``ACCESS_TOKEN_LIFETIME``.
+"""
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.functional import cached_property
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import CustomUser
+
+
+# The only columns that go into the shared cache; the password hash and the
+# rest of the row are read from the database when something asks for them.
+CACHED_USER_FIELDS = ("id", "username", "role", "is_active", "is_staff")
+
+
+def user_cache_key(user_id):
+    return f"accounts:user:{user_id}"
+
+
+def get_cached_user(user_id):
+    """``CACHED_USER_FIELDS`` of the active user ``user_id`` as a dict, cached for ``AUTH_USER_CACHE_TTL`` seconds."""
+    key = user_cache_key(user_id)
+    fields = cache.get(key)
+    if fields is None:
+        fields = CustomUser.objects.filter(pk=user_id, is_active=True).values(*CACHED_USER_FIELDS).first()
+        if fields is None:
+            raise AuthenticationFailed("User not found", code="user_not_found")
+        cache.set(key, fields, settings.AUTH_USER_CACHE_TTL)
+    return fields
+
+
+class ClaimsUser(TokenUser):
+    @cached_property
+    def id(self):
+        return int(self.token[api_settings.USER_ID_CLAIM])
+
+    @cached_property
+    def role(self):
+        return self.token["role"]
+
+    @cached_property
+    def username(self):
+        return self.token.get("username") or self.cached_fields["username"]
+
+    @cached_property
+    def is_staff(self):
+        return self.token.get("is_staff", self.cached_fields["is_staff"])
+
+    @cached_property
+    def cached_fields(self):
+        return get_cached_user(self.id)
+
+    @cached_property
+    def user(self):
+        try:
+            return CustomUser.objects.get(pk=self.id, is_active=True)
+        except CustomUser.DoesNotExist:
+            raise AuthenticationFailed("User not found", code="user_not_found")
+
+    def __str__(self):
+        return self.username
+
+    def __getattr__(self, attr):
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        if attr in self.token:
+            return self.token[attr]
+        return getattr(self.user, attr)
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        if "role" not in validated_token or api_settings.USER_ID_CLAIM not in validated_token:
+            return super().get_user(validated_token)
+        return ClaimsUser(validated_token)
+
+    async def aauthenticate(self, request):
+        """``authenticate`` for async views; only tokens without a role claim touch the database."""
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        if "role" in validated_token and api_settings.USER_ID_CLAIM in validated_token:
+            return ClaimsUser(validated_token), validated_token
+        return await sync_to_async(self.get_user)(validated_token), validated_token
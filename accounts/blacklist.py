@@ -0,0 +1,105 @@
+"""
+Process-local copy of the token blacklist.
+
+Refreshing a token used to ask ``token_blacklist`` whether its jti was
+blacklisted (a join of the blacklisted and outstanding token tables) on
+every call. ``TokenBlacklist`` keeps the jtis of blacklisted, unexpired
+tokens in memory instead: it is loaded on first use, reloaded every
+``TOKEN_BLACKLIST["SYNC_INTERVAL"]`` seconds so logouts handled by other
+processes are picked up, and updated right away on logouts in this one.
+That delay is well inside the access-token lifetime, during which a logged
+out user's access token stays valid anyway.
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+
+class TokenBlacklist:
+    def __init__(self):
+        self._jtis = {}
+        self._added = None
+        self._synced_at = None
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+    def sync(self):
+        """Reload from the database, keeping jtis added while the query runs."""
+        with self._sync_lock:
+            self._load()
+
+    def _load(self):
+        with self._lock:
+            self._added = {}
+        jtis = None
+        try:
+            jtis = self._fetch()
+        finally:
+            with self._lock:
+                if jtis is not None:
+                    jtis.update(self._added)
+                    self._jtis = jtis
+                    self._synced_at = time.monotonic()
+                self._added = None
+
+    def _fetch(self):
+        return dict(
+            BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now())
+            .values_list("token__jti", "token__expires_at")
+        )
+
+    def _stale(self):
+        return (
+            self._synced_at is None
+            or time.monotonic() - self._synced_at > settings.TOKEN_BLACKLIST["SYNC_INTERVAL"]
+        )
+
+    def _refresh(self):
+        # One thread reloads while the others answer from the current copy;
+        # before the first load there is no copy, so they wait for it.
+        if self._sync_lock.acquire(blocking=self._synced_at is None):
+            try:
+                if self._stale():
+                    self._load()
+            finally:
+                self._sync_lock.release()
+
+    def contains(self, jti):
+        if self._stale():
+            self._refresh()
+        return jti in self._jtis
+
+    def add(self, jti, expires_at):
+        with self._lock:
+            self._jtis[jti] = expires_at
+            if self._added is not None:
+                self._added[jti] = expires_at
+
+
+token_blacklist = TokenBlacklist()
+
+
+def purge_expired_tokens(batch_size=1000):
+    """
+    Delete outstanding tokens that have expired (their blacklist entries go
+    with them), ``batch_size`` rows per transaction. Returns the number of
+    tokens removed.
+    """
+    purged = 0
+    now = timezone.now()
+    while True:
+        with transaction.atomic():
+            ids = list(
+                OutstandingToken.objects.filter(expires_at__lte=now)
+                .order_by("id")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                return purged
+            BlacklistedToken.objects.filter(token_id__in=ids).delete()
+            OutstandingToken.objects.filter(id__in=ids).delete()
+        purged += len(ids)
@@ -0,0 +1,18 @@
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.views import exception_handler as drf_exception_handler
+
+from .hashers import PasswordHashingBusy
+
+
+class HashingUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Too many sign-ins in progress, try again shortly."
+    default_code = "password_hashing_busy"
+
+
+def exception_handler(exc, context):
+    """DRF's handler, plus a 503 for a saturated password hashing pool."""
+    if isinstance(exc, PasswordHashingBusy):
+        exc = HashingUnavailable()
+    return drf_exception_handler(exc, context)
@@ -0,0 +1,61 @@
+"""
+Password hashing on a bounded worker pool.
+
+``TunablePBKDF2PasswordHasher`` is Django's PBKDF2-SHA256 hasher with its
+iteration count taken from ``PASSWORD_HASHING["ITERATIONS"]`` and every
+digest computed on a shared thread pool of ``PASSWORD_HASHING["WORKERS"]``
+threads. ``hashlib`` releases the GIL while it hashes, so at most that many
+cores are busy hashing however many logins arrive at once; past
+``MAX_PENDING`` waiting hashes ``PasswordHashingBusy`` is raised instead of
+queueing (the API answers it with a 503, see ``accounts.exceptions``).
+Because the algorithm name is unchanged, existing hashes still verify, and
+``must_update`` rehashes them on the next login whenever the configured
+iteration count differs.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+_pool = None
+_slots = None
+_pool_lock = threading.Lock()
+
+
+class PasswordHashingBusy(RuntimeError):
+    """``MAX_PENDING`` hashes are already waiting for the pool."""
+
+
+def get_pool():
+    global _pool, _slots
+    if _pool is None and settings.PASSWORD_HASHING["WORKERS"] > 0:
+        with _pool_lock:
+            if _pool is None:
+                _slots = threading.BoundedSemaphore(settings.PASSWORD_HASHING["MAX_PENDING"])
+                _pool = ThreadPoolExecutor(
+                    max_workers=settings.PASSWORD_HASHING["WORKERS"], thread_name_prefix="password-hashing"
+                )
+    return _pool
+
+
+def run_hashing(fn, *args):
+    """Run ``fn(*args)`` on the hashing pool and wait for it (inline when the pool is disabled)."""
+    pool = get_pool()
+    if pool is None:
+        return fn(*args)
+    if not _slots.acquire(blocking=False):
+        raise PasswordHashingBusy()
+    try:
+        return pool.submit(fn, *args).result()
+    finally:
+        _slots.release()
+
+
+class TunablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    @property
+    def iterations(self):
+        return settings.PASSWORD_HASHING["ITERATIONS"]
+
+    def encode(self, password, salt, iterations=None):
+        return run_hashing(super().encode, password, salt, iterations)
@@ -0,0 +1,71 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, get_hasher, make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.test import APIRequestFactory
+
+from accounts.models import CustomUser
+from accounts.views import LoginAPIView
+
+PASSWORD = "bench-login-password"
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure login throughput under the configured PASSWORD_HASHERS: full "
+        "LoginAPIView logins one at a time (one core), then password checks "
+        "from --threads concurrent callers through the hashing pool. The "
+        "benchmark user is created in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--logins", type=int, default=20)
+        parser.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+
+    def handle(self, *args, **options):
+        hasher = get_hasher()
+        workers = settings.PASSWORD_HASHING["WORKERS"]
+        self.stdout.write(
+            f"hasher {hasher.algorithm} ({type(hasher).__name__}), "
+            f"{getattr(hasher, 'iterations', '-')} iterations, {workers or 'no'} hashing workers, "
+            f"{os.cpu_count()} cpus"
+        )
+
+        with transaction.atomic():
+            CustomUser.objects.create_user("bench-login", password=PASSWORD, role="seeker")
+            elapsed = self.login(options["logins"])
+            transaction.set_rollback(True)
+        self.stdout.write(
+            f"login    {elapsed / options['logins'] * 1000:8.1f} ms each   "
+            f"{options['logins'] / elapsed:7.1f} logins/s per core"
+        )
+
+        encoded = make_password(PASSWORD)
+        threads = options["threads"]
+        checks = max(options["logins"], threads)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as callers:
+            results = list(callers.map(lambda _: check_password(PASSWORD, encoded), range(checks)))
+        elapsed = time.perf_counter() - started
+        if not all(results):
+            raise CommandError("Password check failed.")
+        cores = min(threads, workers or threads, os.cpu_count() or 1)
+        self.stdout.write(
+            f"hashing  {checks / elapsed:8.1f} checks/s from {threads} threads on at most {cores} core(s)   "
+            f"{checks / elapsed / cores:7.1f} per core"
+        )
+
+    def login(self, count):
+        view = LoginAPIView.as_view()
+        factory = APIRequestFactory()
+        started = time.perf_counter()
+        for _ in range(count):
+            request = factory.post("/auth/login/", {"username": "bench-login", "password": PASSWORD}, format="json")
+            response = view(request)
+            if response.status_code != 200:
+                raise CommandError(f"Login failed: {response.data}")
+        return time.perf_counter() - started
@@ -1,3 +1,167 @@
-from django.test import TestCase
+import threading
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache, caches
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from .authentication import ClaimsJWTAuthentication, user_cache_key
+from .blacklist import TokenBlacklist, purge_expired_tokens
+from .hashers import PasswordHashingBusy, TunablePBKDF2PasswordHasher
+from .models import CustomUser
+from .tokens import RoleRefreshToken
+
+
+# Cheap password hashing: the real iteration count costs half a second per user.
+@override_settings(PASSWORD_HASHING={"ITERATIONS": 1000, "WORKERS": 0, "MAX_PENDING": 64})
+class AccountsTestCase(TestCase):
+    password = "pw-12345678"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(
+            "seeker", email="seeker@example.com", password=cls.password, role="seeker"
+        )
+
+    def setUp(self):
+        for backend in caches.all():
+            backend.clear()
+
+
+class ClaimsUserTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        # Issuing a refresh token records it in the database, so do it up front.
+        self.access_token = str(RoleRefreshToken.for_user(self.user).access_token)
+
+    def claims_user(self):
+        authentication = ClaimsJWTAuthentication()
+        return authentication.get_user(authentication.get_validated_token(self.access_token))
+
+    def test_id_and_role_come_from_the_token(self):
+        with self.assertNumQueries(0):
+            user = self.claims_user()
+            self.assertEqual((user.id, user.role), (self.user.pk, "seeker"))
+
+    def test_cache_holds_only_the_listed_fields(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(self.claims_user().username, "seeker")
+        self.assertEqual(
+            cache.get(user_cache_key(self.user.pk)),
+            {"id": self.user.pk, "username": "seeker", "role": "seeker", "is_active": True, "is_staff": False},
+        )
+        with self.assertNumQueries(0):
+            self.assertEqual(self.claims_user().username, "seeker")
+
+    def test_other_attributes_load_the_user(self):
+        user = self.claims_user()
+        with self.assertNumQueries(1):
+            self.assertEqual(user.email, "seeker@example.com")
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk)))
+
+
+class TokenBlacklistTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.blacklist = TokenBlacklist()
+        self.expires_at = timezone.now() + timedelta(days=1)
+
+    def test_add_during_sync_survives_the_reload(self):
+        fetch = self.blacklist._fetch
+
+        def fetch_while_logging_out():
+            rows = fetch()
+            self.blacklist.add("late", self.expires_at)
+            return rows
+
+        with mock.patch.object(self.blacklist, "_fetch", side_effect=fetch_while_logging_out):
+            self.blacklist.sync()
+        self.assertTrue(self.blacklist.contains("late"))
+
+    def test_only_one_thread_reloads_a_stale_copy(self):
+        self.blacklist.sync()
+        self.blacklist.add("known", self.expires_at)
+        self.blacklist._synced_at -= 10 ** 6
+        # Another thread is mid-reload: answer from the current copy without querying.
+        with self.blacklist._sync_lock, self.assertNumQueries(0):
+            self.assertTrue(self.blacklist.contains("known"))
+        with self.assertNumQueries(1):
+            self.assertFalse(self.blacklist.contains("known"))
+
+    def test_first_load_is_waited_for(self):
+        outstanding = OutstandingToken.objects.create(jti="old", token="-", expires_at=self.expires_at)
+        BlacklistedToken.objects.create(token=outstanding)
+        answers = []
+        with self.blacklist._sync_lock:
+            thread = threading.Thread(target=lambda: answers.append(self.blacklist.contains("old")))
+            thread.start()
+            thread.join(0.1)
+            self.assertEqual(answers, [])
+            self.blacklist._load()
+        thread.join()
+        self.assertEqual(answers, [True])
+
+    def test_purge_removes_only_expired_tokens(self):
+        expired = OutstandingToken.objects.create(jti="gone", token="-", expires_at=timezone.now() - timedelta(1))
+        BlacklistedToken.objects.create(token=expired)
+        OutstandingToken.objects.create(jti="kept", token="-", expires_at=self.expires_at)
+        self.assertEqual(purge_expired_tokens(batch_size=1), 1)
+        self.assertEqual(list(OutstandingToken.objects.values_list("jti", flat=True)), ["kept"])
+        self.assertFalse(BlacklistedToken.objects.exists())
+
+
+class LogoutTests(AccountsTestCase):
+    def test_refresh_token_is_rejected_after_logout(self):
+        client = APIClient()
+        refresh = client.post(
+            "/auth/login/", {"username": "seeker", "password": self.password}, format="json"
+        ).json()["refresh"]
+        self.assertEqual(client.post("/auth/refresh/", {"token": refresh}, format="json").status_code, 200)
+        self.assertEqual(client.post("/auth/logout/", {"token": refresh}, format="json").status_code, 205)
+        with self.assertNumQueries(0):
+            response = client.post("/auth/refresh/", {"token": refresh}, format="json")
+        self.assertEqual(response.status_code, 400)
+
+
+class PasswordHashingBusyTests(AccountsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.enterContext(mock.patch.object(TunablePBKDF2PasswordHasher, "encode", side_effect=PasswordHashingBusy))
+
+    def test_login_answers_503(self):
+        response = self.client.post("/auth/login/", {"username": "seeker", "password": self.password}, format="json")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.data["detail"].code, "password_hashing_busy")
+
+    def test_register_answers_503(self):
+        payload = {
+            "username": "new", "email": "new@example.com", "role": "seeker",
+            "password": self.password, "confirm_password": self.password,
+        }
+        self.assertEqual(self.client.post("/auth/register/", payload, format="json").status_code, 503)
+        self.assertFalse(CustomUser.objects.filter(username="new").exists())
+
+
+class LoginThrottleTests(AccountsTestCase):
+    def test_forged_forwarded_for_does_not_reset_the_limit(self):
+        client = APIClient()
+        payload = {"username": "seeker", "password": "wrong"}
+        statuses = [
+            client.post("/auth/login/", payload, format="json", HTTP_X_FORWARDED_FOR=f"10.0.0.{i}").status_code
+            for i in range(6)
+        ]
+        self.assertEqual(statuses, [400] * 5 + [429])
+
+    def test_response_cache_cannot_evict_the_bucket(self):
+        client = APIClient()
+        payload = {"username": "seeker", "password": "wrong"}
+        statuses = [client.post("/auth/login/", payload, format="json").status_code for _ in range(6)]
+        self.assertEqual(statuses, [400] * 5 + [429])
+        # Far more anonymous responses than the default cache holds.
+        for i in range(400):
+            client.get(f"/api/vacancies/?x={i}")
+        self.assertEqual(client.post("/auth/login/", payload, format="json").status_code, 429)
@@ -1,8 +1,9 @@
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from django.contrib.auth import authenticate
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.settings import api_settings
 from .models import CustomUser
+from .tokens import RoleRefreshToken
 
 from .serializers import (
     RegisterSerializer,
@@ -14,10 +15,12 @@ from .serializers import (
 class RegisterAPIView(generics.CreateAPIView):
     queryset = CustomUser.objects.all()
     permission_classes = [permissions.AllowAny]
+    throttle_scope = "register"
     serializer_class = RegisterSerializer
 
 class LoginAPIView(generics.GenericAPIView):
     permission_classes = [permissions.AllowAny]
+    throttle_scope = "login"
     serializer_class = LoginSerializer
 
     def post(self, request):
@@ -29,7 +32,7 @@ class LoginAPIView(generics.GenericAPIView):
         user = authenticate(request, username=username, password=password)
 
         if user:
-            refresh_token = RefreshToken.for_user(user)
+            refresh_token = RoleRefreshToken.for_user(user)
             return Response({
                 "refresh": str(refresh_token),
                 "access": str(refresh_token.access_token)
@@ -40,6 +43,7 @@ class LoginAPIView(generics.GenericAPIView):
 
 class RefreshTokenAPIView(generics.GenericAPIView):
     permission_classes = [permissions.AllowAny]
+    throttle_scope = "refresh"
     serializer_class = RefreshTokenSerializer
 
     def post(self, request):
@@ -48,7 +52,14 @@ class RefreshTokenAPIView(generics.GenericAPIView):
 
         token = serializer.validated_data["token"]
         try:
-            refresh_token = RefreshToken(token)
+            refresh_token = RoleRefreshToken(token)
+            # Re-read the role so changes (and deactivation) reach the new access token.
+            role = CustomUser.objects.filter(
+                pk=refresh_token[api_settings.USER_ID_CLAIM], is_active=True
+            ).values_list("role", flat=True).first()
+            if role is None:
+                return Response({"detail": "User not found"}, status=status.HTTP_400_BAD_REQUEST)
+            refresh_token["role"] = role
             return Response({
                 "refresh": str(refresh_token),
                 "access": str(refresh_token.access_token)
@@ -67,7 +78,7 @@ class LogoutAPIView(generics.GenericAPIView):
 
         token = serializer.validated_data["token"]
         try:
-            refresh_token = RefreshToken(token)
+            refresh_token = RoleRefreshToken(token)
             refresh_token.blacklist()
             return Response({"detail": "User logged out!"}, status=status.HTTP_205_RESET_CONTENT)
         except Exception as err:
@@ -0,0 +1,167 @@
+"""
+Async variants of the vacancy list/detail, company profile and favorite
+toggle endpoints, for ASGI deployments (``server.asgi``).
+
+They are plain Django async views on the async ORM, so a worker process
+can hold many slow client connections without a thread per request. They
+reuse the DRF views' filters, keyset pagination, serializers, JWT
+authentication and throttles and return the same JSON, but skip the
+anonymous response cache and conditional GET, and don't offer ``?stream``
+or ``?facets``.
+"""
+import math
+from functools import wraps
+from types import SimpleNamespace
+
+from asgiref.sync import sync_to_async
+from django.db import IntegrityError
+from django.http import Http404, HttpResponse
+from django.shortcuts import aget_object_or_404
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
+from rest_framework import status
+from rest_framework.exceptions import (
+    APIException, NotAuthenticated, NotFound, PermissionDenied, Throttled, ValidationError,
+)
+from rest_framework.request import Request
+
+from accounts.authentication import ClaimsJWTAuthentication
+from .filters import filter_created_between, filter_vacancies, vacancy_ordering
+from .models import Company, FavoriteVacancy, Vacancy
+from .pagination import VacancyCursorPagination
+from .search import search_vacancies
+from .serializers import CompanyProfileSerializer, VacancySerializer, VacancyValuesSerializer
+from .streaming import encode_json
+from .throttling import ScopedThrottle
+
+UNSUPPORTED_PARAMS = ("stream", "facets")
+
+
+def json_response(data, status=status.HTTP_200_OK):
+    return HttpResponse(encode_json(data), status=status, content_type="application/json")
+
+
+def async_api_view(methods):
+    """
+    Wrap an async view: hand it a DRF ``Request`` (for ``query_params``),
+    exempt it from CSRF like DRF views, and render ``APIException`` /
+    ``Http404`` the way DRF's exception handler does.
+    """
+
+    def decorator(view):
+        @csrf_exempt
+        @require_http_methods(methods)
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            try:
+                return await view(Request(request), *args, **kwargs)
+            except Http404 as exc:
+                return json_response({"detail": str(exc) or "Not found."}, status=status.HTTP_404_NOT_FOUND)
+            except APIException as exc:
+                detail = exc.detail if isinstance(exc.detail, (list, dict)) else {"detail": exc.detail}
+                response = json_response(detail, status=exc.status_code)
+                if exc.status_code == status.HTTP_401_UNAUTHORIZED:
+                    response["WWW-Authenticate"] = ClaimsJWTAuthentication().authenticate_header(request)
+                if getattr(exc, "wait", None) is not None:
+                    response["Retry-After"] = str(math.ceil(exc.wait))
+                return response
+
+        return wrapper
+
+    return decorator
+
+
+async def authenticate(request):
+    """Set ``request.user`` from the bearer token; raises ``NotAuthenticated`` without one."""
+    result = await ClaimsJWTAuthentication().aauthenticate(request)
+    if result is None:
+        raise NotAuthenticated()
+    request.user, request.auth = result
+    return request.user
+
+
+async def check_throttle(request, scope):
+    # The throttle's cache calls and locks are blocking, so keep them off the event loop.
+    throttle = ScopedThrottle()
+    if not await sync_to_async(throttle.allow_request)(request, SimpleNamespace(throttle_scope=scope)):
+        raise Throttled(throttle.wait())
+
+
+def reject_unsupported(params):
+    for name in UNSUPPORTED_PARAMS:
+        if name in params:
+            raise ValidationError({name: "Not available on the async endpoint."})
+
+
+@async_api_view(["GET"])
+async def vacancy_list(request):
+    params = request.query_params
+    reject_unsupported(params)
+    queryset = Vacancy.objects.active()
+    if params.get("t"):
+        queryset = search_vacancies(queryset, params["t"])
+    queryset = filter_vacancies(filter_created_between(queryset, params), params)
+
+    paginator = VacancyCursorPagination()
+    view = SimpleNamespace(get_cursor_ordering=lambda ordering: vacancy_ordering(params, ordering))
+    serializer = VacancyValuesSerializer(context={"request": request})
+    ordering = paginator.get_ordering(request, queryset, view)
+    rows = serializer.values(queryset, *[field.lstrip("-") for field in ordering])
+    page = await paginator.apaginate_queryset(rows, request, view)
+    return json_response({
+        "next": paginator.get_next_link(),
+        "previous": paginator.get_previous_link(),
+        "results": await serializer.arepresent(page),
+    })
+
+
+@async_api_view(["GET"])
+async def vacancy_detail(request, pk):
+    # Anonymous unless a token is sent: inactive vacancies are for their author only.
+    result = await ClaimsJWTAuthentication().aauthenticate(request)
+    user = result[0] if result is not None else None
+    queryset = VacancySerializer.setup_eager_loading(Vacancy.objects.visible_to(user))
+    vacancy = await aget_object_or_404(queryset, pk=pk)
+    # The view counter may flush to the database, which the async ORM can't do from here.
+    await sync_to_async(vacancy.increment_views)()
+    return json_response(VacancySerializer(vacancy, context={"request": request}).data)
+
+
+@async_api_view(["GET"])
+async def company_profile(request, pk):
+    reject_unsupported(request.query_params)
+    company = await aget_object_or_404(Company.objects.with_vacancy_stats(), pk=pk)
+    data = CompanyProfileSerializer(company, context={"request": request}).data
+
+    paginator = VacancyCursorPagination()
+    vacancies = Vacancy.objects.active().filter(company_id=company.pk)
+    serializer = VacancyValuesSerializer(context={"request": request}, include_company=False)
+    ordering = paginator.get_ordering(request, vacancies, None)
+    rows = serializer.values(vacancies, *[field.lstrip("-") for field in ordering])
+    page = await paginator.apaginate_queryset(rows, request)
+    data["vacancies"] = {
+        "next": paginator.get_next_link(),
+        "previous": paginator.get_previous_link(),
+        "results": await serializer.arepresent(page),
+    }
+    return json_response(data)
+
+
+@async_api_view(["POST"])
+async def favorite_toggle(request, vacancy_id):
+    user = await authenticate(request)
+    await check_throttle(request, "favorite")
+    if user.role != "seeker":
+        raise PermissionDenied("Only seekers can add vacancies to favorites")
+    # Same delete-then-insert toggle as FavoriteVacancyToggleView. Each
+    # statement autocommits, so a failed insert needs no savepoint.
+    removed, _ = await FavoriteVacancy.objects.filter(user_id=user.id, vacancy_id=vacancy_id).adelete()
+    if removed:
+        return json_response({"message": "Removed from favorites"})
+    try:
+        await FavoriteVacancy.objects.abulk_create(
+            [FavoriteVacancy(user_id=user.id, vacancy_id=vacancy_id)], ignore_conflicts=True
+        )
+    except IntegrityError:
+        raise NotFound("No Vacancy matches the given query.")
+    return json_response({"message": "Added to favorites"}, status=status.HTTP_201_CREATED)
@@ -0,0 +1,163 @@
+"""
+Streaming bulk import/export of vacancies as CSV or JSONL.
+
+Imports are read row by row and handled in chunks: each chunk is validated
+with ``VacancyImportSerializer``, its company ids are checked with a single
+query, and the valid rows are written with one ``bulk_create`` inside a
+transaction. ``bulk_create`` sends no signals, so the search index and
+response cache are updated here per chunk, and matches once at the end.
+"""
+import codecs
+import csv
+import json
+from itertools import islice
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+from . import matching, search
+from .cache import bump_versions
+from .models import Company, Vacancy
+from .serializers import VacancyImportSerializer
+
+FORMATS = ("csv", "jsonl")
+CHUNK_SIZE = 500
+MAX_REPORTED_ERRORS = 100
+
+EXPORT_FIELDS = ["id"] + VacancyImportSerializer.Meta.fields + ["views", "created_at", "updated_at"]
+
+
+class ImportFormatError(ValueError):
+    pass
+
+
+def guess_format(filename, default=None):
+    extension = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    if extension in ("jsonl", "ndjson"):
+        return "jsonl"
+    if extension == "csv":
+        return "csv"
+    return default
+
+
+def check_encoding(chunks, encoding="utf-8-sig"):
+    """
+    Decode an iterable of byte chunks without keeping the text, raising
+    ``UnicodeDecodeError`` on the first bad byte. Imports commit chunk by
+    chunk, so uploads are checked up front rather than failing halfway.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    for chunk in chunks:
+        decoder.decode(chunk)
+    decoder.decode(b"", final=True)
+
+
+def read_rows(lines, fmt):
+    """
+    Yield ``(line_number, row)`` pairs from an iterable of text lines. A
+    JSONL line that doesn't parse comes back as an ``ImportFormatError`` in
+    place of the row, so it is reported like any other invalid row.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(lines)
+        for row in reader:
+            # Empty cells mean "not given", so optional columns fall back to their defaults.
+            yield reader.line_num, {key: value for key, value in row.items() if key and value != ""}
+    elif fmt == "jsonl":
+        for number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                row = ImportFormatError("Invalid JSON.")
+            if not isinstance(row, (dict, ImportFormatError)):
+                row = ImportFormatError("Expected a JSON object.")
+            yield number, row
+    else:
+        raise ImportFormatError(f"Unknown format {fmt!r}, expected one of: {', '.join(FORMATS)}.")
+
+
+def import_vacancies(lines, fmt, author, chunk_size=CHUNK_SIZE, dry_run=False):
+    """
+    Import vacancies for ``author``. Invalid rows are skipped and reported
+    as ``{"row": line_number, "errors": {...}}``; the first
+    ``MAX_REPORTED_ERRORS`` are returned along with the totals.
+    """
+    rows = read_rows(lines, fmt)
+    created = 0
+    created_ids = []
+    errors = []
+    error_count = 0
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        vacancies, chunk_errors = _validate_chunk(chunk, author)
+        error_count += len(chunk_errors)
+        errors.extend(chunk_errors[:MAX_REPORTED_ERRORS - len(errors)])
+        created += len(vacancies)
+        if vacancies and not dry_run:
+            created_ids.extend(_write_chunk(vacancies))
+
+    if created_ids and settings.MATCHING["RECOMPUTE_ON_SAVE"]:
+        matching.refresh_vacancy_matches(created_ids)
+    return {"created": created, "error_count": error_count, "errors": errors}
+
+
+def _validate_chunk(chunk, author):
+    valid = []
+    errors = []
+    for line, row in chunk:
+        if isinstance(row, ImportFormatError):
+            errors.append({"row": line, "errors": {"non_field_errors": [str(row)]}})
+            continue
+        serializer = VacancyImportSerializer(data=row)
+        if serializer.is_valid():
+            valid.append((line, serializer.validated_data))
+        else:
+            errors.append({"row": line, "errors": serializer.errors})
+
+    company_ids = {data["company_id"] for _, data in valid}
+    known = set(Company.objects.filter(id__in=company_ids).values_list("id", flat=True))
+    vacancies = []
+    for line, data in valid:
+        if data["company_id"] in known:
+            vacancies.append(Vacancy(author_id=author.pk, **data))
+        else:
+            errors.append({"row": line, "errors": {"company_id": ["Company not found."]}})
+    errors.sort(key=lambda error: error["row"])
+    return vacancies, errors
+
+
+def _write_chunk(vacancies):
+    with transaction.atomic():
+        vacancies = Vacancy.objects.bulk_create(vacancies)
+        ids = [vacancy.pk for vacancy in vacancies]
+        search.index_vacancies(ids)
+    bump_versions(["vacancies"] + [f"company:{pk}" for pk in {v.company_id for v in vacancies}])
+    return ids
+
+
+class _Echo:
+    """File-like object whose ``write`` just hands the line back to the caller."""
+
+    def write(self, value):
+        return value
+
+
+def export_vacancies(queryset, fmt, chunk_size=2000):
+    """Yield the export line by line, reading rows through a server-side cursor."""
+    rows = queryset.order_by("id").values_list(*EXPORT_FIELDS).iterator(chunk_size=chunk_size)
+    if fmt == "csv":
+        writer = csv.writer(_Echo())
+        yield writer.writerow(EXPORT_FIELDS)
+        for row in rows:
+            yield writer.writerow(row)
+    elif fmt == "jsonl":
+        encoder = DjangoJSONEncoder(ensure_ascii=False)
+        for row in rows:
+            yield encoder.encode(dict(zip(EXPORT_FIELDS, row))) + "\n"
+    else:
+        raise ImportFormatError(f"Unknown format {fmt!r}, expected one of: {', '.join(FORMATS)}.")
@@ -0,0 +1,132 @@
+import hashlib
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+
+KEY_PREFIX = "resp"
+STATS_KEYS = {"hits": f"{KEY_PREFIX}:stats:hits", "misses": f"{KEY_PREFIX}:stats:misses"}
+
+
+def get_cache():
+    return caches[settings.RESPONSE_CACHE["CACHE"]]
+
+
+def _version_key(scope):
+    return f"{KEY_PREFIX}:version:{scope}"
+
+
+def get_versions(scopes):
+    cache = get_cache()
+    keys = [_version_key(scope) for scope in scopes]
+    found = cache.get_many(keys)
+    missing = {key: 1 for key in keys if key not in found}
+    if missing:
+        cache.set_many(missing, timeout=None)
+        found.update(missing)
+    return [found[key] for key in keys]
+
+
+def bump_versions(scopes):
+    """Invalidate every cached response rendered under any of ``scopes``."""
+    cache = get_cache()
+    for scope in scopes:
+        key = _version_key(scope)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 2, timeout=None)
+
+
+def _count(name):
+    cache = get_cache()
+    key = STATS_KEYS[name]
+    if not cache.add(key, 1, timeout=None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, timeout=None)
+
+
+def get_stats():
+    values = get_cache().get_many(STATS_KEYS.values())
+    return {name: values.get(key, 0) for name, key in STATS_KEYS.items()}
+
+
+def reset_stats():
+    get_cache().delete_many(STATS_KEYS.values())
+
+
+def normalized_params(request):
+    items = sorted(
+        (key, value)
+        for key, values in request.query_params.lists()
+        for value in values
+    )
+    return urlencode(items)
+
+
+class AnonymousResponseCacheMixin:
+    """
+    Serve anonymous JSON GETs from pre-rendered bytes. The key combines the
+    view, host, path, normalized query string and the current version of every
+    scope returned by ``get_cache_scopes``; bumping a scope's version (see
+    ``api.signals``) makes the old entries unreachable.
+
+    The response's ``ETag`` / ``Last-Modified`` are stored with the body, so a
+    hit answers conditional requests itself. List it before
+    ``ConditionalGetMixin`` so hits never compute validators.
+    """
+
+    cache_name = None
+
+    def get_cache_scopes(self):
+        raise NotImplementedError
+
+    def on_cache_hit(self, request, *args, **kwargs):
+        pass
+
+    def get_response_cache_key(self, request):
+        if request.user.is_authenticated or request.accepted_renderer.format != "json":
+            return None
+        scopes = self.get_cache_scopes()
+        versions = ".".join(str(version) for version in get_versions(scopes))
+        digest = hashlib.sha1(
+            f"{request.get_host()}{request.path}?{normalized_params(request)}".encode()
+        ).hexdigest()
+        return f"{KEY_PREFIX}:{self.cache_name}:{versions}:{digest}"
+
+    def get(self, request, *args, **kwargs):
+        self.response_cache_key = None
+        key = self.get_response_cache_key(request)
+        if key is not None:
+            entry = get_cache().get(key)
+            if entry is not None:
+                _count("hits")
+                self.on_cache_hit(request, *args, **kwargs)
+                content, etag, last_modified = entry
+                response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+                if response is None:
+                    response = HttpResponse(content, content_type="application/json")
+                    if etag is not None:
+                        response["ETag"] = etag
+                    if last_modified is not None:
+                        response["Last-Modified"] = http_date(last_modified)
+                response["X-Cache"] = "HIT"
+                return response
+            _count("misses")
+            self.response_cache_key = key
+        return super().get(request, *args, **kwargs)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        key = getattr(self, "response_cache_key", None)
+        if key is not None and response.status_code == 200 and not response.streaming:
+            response.render()
+            entry = (response.content, response.get("ETag"), parse_http_date_safe(response.get("Last-Modified")))
+            get_cache().set(key, entry, settings.RESPONSE_CACHE["TIMEOUT"])
+            response["X-Cache"] = "MISS"
+        return response
@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Error, register
+
+
+@register()
+def check_shared_caches(app_configs, **kwargs):
+    """
+    With several workers, caches whose state must agree across processes
+    can't be local memory: a write bumps the response cache versions only in
+    the worker that handled it, and each worker keeps its own throttle
+    buckets and pending view counts.
+    """
+    if settings.WEB_CONCURRENCY <= 1:
+        return []
+    uses = {
+        "RESPONSE_CACHE": settings.RESPONSE_CACHE["CACHE"],
+        "THROTTLING": settings.THROTTLING["CACHE"],
+    }
+    counter = settings.VACANCY_VIEW_COUNTER
+    if counter["BACKEND"] == "api.counters.CacheViewCounterBackend":
+        uses["VACANCY_VIEW_COUNTER"] = counter.get("OPTIONS", {}).get("cache", "default")
+    return [
+        Error(
+            f"{setting} uses the local-memory cache {alias!r} with WEB_CONCURRENCY={settings.WEB_CONCURRENCY}.",
+            hint="Point it at a cache shared by the workers, e.g. Redis (CACHE_BACKEND / THROTTLE_CACHE_BACKEND).",
+            id="api.E001",
+        )
+        for setting, alias in uses.items()
+        if isinstance(caches[alias], LocMemCache)
+    ]
@@ -0,0 +1,86 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from .cache import normalized_params
+
+
+class ConditionalGetMixin:
+    """
+    Answer ``If-None-Match`` / ``If-Modified-Since`` with 304 before the
+    object is loaded or serialized. Subclasses return ``(fingerprint,
+    last_modified)`` from ``get_validators``; ``(None, None)`` skips the check.
+    """
+
+    def get_validators(self, request):
+        raise NotImplementedError
+
+    def on_not_modified(self, request, *args, **kwargs):
+        pass
+
+    def get(self, request, *args, **kwargs):
+        fingerprint, last_modified = self.get_validators(request)
+        if fingerprint is None and last_modified is None:
+            return super().get(request, *args, **kwargs)
+
+        etag = None
+        if fingerprint is not None:
+            source = f"{request.get_host()}|{request.accepted_renderer.format}|{fingerprint}"
+            etag = quote_etag(hashlib.md5(source.encode()).hexdigest())
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+
+        not_modified = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if not_modified is not None:
+            self.on_not_modified(request, *args, **kwargs)
+            return not_modified
+
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == 200:
+            if etag is not None:
+                response["ETag"] = etag
+            if timestamp is not None:
+                response["Last-Modified"] = http_date(timestamp)
+        return response
+
+
+class ListConditionalGetMixin(ConditionalGetMixin):
+    """
+    ETag from the filtered list's row count and the latest of each timestamp
+    in ``conditional_fields``, which should include those of nested objects.
+    No ``Last-Modified``: deleting a row other than the newest doesn't move
+    any maximum, only the count.
+    """
+
+    conditional_fields = ("updated_at",)
+
+    def get_validators(self, request):
+        aggregates = {f"max_{index}": Max(field) for index, field in enumerate(self.conditional_fields)}
+        stats = self.filter_queryset(self.get_queryset()).aggregate(count=Count("id"), **aggregates)
+        stamps = "|".join(str(stats[name]) for name in aggregates)
+        return f"{stamps}|{stats['count']}|{normalized_params(request)}", None
+
+
+class DetailConditionalGetMixin(ConditionalGetMixin):
+    """
+    Validators from the requested row, looked up through ``get_queryset`` so
+    rows the view hides get none. ``conditional_fields`` lists the
+    timestamps the response depends on, including those of nested objects.
+    """
+
+    conditional_fields = ("updated_at",)
+
+    def get_validators(self, request):
+        lookup = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        row = (
+            self.get_queryset()
+            .filter(**{self.lookup_field: lookup})
+            .values_list(*self.conditional_fields)
+            .first()
+        )
+        if row is None:
+            return None, None
+        stamps = [stamp for stamp in row if stamp is not None]
+        fingerprint = "|".join([str(lookup)] + [stamp.isoformat() for stamp in stamps])
+        return fingerprint, max(stamps, default=None)
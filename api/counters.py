@@ -0,0 +1,227 @@
+import atexit
+import logging
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import models, transaction
+from django.db.models import Case, F, Value, When
+from django.utils.module_loading import import_string
+
+from .models import Vacancy
+
+logger = logging.getLogger(__name__)
+
+FLUSH_CHUNK_SIZE = 500
+
+
+class LocalViewCounterBackend:
+    """Pending deltas kept in this process only."""
+
+    def __init__(self):
+        self._pending = Counter()
+        self._lock = threading.Lock()
+
+    def add(self, pk, amount=1):
+        with self._lock:
+            self._pending[pk] += amount
+
+    def pending(self, pk):
+        with self._lock:
+            return self._pending.get(pk, 0)
+
+    def drain(self):
+        with self._lock:
+            deltas, self._pending = dict(self._pending), Counter()
+        return deltas
+
+    def restore(self, deltas):
+        with self._lock:
+            self._pending.update(deltas)
+
+
+class CacheViewCounterBackend:
+    """
+    Pending deltas kept in a Django cache, so several worker processes can
+    share them. Needs a shared cache with atomic ``add``/``incr`` (Redis or
+    Memcached); the local-memory cache is per process.
+
+    Each pk's delta lives in its own key. The first hit after a drain wins
+    ``cache.add`` on the pk's marker key and appends the pk to a numbered
+    log; ``drain`` walks the log from where the last drain stopped. Nothing
+    is read-modify-written, so concurrent hits and drains can't drop a pk.
+    """
+
+    key_prefix = "vacancy-views"
+    # A pk whose log entry was never written (its worker died in between) is
+    # logged again once the marker expires.
+    marker_timeout = 60 * 60
+    drain_timeout = 60
+
+    def __init__(self, cache="default"):
+        self.cache = caches[cache]
+        self.seq_key = f"{self.key_prefix}:seq"
+        self.drained_key = f"{self.key_prefix}:drained"
+        self.gap_key = f"{self.key_prefix}:gap"
+        self.lock_key = f"{self.key_prefix}:lock"
+
+    def _key(self, pk):
+        return f"{self.key_prefix}:{pk}"
+
+    def _marker_key(self, pk):
+        return f"{self.key_prefix}:dirty:{pk}"
+
+    def _log_key(self, n):
+        return f"{self.key_prefix}:log:{n}"
+
+    def _incr(self, key, amount):
+        if self.cache.add(key, amount, timeout=None):
+            return amount
+        try:
+            return self.cache.incr(key, amount)
+        except ValueError:
+            self.cache.set(key, amount, timeout=None)
+            return amount
+
+    def add(self, pk, amount=1):
+        # Count first: drain clears the marker before reading the count, so a
+        # hit either lands in that read or registers the pk again.
+        self._incr(self._key(pk), amount)
+        if self.cache.add(self._marker_key(pk), 1, timeout=self.marker_timeout):
+            self.cache.set(self._log_key(self._incr(self.seq_key, 1)), pk, timeout=None)
+
+    def pending(self, pk):
+        return self.cache.get(self._key(pk), 0)
+
+    def drain(self):
+        if not self.cache.add(self.lock_key, 1, timeout=self.drain_timeout):
+            return {}  # another process is draining
+        try:
+            done = self.cache.get(self.drained_key, 0)
+            end = self.cache.get(self.seq_key, 0)
+            deltas = {}
+            while done < end:
+                n = done + 1
+                pk = self.cache.get(self._log_key(n))
+                if pk is None:
+                    # Numbered but not written yet: give the writer until the
+                    # next drain, then skip the entry.
+                    if self.cache.get(self.gap_key) != n:
+                        self.cache.set(self.gap_key, n, timeout=None)
+                        break
+                    done = n
+                    continue
+                done = n
+                self.cache.delete(self._log_key(n))
+                self.cache.delete(self._marker_key(pk))
+                amount = self.cache.get(self._key(pk), 0)
+                if not amount:
+                    continue
+                # Subtract what we read rather than deleting, so hits that
+                # land in between survive to the next flush.
+                try:
+                    self.cache.decr(self._key(pk), amount)
+                except ValueError:
+                    continue
+                deltas[pk] = deltas.get(pk, 0) + amount
+            self.cache.set(self.drained_key, done, timeout=None)
+            return deltas
+        finally:
+            self.cache.delete(self.lock_key)
+
+    def restore(self, deltas):
+        for pk, amount in deltas.items():
+            self.add(pk, amount)
+
+
+class ViewCounter:
+    """
+    Write-behind accumulator for ``Vacancy.views``: hits are buffered in the
+    backend and written in bulk once ``flush_threshold`` hits have been seen
+    or ``flush_interval`` seconds have passed since the last flush.
+    """
+
+    def __init__(self, backend, flush_interval=30, flush_threshold=100):
+        self.backend = backend
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self._hits = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def hit(self, pk):
+        """
+        Record one view. Returns True if this call triggered a flush.
+
+        A failed flush is logged rather than raised: the deltas are back in
+        the backend for the next flush, and the page view itself succeeded.
+        """
+        self.backend.add(pk)
+        with self._lock:
+            self._hits += 1
+            due = (
+                self._hits >= self.flush_threshold
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+        if due:
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Could not flush pending vacancy views")
+        return due
+
+    def pending(self, pk):
+        return self.backend.pending(pk)
+
+    def flush(self):
+        with self._lock:
+            self._hits = 0
+            self._last_flush = time.monotonic()
+        deltas = self.backend.drain()
+        if not deltas:
+            return 0
+        try:
+            with transaction.atomic():
+                items = list(deltas.items())
+                for start in range(0, len(items), FLUSH_CHUNK_SIZE):
+                    chunk = items[start:start + FLUSH_CHUNK_SIZE]
+                    increment = Case(
+                        *[When(pk=pk, then=Value(amount)) for pk, amount in chunk],
+                        output_field=models.PositiveIntegerField(),
+                    )
+                    Vacancy.objects.filter(pk__in=[pk for pk, _ in chunk]).update(
+                        views=F("views") + increment
+                    )
+        except Exception:
+            self.backend.restore(deltas)
+            raise
+        return len(deltas)
+
+
+_view_counter = None
+_view_counter_lock = threading.Lock()
+
+
+def get_view_counter():
+    global _view_counter
+    if _view_counter is None:
+        with _view_counter_lock:
+            if _view_counter is None:
+                config = settings.VACANCY_VIEW_COUNTER
+                backend = import_string(config["BACKEND"])(**config.get("OPTIONS", {}))
+                _view_counter = ViewCounter(
+                    backend,
+                    flush_interval=config.get("FLUSH_INTERVAL", 30),
+                    flush_threshold=config.get("FLUSH_THRESHOLD", 100),
+                )
+                atexit.register(_flush_at_exit, _view_counter)
+    return _view_counter
+
+
+def _flush_at_exit(counter):
+    try:
+        counter.flush()
+    except Exception:
+        logger.exception("Could not flush pending vacancy views at exit")
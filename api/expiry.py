@@ -0,0 +1,41 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .cache import bump_versions
+from .models import Vacancy, VacancyMatch
+
+
+def expiry_cutoff(days=None):
+    days = settings.VACANCY_EXPIRY_DAYS if days is None else days
+    return timezone.now() - timedelta(days=days)
+
+
+def expire_vacancies(cutoff, batch_size=1000):
+    """
+    Deactivate active vacancies created before ``cutoff``, oldest first, one
+    short transaction per ``batch_size`` rows. ``update()`` skips signals, so
+    the batch's cached responses and stored matches are dropped here.
+    """
+    expired = 0
+    while True:
+        with transaction.atomic():
+            rows = list(
+                Vacancy.objects.active()
+                .filter(created_at__lt=cutoff)
+                .order_by("created_at", "id")
+                .values_list("id", "company_id")[:batch_size]
+            )
+            if not rows:
+                return expired
+            ids = [pk for pk, _ in rows]
+            Vacancy.objects.filter(id__in=ids).update(is_active=False, updated_at=timezone.now())
+            VacancyMatch.objects.filter(vacancy_id__in=ids).delete()
+        bump_versions(
+            ["vacancies"]
+            + [f"vacancy:{pk}" for pk in ids]
+            + [f"company:{company_id}" for company_id in {company_id for _, company_id in rows}]
+        )
+        expired += len(rows)
@@ -0,0 +1,69 @@
+import hashlib
+from collections import Counter
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.db.models import Count
+
+from .cache import KEY_PREFIX, get_cache, get_versions
+from .models import Vacancy
+
+# Grouped in the order of the (location, employment_type, work_format) index.
+FACET_FIELDS = ("location", "employment_type", "work_format", "experience_required")
+CHOICE_FACETS = {
+    "employment_type": Vacancy.EMPLOYMENT_TYPE_CHOICES,
+    "work_format": Vacancy.WORK_FORMAT_CHOICES,
+    "experience_required": Vacancy.EXPERIENCE_CHOICES,
+}
+# Parameters that page or switch modes rather than filter.
+IGNORED_PARAMS = {"cursor", "page_size", "facets", "format"}
+
+
+def compute_facets(queryset):
+    """
+    Count the vacancies of ``queryset`` per facet value with a single
+    ``GROUP BY`` over every facet column, then roll the groups up per facet.
+    """
+    groups = queryset.order_by().values(*FACET_FIELDS).annotate(n=Count("id"))
+    totals = {field: Counter() for field in FACET_FIELDS}
+    count = 0
+    for group in groups:
+        count += group["n"]
+        for field in FACET_FIELDS:
+            totals[field][group[field]] += group["n"]
+
+    facets = {
+        field: [
+            {"value": value, "label": label, "count": totals[field][value]}
+            for value, label in choices
+        ]
+        for field, choices in CHOICE_FACETS.items()
+    }
+    facets["location"] = [
+        {"value": value, "label": value, "count": n}
+        for value, n in sorted(totals["location"].items(), key=lambda item: (-item[1], item[0]))
+    ]
+    return {"count": count, "facets": facets}
+
+
+def facets_cache_key(request):
+    params = sorted(
+        (key, value)
+        for key, values in request.query_params.lists()
+        if key not in IGNORED_PARAMS
+        for value in values
+    )
+    version = get_versions(["vacancies"])[0]
+    digest = hashlib.sha1(urlencode(params).encode()).hexdigest()
+    return f"{KEY_PREFIX}:vacancy-facets:{version}:{digest}"
+
+
+def cached_facets(request, queryset):
+    """``compute_facets`` for the request's filter set, cached until the next vacancy change."""
+    cache = get_cache()
+    key = facets_cache_key(request)
+    data = cache.get(key)
+    if data is None:
+        data = compute_facets(queryset)
+        cache.set(key, data, settings.RESPONSE_CACHE["TIMEOUT"])
+    return data
@@ -0,0 +1,154 @@
+from datetime import datetime, time, timedelta
+from decimal import Decimal, InvalidOperation
+
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from .models import Vacancy
+
+DATE_FORMAT = "%Y-%m-%d"
+
+
+def parse_date_param(params, name):
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, DATE_FORMAT).date()
+    except ValueError:
+        raise ValidationError({name: "Invalid date, expected YYYY-MM-DD."})
+
+
+def day_start(day):
+    return timezone.make_aware(datetime.combine(day, time.min), timezone.get_current_timezone())
+
+
+def filter_created_between(queryset, params):
+    """
+    Apply ``d`` (single day), ``date_from`` and ``date_to`` (inclusive days)
+    as half-open ``created_at`` ranges so the column stays index-usable.
+    """
+    day = parse_date_param(params, "d")
+    date_from = parse_date_param(params, "date_from")
+    date_to = parse_date_param(params, "date_to")
+
+    if day:
+        queryset = queryset.filter(
+            created_at__gte=day_start(day), created_at__lt=day_start(day + timedelta(days=1))
+        )
+    if date_from:
+        queryset = queryset.filter(created_at__gte=day_start(date_from))
+    if date_to:
+        queryset = queryset.filter(created_at__lt=day_start(date_to + timedelta(days=1)))
+    return queryset
+
+
+VACANCY_CHOICE_FILTERS = {
+    "employment_type": Vacancy.EMPLOYMENT_TYPE_CHOICES,
+    "work_format": Vacancy.WORK_FORMAT_CHOICES,
+    "experience_required": Vacancy.EXPERIENCE_CHOICES,
+}
+
+# Every ordering ends in ``id`` so keyset pagination has a unique position.
+VACANCY_SORTS = {
+    "date": ("created_at", "id"),
+    "-date": ("-created_at", "-id"),
+    "salary": ("salary_from", "id"),
+    "-salary": ("-salary_from", "-id"),
+    "views": ("views", "id"),
+    "-views": ("-views", "-id"),
+}
+
+def parse_choice_param(params, name, choices):
+    """Comma-separated choice values; ``None`` when the parameter is absent."""
+    value = params.get(name)
+    if not value:
+        return None
+    values = [item.strip() for item in value.split(",") if item.strip()]
+    allowed = {key for key, _ in choices}
+    invalid = [item for item in values if item not in allowed]
+    if invalid:
+        raise ValidationError({name: f"Unknown value(s): {', '.join(invalid)}."})
+    return values
+
+
+def parse_decimal_param(params, name):
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        number = Decimal(value)
+    except InvalidOperation:
+        raise ValidationError({name: "Invalid number."})
+    if not number.is_finite():
+        raise ValidationError({name: "Invalid number."})
+    return number
+
+
+def parse_id_list(params, name, limit):
+    """Required comma-separated list of positive ids, at most ``limit`` of them, duplicates dropped."""
+    value = params.get(name)
+    if not value:
+        raise ValidationError({name: "This parameter is required."})
+    try:
+        ids = list(dict.fromkeys(int(item) for item in value.split(",") if item.strip()))
+    except ValueError:
+        raise ValidationError({name: "Expected a comma-separated list of ids."})
+    if any(pk < 1 for pk in ids):
+        raise ValidationError({name: "Expected a comma-separated list of ids."})
+    if len(ids) > limit:
+        raise ValidationError({name: f"At most {limit} ids per request."})
+    return ids
+
+
+def parse_vacancy_sort(params):
+    sort = params.get("sort")
+    if not sort:
+        return None
+    if sort not in VACANCY_SORTS:
+        raise ValidationError({"sort": f"Expected one of: {', '.join(VACANCY_SORTS)}."})
+    return VACANCY_SORTS[sort]
+
+
+def vacancy_ordering(params, default):
+    """Ordering of the vacancy feed: ``?sort=`` first, then relevance for ``?t=`` searches."""
+    sort = parse_vacancy_sort(params)
+    if sort:
+        return sort
+    if params.get("t"):
+        return ("search_rank", "-id")
+    return default
+
+
+def filter_vacancies(queryset, params):
+    """
+    Column filters for the vacancy feed. Each one is a plain equality or
+    range on an indexed column. ``salary_min`` / ``salary_max`` bound
+    ``salary_from`` and only see vacancies that publish their salary.
+    """
+    location = params.get("location")
+    if location:
+        queryset = queryset.filter(location=location)
+    currency = params.get("currency")
+    if currency:
+        queryset = queryset.filter(currency=currency)
+
+    for name, choices in VACANCY_CHOICE_FILTERS.items():
+        values = parse_choice_param(params, name, choices)
+        if values:
+            queryset = queryset.filter(**{name: values[0]} if len(values) == 1 else {f"{name}__in": values})
+
+    salary_min = parse_decimal_param(params, "salary_min")
+    salary_max = parse_decimal_param(params, "salary_max")
+    if salary_min is not None:
+        queryset = queryset.filter(salary_from__gte=salary_min)
+    if salary_max is not None:
+        queryset = queryset.filter(salary_from__lte=salary_max)
+    if salary_min is not None or salary_max is not None:
+        queryset = queryset.filter(show_salary=True)
+
+    sort = parse_vacancy_sort(params)
+    if sort and sort[0].lstrip("-") == "salary_from":
+        # NULL salaries have no place in a salary ordering (nor in a keyset cursor).
+        queryset = queryset.filter(salary_from__isnull=False, show_salary=True)
+    return queryset
@@ -0,0 +1,85 @@
+import io
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from accounts.models import CustomUser
+from api.models import Company, Vacancy
+from api.renderers import FastJSONParser, FastJSONRenderer, orjson_enabled
+from api.serializers import VacancySerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Micro-benchmark DRF's JSONRenderer/JSONParser against the orjson-backed "
+        "FastJSONRenderer/FastJSONParser on VacancySerializer output built in memory."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        if not orjson_enabled():
+            self.stdout.write(self.style.WARNING("orjson is not available; both sides use the stdlib."))
+        data = VacancySerializer(self.vacancies(options["rows"]), many=True).data
+
+        stdlib = JSONRenderer().render(data)
+        fast = FastJSONRenderer().render(data)
+        if stdlib != fast:
+            raise CommandError("Renderers disagree on the output.")
+        if JSONParser().parse(io.BytesIO(stdlib)) != FastJSONParser().parse(io.BytesIO(stdlib)):
+            raise CommandError("Parsers disagree on the result.")
+
+        repeat = options["repeat"]
+        self.stdout.write(f"{options['rows']} vacancies, {len(stdlib) / 1024:.0f} KiB of JSON, best of {repeat}")
+        self.report("render", self.time(lambda: JSONRenderer().render(data), repeat),
+                    self.time(lambda: FastJSONRenderer().render(data), repeat))
+        self.report("parse", self.time(lambda: JSONParser().parse(io.BytesIO(stdlib)), repeat),
+                    self.time(lambda: FastJSONParser().parse(io.BytesIO(stdlib)), repeat))
+
+    def report(self, name, stdlib_ms, fast_ms):
+        self.stdout.write(f"{name:<8} stdlib {stdlib_ms:8.2f} ms   fast {fast_ms:8.2f} ms   {stdlib_ms / fast_ms:5.1f}x")
+
+    def time(self, run, repeat):
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - started)
+        return best * 1000
+
+    def vacancies(self, rows):
+        now = timezone.now()
+        author = CustomUser(id=1, username="employer")
+        companies = [
+            Company(id=i, name=f"Компания {i}", description="Описание компании " * 3,
+                    website="https://example.com", created_at=now, updated_at=now)
+            for i in range(1, 21)
+        ]
+        return [
+            Vacancy(
+                id=i,
+                title=f"Python developer №{i}",
+                company=companies[i % len(companies)],
+                location="Душанбе",
+                description="Разработка и поддержка сервисов. " * 20,
+                responsibilities="Code review, CI/CD, мониторинг.",
+                requirements="Python, Django, PostgreSQL",
+                salary_from=Decimal("1000.00") + i,
+                salary_to=Decimal("2500.50") if i % 2 else None,
+                show_salary=bool(i % 5),
+                employment_type="full_time",
+                work_format="hybrid",
+                views=i * 7,
+                created_at=now - timedelta(minutes=i, microseconds=i),
+                updated_at=now,
+                author=author,
+            )
+            for i in range(1, rows + 1)
+        ]
@@ -0,0 +1,69 @@
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from api.matching import SIGNATURE_WORDS, ResumeFeatures, VacancyFeatures, best_columns, score_matrix
+
+
+class Command(BaseCommand):
+    help = "Benchmark batch match scoring on synthetic feature arrays (no database access)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--vacancies", type=int, default=10_000)
+        parser.add_argument("--resumes", type=int, default=100_000)
+        parser.add_argument("--chunk-size", type=int, default=64)
+        parser.add_argument("--top-k", type=int, default=50)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = np.random.default_rng(options["seed"])
+        vacancies = self.vacancies(options["vacancies"], rng)
+        resumes = self.resumes(options["resumes"], rng)
+
+        chunk_size = options["chunk_size"]
+        started = time.perf_counter()
+        for start in range(0, options["vacancies"], chunk_size):
+            chunk = VacancyFeatures(*(field[start:start + chunk_size] for field in vacancies))
+            best_columns(score_matrix(chunk, resumes), options["top_k"])
+        elapsed = time.perf_counter() - started
+
+        pairs = options["vacancies"] * options["resumes"]
+        self.stdout.write(
+            f"scored {options['vacancies']} x {options['resumes']} = {pairs:,} pairs "
+            f"in {elapsed:.1f}s ({pairs / elapsed / 1e6:.1f}M pairs/s, chunk {chunk_size}, top {options['top_k']})"
+        )
+
+    def signatures(self, count, rng):
+        # ~6 hashed tokens per side, like a short title plus a few skills.
+        words = np.zeros((count, SIGNATURE_WORDS), dtype=np.uint64)
+        bits = rng.integers(0, SIGNATURE_WORDS * 64, size=(count, 6))
+        for column in range(bits.shape[1]):
+            word, bit = np.divmod(bits[:, column], 64)
+            words[np.arange(count), word] |= np.left_shift(np.uint64(1), bit.astype(np.uint64))
+        return words
+
+    def vacancies(self, count, rng):
+        exp_min = rng.choice(np.array([0, 1, 3, 6], dtype=np.float32), size=count)
+        salary = rng.uniform(1000, 20000, size=count).astype(np.float32)
+        salary[rng.random(count) < 0.3] = np.nan
+        return VacancyFeatures(
+            ids=np.arange(count, dtype=np.int64),
+            location=rng.integers(1, 50, size=count),
+            remote=rng.random(count) < 0.2,
+            exp_min=exp_min,
+            exp_max=np.where(exp_min == 6, np.inf, exp_min + 3).astype(np.float32),
+            salary=salary,
+            signature=self.signatures(count, rng),
+        )
+
+    def resumes(self, count, rng):
+        salary = rng.uniform(1000, 20000, size=count).astype(np.float32)
+        salary[rng.random(count) < 0.3] = np.nan
+        return ResumeFeatures(
+            ids=np.arange(count, dtype=np.int64),
+            location=rng.integers(0, 50, size=count),
+            years=rng.integers(0, 15, size=count).astype(np.float32),
+            salary=salary,
+            signature=self.signatures(count, rng),
+        )
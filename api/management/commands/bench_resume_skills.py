@@ -0,0 +1,87 @@
+import random
+import time
+from functools import reduce
+from operator import and_, or_
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+
+from accounts.models import CustomUser
+from api.models import Resume, ResumeSkill, Skill
+from api.skills import filter_by_skills, parse_skills
+
+SKILLS = [f"skill {i}" for i in range(2000)] + [
+    "python", "django", "sql", "postgresql", "react", "excel", "1c", "english", "docker", "linux",
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark indexed skill filtering against a substring scan of "
+        "Resume.skills on synthetic data. Runs inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--page-size", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        with transaction.atomic():
+            self.seed(options["rows"], rng)
+            self.stdout.write(f"{'query':<28}{'icontains ms':>14}{'indexed ms':>12}{'hits(icontains/indexed)':>26}")
+            for query, match_all in (
+                ("python", True),
+                ("python, django", True),
+                ("python, django, docker", True),
+                ("excel, 1c", False),
+                ("skill 17, skill 1999", False),
+            ):
+                names = parse_skills(query)
+                conditions = [Q(skills__icontains=name) for name in names]
+                legacy = Resume.objects.filter(reduce(and_ if match_all else or_, conditions))
+                indexed = filter_by_skills(Resume.objects.all(), names, match_all=match_all)
+                legacy_ms = self.time_page(legacy.order_by("-id"), options)
+                indexed_ms = self.time_page(indexed.order_by("-id"), options)
+                label = f"{query} ({'all' if match_all else 'any'})"
+                hits = f"{legacy.count()}/{indexed.count()}"
+                self.stdout.write(f"{label:<28}{legacy_ms:>14.2f}{indexed_ms:>12.2f}{hits:>26}")
+            transaction.set_rollback(True)
+
+    def time_page(self, queryset, options):
+        best = float("inf")
+        for _ in range(options["repeat"]):
+            started = time.perf_counter()
+            list(queryset.values_list("id", flat=True)[:options["page_size"]])
+            best = min(best, time.perf_counter() - started)
+        return best * 1000
+
+    def seed(self, rows, rng):
+        users = CustomUser.objects.bulk_create(
+            [CustomUser(username=f"bench-skills-{i}", password="!") for i in range(rows)],
+            batch_size=5000,
+        )
+        skills = Skill.objects.bulk_create([Skill(name=name) for name in SKILLS])
+        resumes = []
+        links = []
+        for user in users:
+            chosen = rng.sample(skills, rng.randint(2, 8))
+            resumes.append(Resume(
+                user=user,
+                full_name=user.username,
+                desired_position="developer",
+                skills=", ".join(skill.name for skill in chosen),
+            ))
+            links.append(chosen)
+        resumes = Resume.objects.bulk_create(resumes, batch_size=5000)
+        ResumeSkill.objects.bulk_create(
+            [
+                ResumeSkill(resume=resume, skill=skill)
+                for resume, chosen in zip(resumes, links)
+                for skill in chosen
+            ],
+            batch_size=5000,
+        )
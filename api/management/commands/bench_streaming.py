@@ -0,0 +1,77 @@
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from accounts.models import CustomUser
+from api.models import Company, Vacancy
+from api.serializers import VacancySerializer
+from api.streaming import iter_json_array, per_row
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare peak Python memory (tracemalloc) of rendering a whole vacancy "
+        "list at once against streaming it, for growing row counts. Runs "
+        "inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", default="1000,10000,100000,500000")
+        parser.add_argument(
+            "--buffered-max", type=int, default=100_000,
+            help="Skip the buffered run above this many rows (it needs a lot of memory).",
+        )
+
+    def handle(self, *args, **options):
+        sizes = sorted(int(size) for size in options["sizes"].split(","))
+        with transaction.atomic():
+            author = CustomUser.objects.create_user("bench-stream-author", role="employer")
+            company = Company.objects.create(name="bench-stream-company")
+            seeded = 0
+            self.stdout.write(f"{'rows':>8}{'buffered MB':>14}{'streamed MB':>14}{'stream s':>10}{'output MB':>11}")
+            for size in sizes:
+                self.seed(author, company, size - seeded)
+                seeded = size
+                queryset = Vacancy.objects.for_listing().order_by("-created_at", "-id")
+
+                buffered = "-"
+                if size <= options["buffered_max"]:
+                    peak, _, _ = self.measure(lambda: [JSONRenderer().render(VacancySerializer(queryset, many=True).data)])
+                    buffered = f"{peak:.1f}"
+
+                peak, seconds, output = self.measure(lambda: iter_json_array(queryset, per_row(VacancySerializer())))
+                self.stdout.write(f"{size:>8}{buffered:>14}{peak:>14.1f}{seconds:>10.2f}{output:>11.1f}")
+            transaction.set_rollback(True)
+
+    def measure(self, produce):
+        """Consume the chunks from ``produce()``; returns (peak MB, seconds, output MB)."""
+        tracemalloc.start()
+        started = time.perf_counter()
+        total = 0
+        for chunk in produce():
+            total += len(chunk)
+        seconds = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak / 2**20, seconds, total / 2**20
+
+    def seed(self, author, company, count):
+        batch = []
+        for i in range(count):
+            batch.append(Vacancy(
+                title=f"Bench vacancy {i}",
+                company=company,
+                location="Dushanbe",
+                description="Streaming benchmark vacancy. " * 10,
+                employment_type="full_time",
+                work_format="remote",
+                salary_from=1000 + i % 5000,
+                author=author,
+            ))
+            if len(batch) == 5000:
+                Vacancy.objects.bulk_create(batch)
+                batch = []
+        Vacancy.objects.bulk_create(batch)
@@ -0,0 +1,79 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from accounts.models import CustomUser
+from api.models import Company, Vacancy
+from api.search import rebuild_index, search_vacancies
+
+WORDS = (
+    "python django backend frontend react engineer developer senior junior manager "
+    "accountant sales marketing designer analyst data devops support teacher driver "
+    "логист бухгалтер продавец водитель оператор менеджер инженер склад"
+).split()
+# Filler vocabulary so that the named words above stay reasonably selective.
+FILLER = [f"term{i}" for i in range(20_000)]
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark full-text vacancy search against the legacy title__icontains "
+        "filter on synthetic data. Runs inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--page-size", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        with transaction.atomic():
+            self.seed(options["rows"], rng)
+            started = time.perf_counter()
+            rebuild_index()
+            self.stdout.write(f"indexed {options['rows']} vacancies in {time.perf_counter() - started:.2f}s")
+
+            self.stdout.write(f"{'query':<20}{'icontains ms':>14}{'fts ms':>10}{'hits(icontains/fts)':>22}")
+            for query in ("python", "senior developer", "менеджер", "data analyst", "nomatch"):
+                legacy = Vacancy.objects.filter(title__icontains=query).order_by("-created_at", "-id")
+                ranked = search_vacancies(Vacancy.objects.all(), query).order_by("search_rank", "-id")
+                legacy_ms = self.time_page(legacy, options)
+                ranked_ms = self.time_page(ranked, options)
+                hits = f"{legacy.count()}/{ranked.count()}"
+                self.stdout.write(f"{query:<20}{legacy_ms:>14.2f}{ranked_ms:>10.2f}{hits:>22}")
+            transaction.set_rollback(True)
+
+    def time_page(self, queryset, options):
+        best = float("inf")
+        for _ in range(options["repeat"]):
+            started = time.perf_counter()
+            list(queryset.values_list("id", flat=True)[:options["page_size"]])
+            best = min(best, time.perf_counter() - started)
+        return best * 1000
+
+    def seed(self, rows, rng):
+        author = CustomUser.objects.create_user("bench-search-author", role="employer")
+        companies = Company.objects.bulk_create(
+            [Company(name=f"bench-search-company-{i}") for i in range(200)]
+        )
+        batch = []
+        for i in range(rows):
+            batch.append(Vacancy(
+                title=" ".join(rng.choices(WORDS, k=2) + rng.choices(FILLER, k=2)),
+                company=rng.choice(companies),
+                location="Dushanbe",
+                description=" ".join(rng.choices(FILLER, k=40)),
+                requirements=" ".join(rng.choices(FILLER, k=15)),
+                responsibilities=" ".join(rng.choices(FILLER, k=15)),
+                employment_type="full_time",
+                work_format="on_site",
+                author=author,
+            ))
+            if len(batch) == 5000:
+                Vacancy.objects.bulk_create(batch)
+                batch = []
+        Vacancy.objects.bulk_create(batch)
@@ -0,0 +1,75 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from accounts.models import CustomUser
+from api.models import Company, Vacancy
+from api.serializers import VacancySerializer, VacancyValuesSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare VacancySerializer with the values()-based VacancyValuesSerializer "
+        "(query + serialize + render) and check both produce the same bytes. "
+        "Runs inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", default="1000,10000")
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def handle(self, *args, **options):
+        sizes = sorted(int(size) for size in options["sizes"].split(","))
+        with transaction.atomic():
+            self.seed(sizes[-1])
+            self.stdout.write(f"{'rows':>8}{'model ms':>12}{'values ms':>12}{'speedup':>10}")
+            for size in sizes:
+                queryset = Vacancy.objects.for_listing().order_by("-created_at", "-id")[:size]
+                model_ms, model_bytes = self.time(lambda: self.model_path(queryset), options["repeat"])
+                values_ms, values_bytes = self.time(lambda: self.values_path(queryset), options["repeat"])
+                if model_bytes != values_bytes:
+                    raise CommandError(f"Outputs differ at {size} rows.")
+                self.stdout.write(f"{size:>8}{model_ms:>12.1f}{values_ms:>12.1f}{model_ms / values_ms:>9.1f}x")
+            transaction.set_rollback(True)
+
+    def model_path(self, queryset):
+        return JSONRenderer().render(VacancySerializer(queryset, many=True).data)
+
+    def values_path(self, queryset):
+        serializer = VacancyValuesSerializer()
+        return JSONRenderer().render(serializer.represent(list(serializer.values(queryset))))
+
+    def time(self, run, repeat):
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            content = run()
+            best = min(best, time.perf_counter() - started)
+        return best * 1000, content
+
+    def seed(self, rows):
+        author = CustomUser.objects.create_user("bench-serializer-author", role="employer")
+        companies = Company.objects.bulk_create(
+            [Company(name=f"bench-serializer-company-{i}", logo=f"company_logos/{i}.png" if i % 2 else "")
+             for i in range(50)]
+        )
+        batch = []
+        for i in range(rows):
+            batch.append(Vacancy(
+                title=f"Bench vacancy {i}",
+                company=companies[i % len(companies)],
+                location="Dushanbe",
+                description="Serializer benchmark vacancy. " * 5,
+                employment_type="full_time",
+                work_format="remote",
+                salary_from=1000 + i % 5000 if i % 3 else None,
+                salary_to=9000 if i % 4 else None,
+                show_salary=bool(i % 5),
+                author=author,
+            ))
+            if len(batch) == 5000:
+                Vacancy.objects.bulk_create(batch)
+                batch = []
+        Vacancy.objects.bulk_create(batch)
@@ -0,0 +1,33 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from api.matching import rebuild_matches, refresh_changed_matches
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the stored top-K resume matches for every active vacancy, or "
+        "with --changed-since only for vacancies and resumes saved in that many "
+        "minutes (run that from cron a little more often than its window)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=256)
+        parser.add_argument("--changed-since", type=int, metavar="MINUTES")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        if options["changed_since"] is not None:
+            since = timezone.now() - timedelta(minutes=options["changed_since"])
+            vacancies, resumes = refresh_changed_matches(since, chunk_size=options["chunk_size"])
+            elapsed = time.perf_counter() - started
+            self.stdout.write(self.style.SUCCESS(
+                f"Refreshed matches for {vacancies} vacancies and {resumes} resumes in {elapsed:.1f}s."
+            ))
+            return
+        count = rebuild_matches(chunk_size=options["chunk_size"])
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"Recomputed matches for {count} vacancies in {elapsed:.1f}s."))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from api.expiry import expire_vacancies, expiry_cutoff
+from api.models import Vacancy
+
+
+class Command(BaseCommand):
+    help = "Deactivate vacancies older than VACANCY_EXPIRY_DAYS in batched updates."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, help="Override VACANCY_EXPIRY_DAYS.")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        cutoff = expiry_cutoff(options["days"])
+        if options["dry_run"]:
+            count = Vacancy.objects.active().filter(created_at__lt=cutoff).count()
+            self.stdout.write(f"{count} vacancies created before {cutoff:%Y-%m-%d %H:%M} would expire.")
+            return
+        expired = expire_vacancies(cutoff, batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Deactivated {expired} vacancies."))
@@ -0,0 +1,128 @@
+import random
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.http import QueryDict
+
+from accounts.models import CustomUser
+from api.filters import VACANCY_SORTS, filter_vacancies
+from api.models import Company, Vacancy
+from api.pagination import VacancyCursorPagination
+
+FILTERS = {
+    "none": "",
+    "location": "location=Dushanbe",
+    "employment_type": "employment_type=full_time",
+    "work_format": "work_format=remote",
+    "experience_required": "experience_required=1_3",
+    "currency": "currency=USD",
+    "salary": "salary_min=1000&salary_max=5000",
+}
+
+# Plan lines that mean "read the whole table".
+FULL_SCAN = {
+    "sqlite": re.compile(r"\bSCAN api_vacancy\b(?! USING)"),
+    "postgresql": re.compile(r"Seq Scan on api_vacancy\b"),
+}
+
+# Plan lines that mean "sort every matching row to serve one page".
+FULL_SORT = {
+    "sqlite": re.compile(r"\bUSE TEMP B-TREE FOR ORDER BY\b"),
+    "postgresql": re.compile(r"^\s*(?:->\s*)?Sort\b", re.MULTILINE),
+}
+
+# (filter, sort) pairs allowed to sort the rows their filter selects. Each
+# column filter has an index in date order (currency also by salary);
+# covering the salary and views orders too would put another dozen indexes
+# on every vacancy write. A salary range is read through the salary index,
+# so any other order has to sort it.
+COLUMN_FILTERS = ("location", "employment_type", "work_format", "experience_required", "currency")
+SORTED_COMBINATIONS = {
+    *((name, sort) for name in COLUMN_FILTERS for sort in ("salary", "-salary", "views", "-views")),
+    *(("salary", sort) for sort in ("default", "date", "-date", "views", "-views")),
+} - {("currency", "salary"), ("currency", "-salary")}
+
+
+def first_page_queries():
+    """Yield ``(filter, sort, queryset)`` for the first page of every filter/sort combination."""
+    for filter_name, query in FILTERS.items():
+        for sort in [None, *VACANCY_SORTS]:
+            params = QueryDict(query + (f"&sort={sort}" if sort else ""))
+            ordering = VACANCY_SORTS[sort] if sort else VacancyCursorPagination.ordering
+            queryset = filter_vacancies(Vacancy.objects.active(), params).order_by(*ordering)
+            yield filter_name, sort or "default", queryset[:VacancyCursorPagination.page_size + 1]
+
+
+def check_plan(filter_name, sort, plan):
+    """``"SCAN"`` or ``"SORT"`` if ``plan`` reads the whole table or sorts where it shouldn't, else None."""
+    if FULL_SCAN[connection.vendor].search(plan):
+        return "SCAN"
+    if (filter_name, sort) not in SORTED_COMBINATIONS and FULL_SORT[connection.vendor].search(plan):
+        return "SORT"
+    return None
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN the first page of every supported vacancy filter/sort "
+        "combination and fail if any of them scans the whole table, or sorts "
+        "every matching row outside SORTED_COMBINATIONS. Synthetic "
+        "rows (--rows) are inserted in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=5000)
+        parser.add_argument("--verbose-plans", action="store_true")
+
+    def handle(self, *args, **options):
+        if connection.vendor not in FULL_SCAN:
+            raise CommandError(f"Don't know how to read {connection.vendor} plans.")
+
+        failures = []
+        with transaction.atomic():
+            if options["rows"]:
+                self.seed(options["rows"])
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute("ANALYZE api_vacancy")
+
+            for filter_name, sort, queryset in first_page_queries():
+                plan = queryset.explain()
+                problem = check_plan(filter_name, sort, plan)
+                label = f"{filter_name} / {sort}"
+                self.stdout.write(f"{problem or 'ok':<6}{label}")
+                if options["verbose_plans"] or problem:
+                    self.stdout.write("      " + plan.replace("\n", "\n      "))
+                if problem:
+                    failures.append(f"{label} ({problem})")
+            transaction.set_rollback(True)
+
+        if failures:
+            raise CommandError(
+                f"{len(failures)} combination(s) scan or sort api_vacancy: {', '.join(failures)}"
+            )
+        self.stdout.write(self.style.SUCCESS("Every combination uses an index."))
+
+    def seed(self, rows):
+        rng = random.Random(0)
+        author = CustomUser.objects.create_user("explain-author", role="employer")
+        company = Company.objects.create(name="explain-company")
+        batch = []
+        for i in range(rows):
+            salary = rng.choice([None, rng.randrange(500, 20000, 100)])
+            batch.append(Vacancy(
+                title=f"vacancy {i}",
+                company=company,
+                location=rng.choice(["Dushanbe", "Khujand", "Bokhtar", "Kulob"]),
+                description="-",
+                employment_type=rng.choice(Vacancy.EMPLOYMENT_TYPE_CHOICES)[0],
+                work_format=rng.choice(Vacancy.WORK_FORMAT_CHOICES)[0],
+                experience_required=rng.choice(Vacancy.EXPERIENCE_CHOICES)[0],
+                currency=rng.choice(["TJS", "TJS", "USD"]),
+                salary_from=salary,
+                is_active=rng.random() < 0.8,
+                views=rng.randrange(1000),
+                author=author,
+            ))
+        Vacancy.objects.bulk_create(batch, batch_size=1000)
@@ -0,0 +1,31 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from api.bulk import FORMATS, export_vacancies
+from api.models import Vacancy
+
+
+class Command(BaseCommand):
+    help = "Stream vacancies to a CSV or JSONL file (or stdout) in constant memory."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", choices=FORMATS, default="csv")
+        parser.add_argument("--output", help="File to write; defaults to stdout.")
+        parser.add_argument("--author", help="Only vacancies of this username.")
+        parser.add_argument("--active-only", action="store_true")
+        parser.add_argument("--chunk-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        queryset = Vacancy.objects.all()
+        if options["author"]:
+            queryset = queryset.filter(author__username=options["author"])
+        if options["active_only"]:
+            queryset = queryset.active()
+
+        lines = export_vacancies(queryset, options["format"], chunk_size=options["chunk_size"])
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8", newline="") as output:
+                output.writelines(lines)
+        else:
+            sys.stdout.writelines(lines)
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from api.counters import get_view_counter
+
+
+class Command(BaseCommand):
+    help = (
+        "Write buffered vacancy view counts to the database. Only reaches "
+        "counts held in a shared backend such as CacheViewCounterBackend."
+    )
+
+    def handle(self, *args, **options):
+        flushed = get_view_counter().flush()
+        self.stdout.write(self.style.SUCCESS(f"Flushed views for {flushed} vacancies."))
@@ -0,0 +1,43 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from api.bulk import CHUNK_SIZE, FORMATS, check_encoding, guess_format, import_vacancies
+
+
+class Command(BaseCommand):
+    help = "Bulk-import vacancies from a CSV or JSONL file on behalf of an employer."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--author", required=True, help="Username of the employer the vacancies belong to.")
+        parser.add_argument("--format", choices=FORMATS, help="Defaults to the file extension.")
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        try:
+            author = get_user_model().objects.get(username=options["author"])
+        except get_user_model().DoesNotExist:
+            raise CommandError(f"No user named {options['author']!r}.")
+        fmt = options["format"] or guess_format(options["path"])
+        if fmt is None:
+            raise CommandError("Can't tell the format from the file name; pass --format.")
+
+        with open(options["path"], "rb") as raw:
+            try:
+                check_encoding(iter(lambda: raw.read(64 * 1024), b""))
+            except UnicodeDecodeError as exc:
+                raise CommandError(f"The file must be UTF-8 encoded: {exc}")
+        with open(options["path"], encoding="utf-8-sig", newline="") as lines:
+            result = import_vacancies(
+                lines, fmt, author, chunk_size=options["chunk_size"], dry_run=options["dry_run"]
+            )
+
+        for error in result["errors"]:
+            self.stderr.write(f"line {error['row']}: {json.dumps(error['errors'], ensure_ascii=False)}")
+        verb = "Would create" if options["dry_run"] else "Created"
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {result['created']} vacancies, {result['error_count']} invalid rows skipped."
+        ))
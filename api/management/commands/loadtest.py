@@ -0,0 +1,200 @@
+import asyncio
+import io
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from urllib.request import urlopen
+
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.models import CustomUser
+from api.models import Company, Vacancy
+
+# (name, sync path, async path); "{vacancy}" / "{company}" are filled in from the data.
+ENDPOINTS = [
+    ("vacancy list", "/api/vacancies/?page_size=20", "/api/async/vacancies/?page_size=20"),
+    ("vacancy detail", "/api/vacancies/{vacancy}/", "/api/async/vacancies/{vacancy}/"),
+    ("company profile", "/api/companies/{company}/profile/", "/api/async/companies/{company}/profile/"),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare throughput and p50/p99 latency of the sync (DRF under WSGI) "
+        "and async (api.async_views under ASGI) read endpoints. By default both "
+        "handlers are driven in-process: WSGI from --concurrency threads, ASGI "
+        "from as many tasks on one event loop. With --wsgi-url/--asgi-url the "
+        "requests go over HTTP to servers you started yourself. Each request "
+        "carries a unique query parameter so the anonymous response cache "
+        "never answers it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500, help="Requests per endpoint and mode.")
+        parser.add_argument("--concurrency", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=0,
+                            help="Create this many vacancies for the run and delete them afterwards.")
+        parser.add_argument("--wsgi-url", help="Base URL of a running WSGI server, e.g. http://127.0.0.1:8000")
+        parser.add_argument("--asgi-url", help="Base URL of a running ASGI server, e.g. http://127.0.0.1:8001")
+
+    def handle(self, *args, **options):
+        if bool(options["wsgi_url"]) != bool(options["asgi_url"]):
+            raise CommandError("Pass both --wsgi-url and --asgi-url, or neither.")
+        author = self.seed(options["seed"]) if options["seed"] else None
+        try:
+            vacancy = Vacancy.objects.active().order_by("-created_at").values("id", "company_id").first()
+            if vacancy is None:
+                raise CommandError("No active vacancies to request; use --seed.")
+            ids = {"vacancy": vacancy["id"], "company": vacancy["company_id"]}
+
+            self.stdout.write(
+                f"{options['requests']} requests per endpoint, concurrency {options['concurrency']}, "
+                f"{'over HTTP' if options['wsgi_url'] else 'in-process'}"
+            )
+            self.stdout.write(f"{'endpoint':<17}{'mode':<6}{'req/s':>9}{'p50 ms':>9}{'p99 ms':>9}{'errors':>8}")
+            for name, sync_path, async_path in ENDPOINTS:
+                for mode, path in (("wsgi", sync_path), ("asgi", async_path)):
+                    paths = self.paths(path.format(**ids), options["requests"])
+                    if options["wsgi_url"]:
+                        base = options[f"{mode}_url"].rstrip("/")
+                        elapsed, results = run_threads(http_request, [base + p for p in paths], options["concurrency"])
+                    elif mode == "wsgi":
+                        elapsed, results = run_threads(WSGIClient().request, paths, options["concurrency"])
+                    else:
+                        elapsed, results = asyncio.run(run_tasks(ASGIClient().request, paths, options["concurrency"]))
+                    self.report(name, mode, elapsed, results)
+        finally:
+            if author is not None:
+                author.delete()
+                Company.objects.filter(name__startswith="loadtest ").delete()
+
+    def paths(self, path, count):
+        separator = "&" if "?" in path else "?"
+        return [f"{path}{separator}_={i}" for i in range(count)]
+
+    def report(self, name, mode, elapsed, results):
+        latencies = sorted(latency for status, latency in results)
+        errors = sum(1 for status, _ in results if status != 200)
+        p50 = latencies[int(0.50 * (len(latencies) - 1))] * 1000
+        p99 = latencies[int(0.99 * (len(latencies) - 1))] * 1000
+        self.stdout.write(f"{name:<17}{mode:<6}{len(results) / elapsed:9.1f}{p50:9.1f}{p99:9.1f}{errors:8}")
+
+    def seed(self, rows):
+        rng = random.Random(0)
+        author = CustomUser.objects.create_user("loadtest-author", role="employer")
+        companies = Company.objects.bulk_create([Company(name=f"loadtest {i}") for i in range(20)])
+        Vacancy.objects.bulk_create(
+            [
+                Vacancy(
+                    title=f"vacancy {i}",
+                    company=rng.choice(companies),
+                    location=rng.choice(["Dushanbe", "Khujand", "Bokhtar", "Kulob"]),
+                    description="Load test vacancy. " * 20,
+                    employment_type=rng.choice(Vacancy.EMPLOYMENT_TYPE_CHOICES)[0],
+                    work_format=rng.choice(Vacancy.WORK_FORMAT_CHOICES)[0],
+                    salary_from=rng.randrange(500, 20000, 100),
+                    author=author,
+                )
+                for i in range(rows)
+            ],
+            batch_size=1000,
+        )
+        return author
+
+
+def run_threads(request, targets, concurrency):
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(request, targets))
+    return time.perf_counter() - started, results
+
+
+async def run_tasks(request, targets, concurrency):
+    queue = list(reversed(targets))
+    results = []
+
+    async def worker():
+        while queue:
+            results.append(await request(queue.pop()))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started, results
+
+
+def http_request(url):
+    started = time.perf_counter()
+    try:
+        with urlopen(url) as response:
+            response.read()
+            status = response.status
+    except OSError as exc:
+        status = getattr(exc, "code", None)
+    return status, time.perf_counter() - started
+
+
+class WSGIClient:
+    def __init__(self):
+        self.handler = WSGIHandler()
+
+    def request(self, target):
+        parts = urlsplit(target)
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "PATH_INFO": parts.path,
+            "QUERY_STRING": parts.query,
+            "SERVER_NAME": "localhost",
+            "SERVER_PORT": "80",
+            "HTTP_HOST": "localhost",
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "wsgi.url_scheme": "http",
+            "wsgi.input": io.BytesIO(),
+            "wsgi.errors": io.StringIO(),
+        }
+        statuses = []
+        started = time.perf_counter()
+        response = self.handler(environ, lambda status, headers: statuses.append(status))
+        for _ in response:
+            pass
+        response.close()
+        return int(statuses[0].split()[0]), time.perf_counter() - started
+
+
+class ASGIClient:
+    def __init__(self):
+        self.handler = ASGIHandler()
+
+    async def request(self, target):
+        parts = urlsplit(target)
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": parts.path,
+            "query_string": parts.query.encode(),
+            "headers": [(b"host", b"localhost")],
+            "server": ("localhost", 80),
+        }
+        messages = []
+        body_sent = False
+
+        async def receive():
+            nonlocal body_sent
+            if body_sent:
+                # Django waits on this for a disconnect; the client never leaves early.
+                await asyncio.Event().wait()
+            body_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        started = time.perf_counter()
+        await self.handler(scope, receive, send)
+        status = next(message["status"] for message in messages if message["type"] == "http.response.start")
+        return status, time.perf_counter() - started
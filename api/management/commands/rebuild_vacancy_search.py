@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from api.search import rebuild_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the vacancy full-text search index from scratch."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            rebuild_index()
+        self.stdout.write(self.style.SUCCESS("Vacancy search index rebuilt."))
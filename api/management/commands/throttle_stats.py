@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from api.throttling import get_rejection_stats, reset_rejection_stats
+
+
+class Command(BaseCommand):
+    help = "Show how many requests each throttle scope has rejected."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true", help="Reset the counters after printing.")
+
+    def handle(self, *args, **options):
+        for scope, rejected in get_rejection_stats().items():
+            self.stdout.write(f"{scope:<12} rejected: {rejected}")
+        if options["reset"]:
+            reset_rejection_stats()
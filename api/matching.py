@@ -0,0 +1,273 @@
+"""
+Vacancy/resume matching.
+
+Both sides are turned into column arrays (location hash, experience bounds,
+salary ceiling, a 128-bit hashed token signature) and scored in bulk with
+NumPy broadcasting. The best ``TOP_K`` resumes of every active vacancy are
+stored in ``VacancyMatch``, and both directions are served from those rows:
+a resume's matches are the vacancies whose shortlist it made.
+"""
+import re
+import zlib
+from collections import namedtuple
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Min, Window
+from django.db.models.functions import RowNumber
+
+from .models import Resume, Vacancy, VacancyMatch
+
+TOKEN_RE = re.compile(r"\w{2,}")
+SIGNATURE_WORDS = 2
+SIGNATURE_BITS = SIGNATURE_WORDS * 64
+
+EXPERIENCE_RANGES = {
+    "no_exp": (0, 1),
+    "1_3": (1, 3),
+    "3_6": (3, 6),
+    "6_plus": (6, np.inf),
+}
+
+WEIGHTS = {"tokens": 0.4, "experience": 0.2, "salary": 0.2, "location": 0.2}
+
+# Columns the scores depend on; saves that touch none of them keep their matches.
+VACANCY_FEATURE_FIELDS = {
+    "location", "work_format", "experience_required", "salary_from", "salary_to", "title", "requirements",
+    "is_active",
+}
+RESUME_FEATURE_FIELDS = {
+    "location", "experience_years", "salary_expectation", "desired_position", "skills", "is_active",
+}
+
+VacancyFeatures = namedtuple("VacancyFeatures", "ids location remote exp_min exp_max salary signature")
+ResumeFeatures = namedtuple("ResumeFeatures", "ids location years salary signature")
+
+if hasattr(np, "bitwise_count"):
+    popcount = np.bitwise_count
+else:
+    _POPCOUNT_8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def popcount(values):
+        values = np.ascontiguousarray(values)
+        return _POPCOUNT_8[values.view(np.uint8)].reshape(values.shape + (8,)).sum(axis=-1)
+
+
+def top_k():
+    return settings.MATCHING["TOP_K"]
+
+
+def affects_matches(update_fields, feature_fields):
+    """Whether a save with ``update_fields`` (None: every field) can change scores."""
+    return update_fields is None or not feature_fields.isdisjoint(update_fields)
+
+
+def location_hash(location):
+    location = (location or "").strip().lower()
+    return zlib.crc32(location.encode()) if location else 0
+
+
+def signature(*texts):
+    words = [0] * SIGNATURE_WORDS
+    for text in texts:
+        for token in TOKEN_RE.findall((text or "").lower()):
+            bit = zlib.crc32(token.encode()) % SIGNATURE_BITS
+            words[bit >> 6] |= 1 << (bit & 63)
+    return words
+
+
+def _float(value):
+    return np.nan if value is None else float(value)
+
+
+def load_vacancy_features(queryset):
+    rows = list(queryset.values_list(
+        "id", "location", "work_format", "experience_required",
+        "salary_from", "salary_to", "title", "requirements",
+    ))
+    exp = [EXPERIENCE_RANGES.get(row[3], (0, np.inf)) for row in rows]
+    return VacancyFeatures(
+        ids=np.array([row[0] for row in rows], dtype=np.int64),
+        location=np.array([location_hash(row[1]) for row in rows], dtype=np.int64),
+        remote=np.array([row[2] == "remote" for row in rows], dtype=bool),
+        exp_min=np.array([bounds[0] for bounds in exp], dtype=np.float32),
+        exp_max=np.array([bounds[1] for bounds in exp], dtype=np.float32),
+        # The most the employer will pay: salary_to, or salary_from if that is all we have.
+        salary=np.array([_float(row[5] if row[5] is not None else row[4]) for row in rows], dtype=np.float32),
+        signature=np.array([signature(row[6], row[7]) for row in rows], dtype=np.uint64).reshape(-1, SIGNATURE_WORDS),
+    )
+
+
+def load_resume_features(queryset):
+    rows = list(queryset.values_list(
+        "id", "location", "experience_years", "salary_expectation", "desired_position", "skills",
+    ))
+    return ResumeFeatures(
+        ids=np.array([row[0] for row in rows], dtype=np.int64),
+        location=np.array([location_hash(row[1]) for row in rows], dtype=np.int64),
+        years=np.array([row[2] for row in rows], dtype=np.float32),
+        salary=np.array([_float(row[3]) for row in rows], dtype=np.float32),
+        signature=np.array([signature(row[4], row[5]) for row in rows], dtype=np.uint64).reshape(-1, SIGNATURE_WORDS),
+    )
+
+
+def score_matrix(vacancies, resumes):
+    """Return a ``len(vacancies) x len(resumes)`` float32 matrix of scores in [0, 1]."""
+    # Everything is accumulated in place into float32 buffers: at 10k x 100k
+    # the cost is dominated by the number of full passes over the matrix.
+    shape = (len(vacancies.ids), len(resumes.ids))
+
+    shared = np.zeros(shape, dtype=np.uint8)
+    resume_words = np.ascontiguousarray(resumes.signature.T)
+    for word in range(SIGNATURE_WORDS):
+        shared += popcount(np.bitwise_and(vacancies.signature[:, word, None], resume_words[word][None, :]))
+    size_v = popcount(vacancies.signature).sum(axis=1, dtype=np.float32)
+    size_r = popcount(resumes.signature).sum(axis=1, dtype=np.float32)
+    score = shared.astype(np.float32)
+    union = size_v[:, None] + size_r[None, :]
+    union -= score
+    np.maximum(union, 1, out=union)
+    score /= union
+    score *= WEIGHTS["tokens"]
+
+    # Experience only depends on the vacancy's bucket, so score each bucket
+    # once against all resumes and gather rows.
+    buckets, bucket_of = np.unique(
+        np.stack([vacancies.exp_min, vacancies.exp_max], axis=1), axis=0, return_inverse=True
+    )
+    years = resumes.years[None, :]
+    exp_min = buckets[:, 0, None]
+    exp_max = buckets[:, 1, None]
+    experience = np.where(
+        years < exp_min,
+        np.clip(1 - (exp_min - years) / 3, 0, 1),
+        np.where(years > exp_max, 0.75, 1.0),
+    ).astype(np.float32)
+    experience *= WEIGHTS["experience"]
+    score += experience[bucket_of.reshape(-1)]
+
+    # Salary: full marks up to the vacancy ceiling, then a linear penalty
+    # reaching zero at twice the ceiling; unknown on either side scores 0.5.
+    salary = np.subtract(resumes.salary[None, :], vacancies.salary[:, None], dtype=np.float32)
+    np.maximum(salary, 0, out=salary)
+    salary /= np.maximum(vacancies.salary, 1)[:, None]
+    np.subtract(1, salary, out=salary)
+    np.clip(salary, 0, 1, out=salary)
+    np.nan_to_num(salary, copy=False, nan=0.5)
+    salary *= WEIGHTS["salary"]
+    score += salary
+
+    # Location: exact match, 0.5 when either side didn't say, 1 for remote work.
+    location = np.equal(vacancies.location[:, None], resumes.location[None, :]).astype(np.float32)
+    location[:, resumes.location == 0] = 0.5
+    location[vacancies.location == 0] = 0.5
+    location[vacancies.remote] = 1.0
+    location *= WEIGHTS["location"]
+    score += location
+    return score
+
+
+def best_columns(scores, k):
+    """Indices and values of the ``k`` highest scores in each row, best first."""
+    k = min(k, scores.shape[1])
+    if k == 0:
+        empty = np.empty((scores.shape[0], 0))
+        return empty.astype(np.int64), empty.astype(np.float32)
+    columns = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    values = np.take_along_axis(scores, columns, axis=1)
+    order = np.argsort(-values, axis=1, kind="stable")
+    columns = np.take_along_axis(columns, order, axis=1)
+    return columns, np.take_along_axis(scores, columns, axis=1)
+
+
+def _subset(features, mask):
+    return type(features)(*(field[mask] for field in features))
+
+
+def refresh_vacancy_matches(vacancy_ids, resumes=None, chunk_size=64):
+    """Recompute and store the top-K resumes for each of ``vacancy_ids``."""
+    vacancy_ids = list(vacancy_ids)
+    vacancies = load_vacancy_features(Vacancy.objects.filter(id__in=vacancy_ids, is_active=True))
+    if resumes is None:
+        resumes = load_resume_features(Resume.objects.filter(is_active=True))
+
+    rows = []
+    for start in range(0, len(vacancies.ids), chunk_size):
+        chunk = _subset(vacancies, slice(start, start + chunk_size))
+        columns, values = best_columns(score_matrix(chunk, resumes), top_k())
+        for vacancy_id, resume_rows, scores in zip(chunk.ids, columns, values):
+            rows.extend(
+                VacancyMatch(vacancy_id=int(vacancy_id), resume_id=int(resumes.ids[column]), score=float(score))
+                for column, score in zip(resume_rows, scores)
+            )
+
+    with transaction.atomic():
+        VacancyMatch.objects.filter(vacancy_id__in=vacancy_ids).delete()
+        VacancyMatch.objects.bulk_create(rows, batch_size=1000)
+
+
+def refresh_resume_matches(resume_id, vacancies=None):
+    """
+    Re-place one resume in the stored top-K lists: drop its old rows, insert
+    it wherever it now beats a vacancy's current K-th score, and trim the
+    lists that grew past K.
+    """
+    k = top_k()
+    resume = load_resume_features(Resume.objects.filter(id=resume_id, is_active=True))
+    if vacancies is None:
+        vacancies = load_vacancy_features(Vacancy.objects.filter(is_active=True))
+
+    with transaction.atomic():
+        VacancyMatch.objects.filter(resume_id=resume_id).delete()
+        if not len(resume.ids) or not len(vacancies.ids):
+            return
+
+        scores = score_matrix(vacancies, resume)[:, 0]
+        floors = {
+            row["vacancy_id"]: row
+            for row in VacancyMatch.objects.filter(vacancy__is_active=True)
+            .values("vacancy_id")
+            .annotate(size=Count("id"), floor=Min("score"))
+        }
+        rows = []
+        for vacancy_id, score in zip(vacancies.ids.tolist(), scores.tolist()):
+            current = floors.get(vacancy_id)
+            if current is None or current["size"] < k or score > current["floor"]:
+                rows.append(VacancyMatch(vacancy_id=vacancy_id, resume_id=resume_id, score=score))
+        VacancyMatch.objects.bulk_create(rows, batch_size=1000)
+
+        overflow = (
+            VacancyMatch.objects.filter(vacancy_id__in=[row.vacancy_id for row in rows])
+            .annotate(rank=Window(RowNumber(), partition_by=F("vacancy_id"), order_by=F("score").desc()))
+            .filter(rank__gt=k)
+            .values_list("id", flat=True)
+        )
+        VacancyMatch.objects.filter(id__in=list(overflow)).delete()
+
+
+def rebuild_matches(chunk_size=256):
+    resumes = load_resume_features(Resume.objects.filter(is_active=True))
+    vacancy_ids = list(Vacancy.objects.filter(is_active=True).values_list("id", flat=True))
+    VacancyMatch.objects.exclude(vacancy_id__in=Vacancy.objects.filter(is_active=True)).delete()
+    for start in range(0, len(vacancy_ids), chunk_size):
+        refresh_vacancy_matches(vacancy_ids[start:start + chunk_size], resumes=resumes)
+    return len(vacancy_ids)
+
+
+def refresh_changed_matches(since, chunk_size=256):
+    """
+    Bring the stored matches up to date with vacancies and resumes saved at
+    or after ``since``. Returns ``(vacancies, resumes)`` refreshed.
+    """
+    vacancy_ids = list(Vacancy.objects.filter(updated_at__gte=since).values_list("id", flat=True))
+    resume_ids = list(Resume.objects.filter(updated_at__gte=since).values_list("id", flat=True))
+    if vacancy_ids:
+        resumes = load_resume_features(Resume.objects.filter(is_active=True))
+        for start in range(0, len(vacancy_ids), chunk_size):
+            refresh_vacancy_matches(vacancy_ids[start:start + chunk_size], resumes=resumes)
+    if resume_ids:
+        vacancies = load_vacancy_features(Vacancy.objects.filter(is_active=True))
+        for resume_id in resume_ids:
+            refresh_resume_matches(resume_id, vacancies=vacancies)
+    return len(vacancy_ids), len(resume_ids)
@@ -0,0 +1,62 @@
+from django.db import migrations
+
+
+SQLITE_CREATE = """
+CREATE VIRTUAL TABLE api_vacancy_fts USING fts5(
+    title, description, requirements, responsibilities, company,
+    tokenize = 'unicode61 remove_diacritics 2'
+)
+"""
+SQLITE_POPULATE = """
+INSERT INTO api_vacancy_fts (rowid, title, description, requirements, responsibilities, company)
+SELECT v.id, v.title, v.description, v.requirements, v.responsibilities, c.name
+FROM api_vacancy v JOIN api_company c ON c.id = v.company_id
+"""
+
+POSTGRES_CREATE = """
+CREATE TABLE api_vacancy_search (
+    vacancy_id bigint PRIMARY KEY REFERENCES api_vacancy (id) ON DELETE CASCADE,
+    document tsvector NOT NULL
+)
+"""
+POSTGRES_INDEX = "CREATE INDEX api_vacancy_search_document_gin ON api_vacancy_search USING GIN (document)"
+POSTGRES_POPULATE = """
+INSERT INTO api_vacancy_search (vacancy_id, document)
+SELECT v.id,
+    setweight(to_tsvector('simple', v.title), 'A') ||
+    setweight(to_tsvector('simple', c.name), 'B') ||
+    setweight(to_tsvector('simple', v.requirements || ' ' || v.responsibilities), 'C') ||
+    setweight(to_tsvector('simple', v.description), 'D')
+FROM api_vacancy v JOIN api_company c ON c.id = v.company_id
+"""
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        statements = [SQLITE_CREATE, SQLITE_POPULATE]
+    elif vendor == "postgresql":
+        statements = [POSTGRES_CREATE, POSTGRES_INDEX, POSTGRES_POPULATE]
+    else:
+        return
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        schema_editor.execute("DROP TABLE IF EXISTS api_vacancy_fts")
+    elif vendor == "postgresql":
+        schema_editor.execute("DROP TABLE IF EXISTS api_vacancy_search")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_remove_resume_skills_resume_file_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_vacancy_active_created_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='Skill')),
+            ],
+            options={
+                'verbose_name': 'Skill',
+                'verbose_name_plural': 'Skills',
+            },
+        ),
+        migrations.CreateModel(
+            name='ResumeSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('resume', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to='api.resume')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='resume_links', to='api.skill')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='skill_tags',
+            field=models.ManyToManyField(blank=True, related_name='resumes', through='api.ResumeSkill', to='api.skill'),
+        ),
+        migrations.AddIndex(
+            model_name='resumeskill',
+            index=models.Index(fields=['skill', 'resume'], name='api_resumes_skill_i_00b13b_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='resumeskill',
+            unique_together={('resume', 'skill')},
+        ),
+    ]
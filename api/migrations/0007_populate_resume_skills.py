@@ -0,0 +1,48 @@
+import re
+
+from django.db import migrations
+
+SEPARATOR_RE = re.compile(r"[,;\n]+")
+WHITESPACE_RE = re.compile(r"\s+")
+BATCH_SIZE = 1000
+
+
+def parse_skills(text):
+    names = []
+    for part in SEPARATOR_RE.split(text or ""):
+        name = WHITESPACE_RE.sub(" ", part).strip().lower()[:100]
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def populate_skills(apps, schema_editor):
+    Resume = apps.get_model("api", "Resume")
+    Skill = apps.get_model("api", "Skill")
+    ResumeSkill = apps.get_model("api", "ResumeSkill")
+
+    parsed = {
+        pk: parse_skills(text)
+        for pk, text in Resume.objects.exclude(skills="").values_list("id", "skills").iterator()
+    }
+    names = {name for skill_names in parsed.values() for name in skill_names}
+    Skill.objects.bulk_create([Skill(name=name) for name in names], ignore_conflicts=True)
+    skill_ids = dict(Skill.objects.values_list("name", "id"))
+
+    links = [
+        ResumeSkill(resume_id=pk, skill_id=skill_ids[name])
+        for pk, skill_names in parsed.items()
+        for name in skill_names
+    ]
+    ResumeSkill.objects.bulk_create(links, batch_size=BATCH_SIZE, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_skill_resumeskill'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_skills, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_populate_resume_skills'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VacancyMatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField(verbose_name='Score')),
+                ('resume', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='vacancy_matches', to='api.resume')),
+                ('vacancy', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='resume_matches', to='api.vacancy')),
+            ],
+            options={
+                'verbose_name': 'Vacancy match',
+                'verbose_name_plural': 'Vacancy matches',
+                'indexes': [models.Index(fields=['vacancy', '-score'], name='api_vacancy_vacancy_aefc24_idx')],
+                'unique_together': {('vacancy', 'resume')},
+            },
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_vacancy_filter_sort_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='vacancy',
+            name='vacancy_active_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='vacancy',
+            name='vacancy_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='vacancy',
+            name='vacancy_salary_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='vacancy',
+            name='vacancy_views_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='vacancy',
+            name='vacancy_currency_salary_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='vacancy',
+            name='vacancy_experience_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['created_at', 'id'], name='vacancy_active_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['salary_from', 'id'], name='vacancy_salary_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['views', 'id'], name='vacancy_views_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['currency', 'salary_from'], name='vacancy_currency_salary_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['experience_required', 'created_at'], name='vacancy_experience_created_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-18 17:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_vacancy_active_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vacancymatch',
+            index=models.Index(fields=['resume', '-score'], name='api_vacancy_resume__183196_idx'),
+        ),
+    ]
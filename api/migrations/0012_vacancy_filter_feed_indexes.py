@@ -0,0 +1,39 @@
+# Generated by Django 5.2.8 on 2026-10-18 17:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_vacancymatch_resume_score_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='vacancy',
+            name='vacancy_experience_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['location', 'created_at', 'id'], name='vacancy_location_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['employment_type', 'created_at', 'id'], name='vacancy_employment_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['work_format', 'created_at', 'id'], name='vacancy_format_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['experience_required', 'created_at', 'id'], name='vacancy_experience_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['currency', 'created_at', 'id'], name='vacancy_currency_feed_idx'),
+        ),
+    ]
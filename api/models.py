@@ -1,7 +1,19 @@
 from django.db import models
+from django.db.models import Count, Max, Q, Sum
+from django.db.models.functions import Coalesce
 from accounts.models import CustomUser
 
 
+class CompanyQuerySet(models.QuerySet):
+    def with_vacancy_stats(self):
+        active = Q(vacancies__is_active=True)
+        return self.annotate(
+            active_vacancies=Count("vacancies", filter=active),
+            total_views=Coalesce(Sum("vacancies__views"), 0),
+            latest_posted_at=Max("vacancies__created_at", filter=active),
+        )
+
+
 class Company(models.Model):
     name = models.CharField(max_length=200, unique=True, verbose_name="Company name")
     logo = models.ImageField(upload_to="company_logos/", blank=True, null=True, verbose_name="Logo")
@@ -11,6 +23,8 @@ class Company(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CompanyQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Company"
         verbose_name_plural = "Companies"
@@ -18,6 +32,26 @@ class Company(models.Model):
     def __str__(self):
         return self.name
 
+class VacancyQuerySet(models.QuerySet):
+    def active(self):
+        return self.filter(is_active=True)
+
+    def visible_to(self, user):
+        """Active vacancies, plus the inactive ones ``user`` posted."""
+        if user is None or not user.is_authenticated:
+            return self.active()
+        return self.filter(Q(is_active=True) | Q(author_id=user.id))
+
+    def for_listing(self):
+        # The serialized author is only ``str(user)``, so skip the rest of the user row.
+        author_fields = [
+            f"author__{field.name}"
+            for field in CustomUser._meta.concrete_fields
+            if field.name not in ("id", CustomUser.USERNAME_FIELD)
+        ]
+        return self.select_related("company", "author").defer(*author_fields)
+
+
 class Vacancy(models.Model):
     EMPLOYMENT_TYPE_CHOICES = [
         ("full_time", "Full-time"),
@@ -65,34 +99,75 @@ class Vacancy(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     author = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name="vacancies")
 
+    objects = VacancyQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Vacancy"
         verbose_name_plural = "Vacancies"
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["location", "employment_type", "work_format"]),
+            # The public feed only ever reads active vacancies, so its access
+            # paths are partial indexes over that (small) subset.
+            models.Index(fields=["created_at", "id"], name="vacancy_active_feed_idx", condition=models.Q(is_active=True)),
+            models.Index(fields=["salary_from", "id"], name="vacancy_salary_idx", condition=models.Q(is_active=True)),
+            models.Index(fields=["views", "id"], name="vacancy_views_idx", condition=models.Q(is_active=True)),
+            models.Index(
+                fields=["currency", "salary_from"], name="vacancy_currency_salary_idx", condition=models.Q(is_active=True)
+            ),
+            # One per column filter, so a filtered feed reads its first page in
+            # date order instead of sorting every matching row.
+            *[
+                models.Index(fields=[column, "created_at", "id"], name=name, condition=models.Q(is_active=True))
+                for column, name in [
+                    ("location", "vacancy_location_feed_idx"),
+                    ("employment_type", "vacancy_employment_feed_idx"),
+                    ("work_format", "vacancy_format_feed_idx"),
+                    ("experience_required", "vacancy_experience_feed_idx"),
+                    ("currency", "vacancy_currency_feed_idx"),
+                ]
+            ],
         ]
 
     def __str__(self):
         return f"{self.title} в {self.company.name}"
 
     def increment_views(self):
-        Vacancy.objects.filter(pk=self.pk).update(views=models.F("views") + 1)
-        self.refresh_from_db()
+        from .counters import get_view_counter
+
+        counter = get_view_counter()
+        if counter.hit(self.pk):
+            self.refresh_from_db(fields=["views"])
+        self.views += counter.pending(self.pk)
 
     def salary_display(self):
-        if not self.show_salary:
+        return self.format_salary(self.show_salary, self.salary_from, self.salary_to, self.currency)
+
+    @staticmethod
+    def format_salary(show_salary, salary_from, salary_to, currency):
+        if not show_salary:
             return "By agreement"
-        if self.salary_from and self.salary_to:
-            return f"{self.salary_from} – {self.salary_to} {self.currency}"
-        if self.salary_from:
-            return f"от {self.salary_from} {self.currency}"
-        if self.salary_to:
-            return f"до {self.salary_to} {self.currency}"
+        if salary_from and salary_to:
+            return f"{salary_from} – {salary_to} {currency}"
+        if salary_from:
+            return f"от {salary_from} {currency}"
+        if salary_to:
+            return f"до {salary_to} {currency}"
         return "Not specified"
 
 
 
+class Skill(models.Model):
+    name = models.CharField("Skill", max_length=100, unique=True)
+
+    class Meta:
+        verbose_name = "Skill"
+        verbose_name_plural = "Skills"
+
+    def __str__(self):
+        return self.name
+
+
 class Resume(models.Model):
     user = models.OneToOneField(CustomUser, on_delete=models.CASCADE, related_name="resume")
 
@@ -106,6 +181,7 @@ class Resume(models.Model):
     experience_years = models.PositiveSmallIntegerField("Years of experience", default=0)
     about = models.TextField("About me", blank=True)
     skills = models.CharField("Skills", max_length=300, blank=True)
+    skill_tags = models.ManyToManyField(Skill, through="ResumeSkill", related_name="resumes", blank=True)
     is_active = models.BooleanField("Looking for job", default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -127,6 +203,51 @@ class Resume(models.Model):
 
 
 
+class ResumeSkill(models.Model):
+    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name="skill_links")
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name="resume_links")
+
+    class Meta:
+        unique_together = ("resume", "skill")
+        indexes = [
+            models.Index(fields=["skill", "resume"]),
+        ]
+
+    def __str__(self):
+        return f"{self.resume_id} – {self.skill_id}"
+
+
+class VacancyMatch(models.Model):
+    vacancy = models.ForeignKey(Vacancy, on_delete=models.CASCADE, related_name="resume_matches")
+    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name="vacancy_matches")
+    score = models.FloatField("Score")
+
+    class Meta:
+        unique_together = ("vacancy", "resume")
+        verbose_name = "Vacancy match"
+        verbose_name_plural = "Vacancy matches"
+        indexes = [
+            models.Index(fields=["vacancy", "-score"]),
+            models.Index(fields=["resume", "-score"]),
+        ]
+
+    def __str__(self):
+        return f"{self.vacancy_id} ↔ {self.resume_id}: {self.score:.2f}"
+
+
+class ApplicationQuerySet(models.QuerySet):
+    def for_employer(self, user):
+        return self.filter(vacancy__author_id=user.pk)
+
+    def status_counts(self):
+        counts = {status: 0 for status, _ in Application.STATUS_CHOICES}
+        rows = self.order_by().values_list("status").annotate(count=models.Count("id"))
+        for status, count in rows:
+            counts[status] = count
+        counts["total"] = sum(counts.values())
+        return counts
+
+
 class Application(models.Model):
     STATUS_CHOICES = [
         ("pending", "Pending"),
@@ -135,6 +256,13 @@ class Application(models.Model):
         ("rejected", "Rejected"),
     ]
 
+    # target status -> statuses it may be reached from
+    TRANSITIONS = {
+        "reviewed": ("pending",),
+        "accepted": ("pending", "reviewed"),
+        "rejected": ("pending", "reviewed"),
+    }
+
     applicant = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name="applications_sent")
     vacancy = models.ForeignKey(Vacancy, on_delete=models.CASCADE, related_name="applications_received")
     resume = models.ForeignKey(Resume, on_delete=models.SET_NULL, null=True, blank=True, related_name="applications")
@@ -145,6 +273,8 @@ class Application(models.Model):
     applied_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ApplicationQuerySet.as_manager()
+
     class Meta:
         unique_together = ("applicant", "vacancy")
         verbose_name = "Response"
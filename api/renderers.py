@@ -0,0 +1,66 @@
+"""
+JSON renderer and parser backed by orjson when it is installed.
+
+Output matches DRF's ``JSONRenderer``: datetimes, ``Decimal`` and lazy
+strings are handed to DRF's own encoder (``OPT_PASSTHROUGH_DATETIME``), the
+result is compact UTF-8, and U+2028/U+2029 are escaped. Anything orjson
+can't match (indentation, ASCII-only output, integers wider than 64 bits,
+an uninstalled orjson or ``FAST_JSON = False``) falls back to the stdlib
+path. Floats are where the bytes can differ: non-finite ones render as
+``null`` rather than ``NaN``/``Infinity``, and very small or large ones are
+spelled differently (``1e-6``, ``0.00001``, ``1e16`` where the stdlib
+writes ``1e-06``, ``1e-05``, ``1e+16``) though they parse to the same value.
+"""
+import codecs
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+)
+_drf_default = encoders.JSONEncoder().default
+
+
+def orjson_enabled():
+    return orjson is not None and getattr(settings, "FAST_JSON", True)
+
+
+class FastJSONRenderer(JSONRenderer):
+    def use_orjson(self, accepted_media_type, renderer_context):
+        return (
+            orjson_enabled()
+            and api_settings.COMPACT_JSON
+            and not self.ensure_ascii
+            and not self.get_indent(accepted_media_type or "", renderer_context or {})
+        )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None or not self.use_orjson(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            content = orjson.dumps(data, default=_drf_default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        return content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+class FastJSONParser(JSONParser):
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if not orjson_enabled() or not self.strict or codecs.lookup(encoding).name != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
@@ -0,0 +1,183 @@
+import re
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from .models import Company, Vacancy
+
+TOKEN_RE = re.compile(r"\w+")
+MAX_TERMS = 8
+
+VACANCY_TABLE = Vacancy._meta.db_table
+COMPANY_TABLE = Company._meta.db_table
+
+
+def search_terms(query):
+    return TOKEN_RE.findall(query.lower())[:MAX_TERMS]
+
+
+class SQLiteSearchBackend:
+    """FTS5 virtual table whose rowid is the vacancy id."""
+
+    table = "api_vacancy_fts"
+    # bm25 column weights: title, description, requirements, responsibilities, company
+    rank_sql = f"bm25({table}, 10.0, 1.0, 2.0, 2.0, 5.0)"
+
+    def index_vacancies(self, ids):
+        ids = list(ids)
+        if not ids:
+            return
+        placeholders = ", ".join(["%s"] * len(ids))
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE rowid IN ({placeholders})", ids)
+            cursor.execute(
+                f"INSERT INTO {self.table} (rowid, title, description, requirements, responsibilities, company) "
+                f"SELECT v.id, v.title, v.description, v.requirements, v.responsibilities, c.name "
+                f"FROM {VACANCY_TABLE} v JOIN {COMPANY_TABLE} c ON c.id = v.company_id "
+                f"WHERE v.id IN ({placeholders})",
+                ids,
+            )
+
+    def remove_vacancies(self, ids):
+        ids = list(ids)
+        if not ids:
+            return
+        placeholders = ", ".join(["%s"] * len(ids))
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE rowid IN ({placeholders})", ids)
+
+    def rebuild(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table}")
+            cursor.execute(
+                f"INSERT INTO {self.table} (rowid, title, description, requirements, responsibilities, company) "
+                f"SELECT v.id, v.title, v.description, v.requirements, v.responsibilities, c.name "
+                f"FROM {VACANCY_TABLE} v JOIN {COMPANY_TABLE} c ON c.id = v.company_id"
+            )
+
+    def search(self, queryset, terms):
+        match = " ".join(f'"{term}"*' for term in terms)
+        # Join the FTS table directly so MATCH drives the plan and bm25()
+        # is evaluated once per hit instead of once per vacancy.
+        queryset = queryset.extra(
+            tables=[self.table],
+            where=[f"{self.table}.rowid = {VACANCY_TABLE}.id", f"{self.table} MATCH %s"],
+            params=[match],
+        )
+        return queryset.annotate(search_rank=RawSQL(self.rank_sql, []))
+
+
+class PostgresSearchBackend:
+    """Side table holding a weighted ``tsvector`` per vacancy, GIN indexed."""
+
+    table = "api_vacancy_search"
+    document_sql = (
+        "setweight(to_tsvector('simple', v.title), 'A') || "
+        "setweight(to_tsvector('simple', c.name), 'B') || "
+        "setweight(to_tsvector('simple', v.requirements || ' ' || v.responsibilities), 'C') || "
+        "setweight(to_tsvector('simple', v.description), 'D')"
+    )
+
+    def index_vacancies(self, ids):
+        ids = list(ids)
+        if not ids:
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {self.table} (vacancy_id, document) "
+                f"SELECT v.id, {self.document_sql} "
+                f"FROM {VACANCY_TABLE} v JOIN {COMPANY_TABLE} c ON c.id = v.company_id "
+                f"WHERE v.id = ANY(%s) "
+                f"ON CONFLICT (vacancy_id) DO UPDATE SET document = EXCLUDED.document",
+                [ids],
+            )
+
+    def remove_vacancies(self, ids):
+        ids = list(ids)
+        if not ids:
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE vacancy_id = ANY(%s)", [ids])
+
+    def rebuild(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"TRUNCATE {self.table}")
+            cursor.execute(
+                f"INSERT INTO {self.table} (vacancy_id, document) "
+                f"SELECT v.id, {self.document_sql} "
+                f"FROM {VACANCY_TABLE} v JOIN {COMPANY_TABLE} c ON c.id = v.company_id"
+            )
+
+    def search(self, queryset, terms):
+        tsquery = " & ".join(f"{term}:*" for term in terms)
+        queryset = queryset.filter(
+            id__in=RawSQL(
+                f"SELECT vacancy_id FROM {self.table} WHERE document @@ to_tsquery('simple', %s)",
+                [tsquery],
+            )
+        )
+        # Negated so that, as with bm25(), a lower rank is a better match.
+        rank = RawSQL(
+            f"SELECT -ts_rank(document, to_tsquery('simple', %s)) FROM {self.table} "
+            f"WHERE vacancy_id = {VACANCY_TABLE}.id",
+            [tsquery],
+        )
+        return queryset.annotate(search_rank=rank)
+
+
+class FallbackSearchBackend:
+    """Unindexed substring search for databases without a full-text engine."""
+
+    def index_vacancies(self, ids):
+        pass
+
+    def remove_vacancies(self, ids):
+        pass
+
+    def rebuild(self):
+        pass
+
+    def search(self, queryset, terms):
+        for term in terms:
+            queryset = queryset.filter(
+                Q(title__icontains=term)
+                | Q(description__icontains=term)
+                | Q(requirements__icontains=term)
+                | Q(responsibilities__icontains=term)
+                | Q(company__name__icontains=term)
+            )
+        return queryset.annotate(search_rank=RawSQL("0", []))
+
+
+BACKENDS = {
+    "sqlite": SQLiteSearchBackend,
+    "postgresql": PostgresSearchBackend,
+}
+
+
+def get_backend():
+    return BACKENDS.get(connection.vendor, FallbackSearchBackend)()
+
+
+def search_vacancies(queryset, query):
+    """
+    Filter ``queryset`` to vacancies matching every term of ``query`` and
+    annotate ``search_rank`` (lower is more relevant).
+    """
+    terms = search_terms(query)
+    if not terms:
+        return queryset.annotate(search_rank=RawSQL("0", []))
+    return get_backend().search(queryset, terms)
+
+
+def index_vacancies(ids):
+    get_backend().index_vacancies(ids)
+
+
+def remove_vacancies(ids):
+    get_backend().remove_vacancies(ids)
+
+
+def rebuild_index():
+    get_backend().rebuild()
@@ -1,10 +1,35 @@
+import copy
+
 from rest_framework import serializers
+from django.db.models import Prefetch
 from .models import Company, Vacancy, Resume, Application, FavoriteVacancy
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
 
 
+class EagerLoadingMixin:
+    """
+    Lets a serializer declare the relations it renders so views can fetch
+    them up front via ``setup_eager_loading`` instead of one query per row.
+    """
+
+    select_related_fields = ()
+    prefetch_related_fields = ()
+
+    @classmethod
+    def get_prefetch_related_fields(cls):
+        return cls.prefetch_related_fields
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        if cls.select_related_fields:
+            queryset = queryset.select_related(*cls.select_related_fields)
+        prefetches = cls.get_prefetch_related_fields()
+        if prefetches:
+            queryset = queryset.prefetch_related(*prefetches)
+        return queryset
+
 
 class CompanySerializer(serializers.ModelSerializer):
     class Meta:
@@ -12,7 +37,7 @@ class CompanySerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class VacancySerializer(serializers.ModelSerializer):
+class VacancySerializer(EagerLoadingMixin, serializers.ModelSerializer):
     company = CompanySerializer(read_only=True)
     company_id = serializers.PrimaryKeyRelatedField(
         queryset=Company.objects.all(), source="company", write_only=True
@@ -46,12 +71,110 @@ class VacancySerializer(serializers.ModelSerializer):
             "salary_display",
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        return queryset.for_listing()
+
     def get_salary_display(self, obj):
         return obj.salary_display()
 
 
-class ResumeSerializer(serializers.ModelSerializer):
+class VacancyValuesSerializer:
+    """
+    Read-only twin of ``VacancySerializer`` for listings. Rows come from one
+    flat ``values()`` query (no model instances), companies are fetched once
+    per batch of rows, and output dicts are built directly with
+    ``salary_display`` computed from the row. Decimals, datetimes and the
+    logo still go through ``VacancySerializer``'s own field objects, so the
+    rendered JSON is byte-identical. ``include_company=False`` leaves out the
+    nested company for lists that are already scoped to one.
+    """
+
+    def __init__(self, context=None, include_company=True):
+        self.context = context or {}
+        template = VacancySerializer(context=self.context)
+        self.plan = [
+            self._plan(name, field)
+            for name, field in template.fields.items()
+            if not field.write_only and (include_company or name != "company")
+        ]
+        self.company_plan = [self._plan(name, field) for name, field in template.fields["company"].fields.items()]
+        self.logo_field = Company._meta.get_field("logo")
+        self.companies = {}
+        self.include_company = include_company
+        self.value_fields = [key for _, key, _ in self.plan if key] + ["company_id"]
+
+    @staticmethod
+    def _plan(name, field):
+        if name in ("company", "salary_display"):
+            return name, None, None
+        if name == "author":
+            # StringRelatedField renders str(user), which is the username.
+            return name, "author__username", None
+        if isinstance(field, serializers.DateTimeField) and not hasattr(field, "timezone"):
+            # Resolve the current timezone once instead of once per value.
+            field = copy.deepcopy(field)
+            field.timezone = field.default_timezone()
+        if isinstance(field, (serializers.DecimalField, serializers.DateTimeField, serializers.FileField)):
+            return name, name, field.to_representation
+        return name, name, None
+
+    def values(self, queryset, *extra):
+        """``queryset.values()`` with every column the output needs, plus ``extra``."""
+        names = self.value_fields + [name for name in extra if name not in self.value_fields]
+        return queryset.values(*names)
+
+    def represent(self, rows):
+        """Render a batch of ``values()`` rows, loading their companies in one query."""
+        companies = self._missing_companies(rows)
+        if companies is not None:
+            for company in companies:
+                self.companies[company["id"]] = self._company(company)
+        return [self.to_representation(row) for row in rows]
+
+    async def arepresent(self, rows):
+        """``represent`` for async views."""
+        companies = self._missing_companies(rows)
+        if companies is not None:
+            async for company in companies:
+                self.companies[company["id"]] = self._company(company)
+        return [self.to_representation(row) for row in rows]
+
+    def _missing_companies(self, rows):
+        missing = {row["company_id"] for row in rows} - self.companies.keys()
+        if not missing or not self.include_company:
+            return None
+        names = [name for name, _, _ in self.company_plan]
+        return Company.objects.filter(id__in=missing).values(*names)
+
+    def to_representation(self, row):
+        data = {}
+        for name, key, convert in self.plan:
+            if name == "company":
+                data[name] = self.companies[row["company_id"]]
+            elif name == "salary_display":
+                data[name] = Vacancy.format_salary(
+                    row["show_salary"], row["salary_from"], row["salary_to"], row["currency"]
+                )
+            else:
+                value = row[key]
+                data[name] = convert(value) if convert is not None and value is not None else value
+        return data
+
+    def _company(self, row):
+        data = {}
+        for name, key, convert in self.company_plan:
+            value = row[key]
+            if name == "logo":
+                # DRF renders a FieldFile; values() hands back the stored name.
+                value = self.logo_field.attr_class(None, self.logo_field, value) if value else None
+            data[name] = convert(value) if convert is not None and value is not None else value
+        return data
+
+
+class ResumeSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     user = serializers.StringRelatedField(read_only=True)
+    select_related_fields = ("user",)
 
     class Meta:
         model = Resume
@@ -77,13 +200,14 @@ class ResumeSerializer(serializers.ModelSerializer):
 
 
 
-class ApplicationSerializer(serializers.ModelSerializer):
+class ApplicationSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     applicant = serializers.StringRelatedField(read_only=True)
     vacancy = serializers.StringRelatedField(read_only=True)
     resume = ResumeSerializer(read_only=True)
     resume_id = serializers.PrimaryKeyRelatedField(
         queryset=Resume.objects.all(), source="resume", write_only=True, required=False
     )
+    select_related_fields = ("applicant", "vacancy__company", "resume__user")
 
     class Meta:
         model = Application
@@ -116,29 +240,41 @@ class FavoriteToggleResponseSerializer(serializers.Serializer):
     message = serializers.CharField()
 
 
-class CompanyWithVacanciesSerializer(serializers.ModelSerializer):
-    vacancies = VacancySerializer(many=True, read_only=True)
+class CompanyStatsSerializer(serializers.Serializer):
+    active_vacancies = serializers.IntegerField()
+    total_views = serializers.IntegerField()
+    latest_posted_at = serializers.DateTimeField(allow_null=True)
+
+
+class CompanyProfileSerializer(serializers.ModelSerializer):
+    """Expects a company from ``Company.objects.with_vacancy_stats()``."""
+
+    stats = CompanyStatsSerializer(source="*", read_only=True)
 
     class Meta:
         model = Company
-        fields = ["id", "name", "logo", "description", "website", "vacancies"]
+        fields = ["id", "name", "logo", "description", "website", "stats"]
 
 
-class EmployerProfileSerializer(serializers.ModelSerializer):
+class EmployerProfileSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     vacancies = VacancySerializer(many=True, read_only=True)
-    applications = serializers.SerializerMethodField()
+    application_counts = serializers.SerializerMethodField()
+
+    @classmethod
+    def get_prefetch_related_fields(cls):
+        return [Prefetch("vacancies", queryset=Vacancy.objects.for_listing())]
 
     class Meta:
         model = User
-        fields = ["id", "username", "email", "role", "vacancies", "applications"]
+        fields = ["id", "username", "email", "role", "vacancies", "application_counts"]
 
-    def get_applications(self, obj):
-        qs = Application.objects.filter(vacancy__author=obj)
-        return ApplicationSerializer(qs, many=True).data
+    def get_application_counts(self, obj):
+        return Application.objects.for_employer(obj).status_counts()
 
 
-class SeekerProfileSerializer(serializers.ModelSerializer):
+class SeekerProfileSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     resume = ResumeSerializer(read_only=True)
+    select_related_fields = ("resume",)
 
     class Meta:
         model = User
@@ -155,11 +291,79 @@ class ResumeShortSerializer(serializers.ModelSerializer):
         return obj.file.url if obj.file else None
 
 
-class ApplicationCompactSerializer(serializers.ModelSerializer):
+class ApplicationCompactSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     vacancy_id = serializers.IntegerField(source="vacancy.id", read_only=True)
     vacancy_title = serializers.CharField(source="vacancy.title", read_only=True)
     resume = ResumeShortSerializer(read_only=True)
+    select_related_fields = ("vacancy", "resume")
 
     class Meta:
         model = Application
         fields = ["id", "vacancy_id", "vacancy_title", "status", "updated_at", "resume"]
+
+
+class BulkApplicationStatusSerializer(serializers.Serializer):
+    status = serializers.ChoiceField(choices=sorted(Application.TRANSITIONS))
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False, allow_empty=False, max_length=1000
+    )
+    vacancy = serializers.IntegerField(required=False, min_value=1)
+    current_status = serializers.ChoiceField(choices=Application.STATUS_CHOICES, required=False)
+
+    def validate(self, data):
+        if "ids" in data and "vacancy" in data:
+            raise serializers.ValidationError("Pass either ids or vacancy, not both.")
+        if "ids" not in data and "vacancy" not in data:
+            raise serializers.ValidationError("Pass ids or a vacancy to select applications.")
+        if "current_status" in data and "vacancy" not in data:
+            raise serializers.ValidationError({"current_status": "Only allowed together with vacancy."})
+        return data
+
+
+class BulkApplicationStatusResultSerializer(serializers.Serializer):
+    updated = serializers.IntegerField()
+    results = serializers.ListField(child=serializers.DictField())
+
+
+class ResumeMatchSerializer(serializers.Serializer):
+    score = serializers.FloatField()
+    resume = ResumeSerializer()
+
+
+class VacancyMatchSerializer(serializers.Serializer):
+    score = serializers.FloatField()
+    vacancy = VacancySerializer()
+
+
+class VacancyImportSerializer(serializers.ModelSerializer):
+    """
+    One row of a bulk import. ``company_id`` is a plain integer here; the
+    importer checks a whole chunk's ids with one query instead of one per row.
+    """
+
+    company_id = serializers.IntegerField(min_value=1)
+
+    class Meta:
+        model = Vacancy
+        fields = [
+            "title",
+            "company_id",
+            "location",
+            "description",
+            "responsibilities",
+            "requirements",
+            "salary_from",
+            "salary_to",
+            "currency",
+            "show_salary",
+            "employment_type",
+            "work_format",
+            "experience_required",
+            "is_active",
+        ]
+
+
+class VacancyImportResultSerializer(serializers.Serializer):
+    created = serializers.IntegerField()
+    error_count = serializers.IntegerField()
+    errors = serializers.ListField(child=serializers.DictField())
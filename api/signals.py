@@ -0,0 +1,62 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import matching, search
+from .cache import bump_versions
+from .models import Company, Resume, Vacancy
+from .skills import sync_resume_skills
+
+
+@receiver(post_save, sender=Vacancy)
+def index_saved_vacancy(sender, instance, **kwargs):
+    search.index_vacancies([instance.pk])
+
+
+@receiver(post_delete, sender=Vacancy)
+def unindex_deleted_vacancy(sender, instance, **kwargs):
+    search.remove_vacancies([instance.pk])
+
+
+@receiver(post_save, sender=Company)
+def reindex_company_vacancies(sender, instance, created, **kwargs):
+    if not created:
+        search.index_vacancies(instance.vacancies.values_list("id", flat=True))
+
+
+@receiver(post_save, sender=Vacancy)
+@receiver(post_delete, sender=Vacancy)
+def invalidate_vacancy_responses(sender, instance, **kwargs):
+    bump_versions(["vacancies", f"vacancy:{instance.pk}", f"company:{instance.company_id}"])
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+def invalidate_company_responses(sender, instance, **kwargs):
+    vacancy_ids = Vacancy.objects.filter(company_id=instance.pk).values_list("id", flat=True)
+    bump_versions(
+        ["vacancies", f"company:{instance.pk}"] + [f"vacancy:{pk}" for pk in vacancy_ids]
+    )
+
+
+@receiver(post_save, sender=Resume)
+def sync_saved_resume_skills(sender, instance, update_fields=None, **kwargs):
+    if update_fields is None or "skills" in update_fields:
+        sync_resume_skills(instance)
+
+
+@receiver(post_save, sender=Vacancy)
+def refresh_saved_vacancy_matches(sender, instance, update_fields=None, **kwargs):
+    if settings.MATCHING["RECOMPUTE_ON_SAVE"] and matching.affects_matches(
+        update_fields, matching.VACANCY_FEATURE_FIELDS
+    ):
+        transaction.on_commit(lambda: matching.refresh_vacancy_matches([instance.pk]))
+
+
+@receiver(post_save, sender=Resume)
+def refresh_saved_resume_matches(sender, instance, update_fields=None, **kwargs):
+    if settings.MATCHING["RECOMPUTE_ON_SAVE"] and matching.affects_matches(
+        update_fields, matching.RESUME_FEATURE_FIELDS
+    ):
+        transaction.on_commit(lambda: matching.refresh_resume_matches(instance.pk))
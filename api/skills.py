@@ -0,0 +1,52 @@
+import re
+
+from django.db.models import Q
+
+from .models import ResumeSkill, Skill
+
+SEPARATOR_RE = re.compile(r"[,;\n]+")
+WHITESPACE_RE = re.compile(r"\s+")
+MAX_SKILL_LENGTH = Skill._meta.get_field("name").max_length
+
+
+def parse_skills(text):
+    """Split a free-text skills string into unique normalized skill names."""
+    names = []
+    for part in SEPARATOR_RE.split(text or ""):
+        name = WHITESPACE_RE.sub(" ", part).strip().lower()[:MAX_SKILL_LENGTH]
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def sync_resume_skills(resume):
+    names = parse_skills(resume.skills)
+    skill_ids = []
+    if names:
+        Skill.objects.bulk_create([Skill(name=name) for name in names], ignore_conflicts=True)
+        skill_ids = list(Skill.objects.filter(name__in=names).values_list("id", flat=True))
+    ResumeSkill.objects.filter(resume=resume).exclude(skill_id__in=skill_ids).delete()
+    ResumeSkill.objects.bulk_create(
+        [ResumeSkill(resume=resume, skill_id=skill_id) for skill_id in skill_ids],
+        ignore_conflicts=True,
+    )
+
+
+def filter_by_skills(queryset, names, match_all=True):
+    """
+    Restrict resumes to those tagged with all (or any) of ``names``. Names
+    are resolved to ids up front, so each condition is a lookup on the
+    (skill, resume) index rather than a text comparison.
+    """
+    skill_ids = dict(Skill.objects.filter(name__in=names).values_list("name", "id"))
+    if match_all:
+        if len(skill_ids) < len(names):
+            return queryset.none()
+        for skill_id in skill_ids.values():
+            queryset = queryset.filter(skill_links__skill_id=skill_id)
+        return queryset
+    if not skill_ids:
+        return queryset.none()
+    return queryset.filter(
+        Q(id__in=ResumeSkill.objects.filter(skill_id__in=skill_ids.values()).values("resume_id"))
+    )
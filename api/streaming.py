@@ -0,0 +1,71 @@
+from django.http import StreamingHttpResponse
+
+from .renderers import FastJSONRenderer
+
+STREAM_CHUNK_SIZE = 500
+
+
+def wants_stream(request):
+    return request.query_params.get("stream") in ("1", "true")
+
+
+def encode_json(data):
+    """Same bytes the API's JSON renderer produces for ``data``."""
+    return FastJSONRenderer().render(data)
+
+
+def per_row(serializer):
+    """
+    Chunk renderer that reuses one serializer instance for every row, which
+    avoids building (and garbage-collecting) a field tree per chunk.
+    """
+    return lambda rows: [serializer.to_representation(row) for row in rows]
+
+
+def iter_json_array(queryset, represent, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Yield ``queryset`` as a JSON array, ``chunk_size`` rows at a time;
+    ``represent`` turns a list of rows into a list of dicts. ``iterator()``
+    reads through a server-side cursor where the database has one, so
+    neither the rows nor the encoded output are ever held in full.
+    """
+    comma = encode_json([0, 0])[2:-2]
+    yield b"["
+    chunk = []
+    first = True
+    for row in queryset.iterator(chunk_size=chunk_size):
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield (b"" if first else comma) + encode_json(represent(chunk))[1:-1]
+            first = False
+            chunk = []
+    if chunk:
+        yield (b"" if first else comma) + encode_json(represent(chunk))[1:-1]
+    yield b"]"
+
+
+def stream_object_with_array(head, key, array):
+    """Stream ``head`` (a dict) with one more key whose value is the streamed ``array``."""
+    yield encode_json(head)[:-1] + encode_json([0, 0])[2:-2] + encode_json({key: 0})[1:-2]
+    yield from array
+    yield b"}"
+
+
+def streaming_json_response(content):
+    return StreamingHttpResponse(content, content_type="application/json")
+
+
+class StreamingListMixin:
+    """
+    ``?stream=1`` on a list view returns every matching row as one streamed
+    JSON array, in the paginator's order, instead of a page.
+    """
+
+    def list(self, request, *args, **kwargs):
+        if not wants_stream(request):
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.paginator is not None:
+            queryset = queryset.order_by(*self.paginator.get_ordering(request, queryset, self))
+
+        return streaming_json_response(iter_json_array(queryset, per_row(self.get_serializer())))
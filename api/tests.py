@@ -1,3 +1,712 @@
-from django.test import TestCase
+from datetime import datetime, timedelta
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache, caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import OperationalError
+from django.db.models import QuerySet
+from django.test import AsyncClient, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient, APIRequestFactory
+
+from accounts.models import CustomUser
+from accounts.tokens import RoleRefreshToken
+from .models import Application, Company, FavoriteVacancy, Resume, Vacancy, VacancyMatch
+from . import matching
+from .search import search_vacancies
+from .checks import check_shared_caches
+from .cache import get_versions
+from .counters import CacheViewCounterBackend, get_view_counter
+from .renderers import FastJSONRenderer
+from .serializers import VacancySerializer, VacancyValuesSerializer
+from .management.commands import explain_vacancy_queries
+
+
+# Cheap password hashing: the real iteration count costs half a second per user.
+@override_settings(PASSWORD_HASHING={"ITERATIONS": 1000, "WORKERS": 0, "MAX_PENDING": 64})
+class APITestCase(TestCase):
+    """An employer, a seeker and a company to hang vacancies on."""
+
+    password = "pw-12345678"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employer = CustomUser.objects.create_user("employer", password=cls.password, role="employer")
+        cls.seeker = CustomUser.objects.create_user("seeker", password=cls.password, role="seeker")
+        cls.company = Company.objects.create(name="Acme")
+
+    def setUp(self):
+        # Cached responses, counters and throttle state would leak between tests.
+        for backend in caches.all():
+            backend.clear()
+        self.client = APIClient()
+
+    @classmethod
+    def create_vacancies(cls, count, company=None, author=None, **fields):
+        return Vacancy.objects.bulk_create([
+            Vacancy(
+                title=f"Python developer {i}",
+                company=company or cls.company,
+                location="Dushanbe",
+                description="Backend work",
+                employment_type="full_time",
+                work_format="remote",
+                salary_from=1000 + i,
+                author=author or cls.employer,
+                **fields,
+            )
+            for i in range(count)
+        ])
+
+
+class KeysetPaginationTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.create_vacancies(25)
+        # Groups of three share a timestamp, so only the id breaks the tie.
+        now = timezone.now()
+        for index, pk in enumerate(Vacancy.objects.order_by("id").values_list("id", flat=True)):
+            Vacancy.objects.filter(pk=pk).update(created_at=now - timedelta(hours=index // 3))
+
+    def walk(self, url, link):
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            pages.append([row["id"] for row in response.json()["results"]])
+            url = response.json()[link]
+        return pages
+
+    def test_forward_walk_visits_every_row_once_in_order(self):
+        pages = self.walk("/api/vacancies/?page_size=7", "next")
+        seen = [pk for page in pages for pk in page]
+        expected = list(Vacancy.objects.order_by("-created_at", "-id").values_list("id", flat=True))
+        self.assertEqual(seen, expected)
+        self.assertEqual([len(page) for page in pages], [7, 7, 7, 4])
+
+    def test_previous_link_returns_the_same_pages(self):
+        forward = self.client.get("/api/vacancies/?page_size=7").json()
+        second = self.client.get(forward["next"]).json()
+        third = self.client.get(second["next"]).json()
+        back = self.client.get(third["previous"]).json()
+        self.assertEqual([row["id"] for row in back["results"]], [row["id"] for row in second["results"]])
+        first = self.client.get(back["previous"]).json()
+        self.assertEqual([row["id"] for row in first["results"]], [row["id"] for row in forward["results"]])
+        self.assertIsNone(first["previous"])
+
+    def test_invalid_cursor_is_404(self):
+        for cursor in ("zzz", "eyJwIjpbMV19"):  # garbage, and a position of the wrong length
+            self.assertEqual(self.client.get(f"/api/vacancies/?cursor={cursor}").status_code, 404)
+
+
+@override_settings(TIME_ZONE="Asia/Dushanbe")
+class DateFilterTests(APITestCase):
+    """Days are local (UTC+5) days, not UTC ones."""
+
+    def titles(self, query):
+        response = self.client.get(f"/api/vacancies/?{query}")
+        self.assertEqual(response.status_code, 200)
+        return sorted(vacancy["title"] for vacancy in response.json()["results"])
+
+    def test_days_start_at_local_midnight(self):
+        late, early = self.create_vacancies(2)
+        local = timezone.get_current_timezone()
+        Vacancy.objects.filter(pk=late.pk).update(created_at=timezone.make_aware(datetime(2024, 3, 10, 23, 59), local))
+        Vacancy.objects.filter(pk=early.pk).update(created_at=timezone.make_aware(datetime(2024, 3, 11, 0, 1), local))
+        # Both fall on 2024-03-10 in UTC.
+        self.assertEqual(self.titles("d=2024-03-10"), [late.title])
+        self.assertEqual(self.titles("d=2024-03-11"), [early.title])
+        self.assertEqual(self.titles("date_to=2024-03-10"), [late.title])
+        self.assertEqual(self.titles("date_from=2024-03-11"), [early.title])
+        self.assertEqual(self.titles("date_from=2024-03-10&date_to=2024-03-11"), [late.title, early.title])
+
+    def test_malformed_dates_are_rejected(self):
+        for query in ("d=2020-13-01", "date_from=2020-02-30", "date_to=yesterday", "d=20200101"):
+            with self.subTest(query):
+                response = self.client.get(f"/api/vacancies/?{query}")
+                self.assertEqual(response.status_code, 400)
+                self.assertIn(query.split("=")[0], response.json())
+
+
+class ApplicationBulkStatusTests(APITestCase):
+    url = "/api/applications/bulk-status/"
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        vacancies = cls.create_vacancies(4)
+        cls.applications = {
+            status: Application.objects.create(applicant=cls.seeker, vacancy=vacancy, status=status)
+            for status, vacancy in zip(("pending", "reviewed", "accepted", "rejected"), vacancies)
+        }
+        rival = CustomUser.objects.create_user("rival", password=cls.password, role="employer")
+        foreign = cls.create_vacancies(1, author=rival)[0]
+        cls.foreign = Application.objects.create(applicant=cls.seeker, vacancy=foreign)
+
+    def test_each_application_reports_its_own_outcome(self):
+        self.client.force_authenticate(self.employer)
+        ids = [self.applications[s].pk for s in ("pending", "reviewed", "accepted", "rejected")]
+        payload = {"status": "accepted", "ids": ids + [self.foreign.pk, 999999]}
+        response = self.client.post(self.url, payload, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["updated"], 2)
+        self.assertEqual(
+            [row["result"] for row in response.data["results"]],
+            ["updated", "updated", "unchanged", "invalid_transition", "not_found", "not_found"],
+        )
+        statuses = dict(Application.objects.values_list("id", "status"))
+        self.assertEqual([statuses[pk] for pk in ids], ["accepted", "accepted", "accepted", "rejected"])
+        self.assertEqual(statuses[self.foreign.pk], "pending")
+
+    def test_reviewed_is_only_reachable_from_pending(self):
+        self.client.force_authenticate(self.employer)
+        ids = [self.applications["pending"].pk, self.applications["accepted"].pk]
+        response = self.client.post(self.url, {"status": "reviewed", "ids": ids}, format="json")
+        self.assertEqual(response.data["updated"], 1)
+        self.assertEqual([row["result"] for row in response.data["results"]], ["updated", "invalid_transition"])
+
+    def test_seekers_cannot_change_status(self):
+        self.client.force_authenticate(self.seeker)
+        payload = {"status": "accepted", "ids": [self.applications["pending"].pk]}
+        response = self.client.post(self.url, payload, format="json")
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(Application.objects.get(pk=self.applications["pending"].pk).status, "pending")
+
+
+class ApplicationInboxTests(APITestCase):
+    url = "/api/my-account/applications/"
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.first, cls.second = cls.create_vacancies(2)
+        rival = CustomUser.objects.create_user("rival", password=cls.password, role="employer")
+        foreign = cls.create_vacancies(1, author=rival)[0]
+        applicants = [
+            CustomUser.objects.create_user(f"applicant{i}", password=cls.password, role="seeker") for i in range(3)
+        ]
+        for vacancy, applicant, status in (
+            (cls.first, applicants[0], "pending"),
+            (cls.first, applicants[1], "rejected"),
+            (cls.second, applicants[0], "pending"),
+            (cls.second, applicants[2], "accepted"),
+            (foreign, applicants[1], "pending"),
+        ):
+            Application.objects.create(applicant=applicant, vacancy=vacancy, status=status)
+
+    def test_counts_ignore_status_but_follow_the_vacancy(self):
+        self.client.force_authenticate(self.employer)
+        data = self.client.get(f"{self.url}?status=pending").json()
+        self.assertEqual(len(data["results"]), 2)
+        self.assertEqual(data["counts"], {"pending": 2, "reviewed": 0, "accepted": 1, "rejected": 1, "total": 4})
+
+        data = self.client.get(f"{self.url}?vacancy={self.first.pk}&status=accepted").json()
+        self.assertEqual(data["results"], [])
+        self.assertEqual(data["counts"], {"pending": 1, "reviewed": 0, "accepted": 0, "rejected": 1, "total": 2})
+
+    def test_seekers_have_no_inbox(self):
+        self.client.force_authenticate(self.seeker)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+
+class FavoriteToggleTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.vacancy = cls.create_vacancies(1)[0]
+        cls.url = f"/api/vacancies/{cls.vacancy.pk}/favorite/"
+
+    def test_toggle_adds_then_removes(self):
+        self.client.force_authenticate(self.seeker)
+        self.assertEqual(self.client.post(self.url).status_code, 201)
+        self.assertTrue(FavoriteVacancy.objects.filter(user=self.seeker, vacancy=self.vacancy).exists())
+        self.assertEqual(self.client.post(self.url).status_code, 200)
+        self.assertFalse(FavoriteVacancy.objects.exists())
+
+    def test_insert_losing_a_race_still_succeeds(self):
+        # Another request inserts the same pair between our delete and insert.
+        FavoriteVacancy.objects.create(user=self.seeker, vacancy=self.vacancy)
+        self.client.force_authenticate(self.seeker)
+        with mock.patch.object(QuerySet, "delete", return_value=(0, {})):
+            response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(FavoriteVacancy.objects.count(), 1)
+
+    def test_employers_cannot_favorite(self):
+        self.client.force_authenticate(self.employer)
+        self.assertEqual(self.client.post(self.url).status_code, 403)
+
+
+class AsyncFavoriteToggleTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.vacancy = cls.create_vacancies(1)[0]
+
+    def setUp(self):
+        super().setUp()
+        self.access_token = str(RoleRefreshToken.for_user(self.seeker).access_token)
+
+    async def test_toggle_is_throttled_per_user(self):
+        client = AsyncClient()
+        url = f"/api/async/vacancies/{self.vacancy.pk}/favorite/"
+        headers = {"Authorization": f"Bearer {self.access_token}"}
+        statuses = [(await client.post(url, headers=headers)).status_code for _ in range(21)]
+        self.assertEqual(statuses, [201, 200] * 10 + [429])
+
+
+# SQLite checks foreign keys at commit, which TestCase never reaches.
+@override_settings(PASSWORD_HASHING={"ITERATIONS": 1000, "WORKERS": 0, "MAX_PENDING": 64})
+class FavoriteToggleMissingVacancyTests(TransactionTestCase):
+    def test_missing_vacancy_is_404(self):
+        seeker = CustomUser.objects.create_user("seeker", password="pw-12345678", role="seeker")
+        client = APIClient()
+        client.force_authenticate(seeker)
+        self.assertEqual(client.post("/api/vacancies/999999/favorite/").status_code, 404)
+        self.assertFalse(FavoriteVacancy.objects.exists())
+
+
+class QueryCountTests(APITestCase):
+    """The main read endpoints must cost the same number of queries at any size."""
+
+    def assertConstantQueries(self, expected, url, grow, sizes=(2, 20), **headers):
+        """
+        Call ``grow(n)`` to bring the data up to each size in turn, then
+        request ``url`` and require exactly ``expected`` queries each time.
+        """
+        for size in sizes:
+            grow(size)
+            cache.clear()
+            with self.subTest(size=size), self.assertNumQueries(expected):
+                response = self.client.get(url, headers=headers)
+            self.assertEqual(response.status_code, 200)
+
+    def bearer(self, user):
+        return {"Authorization": f"Bearer {RoleRefreshToken.for_user(user).access_token}"}
+
+    def fill_vacancies(self, size):
+        self.create_vacancies(size - Vacancy.objects.count())
+
+    def fill_applications(self, size):
+        for vacancy in self.create_vacancies(size - Application.objects.count()):
+            Application.objects.create(applicant=self.seeker, vacancy=vacancy)
+
+    def test_vacancy_list(self):
+        self.assertConstantQueries(3, "/api/vacancies/?page_size=50", self.fill_vacancies)
+
+    def test_company_profile(self):
+        self.assertConstantQueries(3, f"/api/companies/{self.company.pk}/profile/", self.fill_vacancies)
+
+    def test_employer_profile(self):
+        self.assertConstantQueries(3, "/api/my-account/", self.fill_applications, **self.bearer(self.employer))
+
+
+class VacancyValuesSerializerTests(APITestCase):
+    def test_renders_the_same_bytes_as_the_model_serializer(self):
+        branded = Company.objects.create(name="Brand", logo="company_logos/brand.png")
+        salaries = [
+            {"salary_from": None, "salary_to": None},
+            {"salary_from": 0, "salary_to": Decimal("2500.50")},
+            {"salary_from": Decimal("1200.00"), "salary_to": 0},
+            {"salary_from": 1000, "salary_to": 2000, "show_salary": False},
+        ]
+        for i, fields in enumerate(salaries):
+            Vacancy.objects.create(
+                title=f"Developer {i}", company=branded if i % 2 else self.company, author=self.employer,
+                location="Dushanbe", description="Line\u2028break", **fields,
+            )
+        context = {"request": APIRequestFactory().get("/api/vacancies/")}
+        queryset = Vacancy.objects.order_by("id")
+
+        expected = JSONRenderer().render(VacancySerializer(queryset.for_listing(), many=True, context=context).data)
+        serializer = VacancyValuesSerializer(context=context)
+        actual = FastJSONRenderer().render(serializer.represent(list(serializer.values(queryset))))
+        self.assertIn(b"http://testserver/media/company_logos/brand.png", expected)
+        self.assertEqual(actual, expected)
+
+
+class InactiveVacancyDetailTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.vacancy = cls.create_vacancies(1, is_active=False)[0]
+        cls.url = f"/api/vacancies/{cls.vacancy.pk}/"
+
+    def setUp(self):
+        super().setUp()
+        self.access_token = str(RoleRefreshToken.for_user(self.employer).access_token)
+        # Don't leave the author's views for the exit-time flush.
+        self.addCleanup(get_view_counter().backend.drain)
+
+    def test_only_the_author_can_read_it(self):
+        self.client.force_authenticate(self.seeker)
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+        self.client.force_authenticate(self.employer)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("X-Cache", response)
+        # Not even a 304 for someone holding the author's ETag.
+        self.client.force_authenticate(None)
+        response = self.client.get(self.url, headers={"If-None-Match": response["ETag"]})
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn("X-Cache", response)
+
+    def test_deactivation_drops_the_cached_copy(self):
+        Vacancy.objects.filter(pk=self.vacancy.pk).update(is_active=True)
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        self.vacancy.save()  # still is_active=False in memory
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+    async def test_async_detail_applies_the_same_rule(self):
+        client = AsyncClient()
+        url = f"/api/async/vacancies/{self.vacancy.pk}/"
+        self.assertEqual((await client.get(url)).status_code, 404)
+        response = await client.get(url, headers={"Authorization": f"Bearer {self.access_token}"})
+        self.assertEqual(response.status_code, 200)
+
+
+class VacancyFacetTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.create_vacancies(3)
+        cls.create_vacancies(1, is_active=False)
+        khujand = cls.create_vacancies(2)
+        Vacancy.objects.filter(pk__in=[v.pk for v in khujand]).update(location="Khujand", work_format="on_site")
+
+    def facets(self, query=""):
+        response = self.client.get(f"/api/vacancies/?facets=1&{query}")
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        counts = {
+            field: {item["value"]: item["count"] for item in items if item["count"]}
+            for field, items in data["facets"].items()
+        }
+        return data["count"], counts
+
+    def test_counts_respect_the_active_filters(self):
+        count, counts = self.facets()
+        self.assertEqual(count, 5)
+        self.assertEqual(counts["location"], {"Dushanbe": 3, "Khujand": 2})
+        self.assertEqual(counts["work_format"], {"remote": 3, "on_site": 2})
+
+        count, counts = self.facets("location=Khujand")
+        self.assertEqual(count, 2)
+        self.assertEqual(counts["location"], {"Khujand": 2})
+        self.assertEqual(counts["work_format"], {"on_site": 2})
+        self.assertEqual(counts["employment_type"], {"full_time": 2})
+
+        count, counts = self.facets("work_format=remote&salary_min=1001")
+        self.assertEqual(count, 2)
+        self.assertEqual(counts["location"], {"Dushanbe": 2})
+
+
+class ConditionalGetTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.vacancy = cls.create_vacancies(3)[0]
+
+    def test_cache_hit_answers_if_none_match_without_queries(self):
+        url = "/api/vacancies/"
+        etag = self.client.get(url)["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["X-Cache"], "HIT")
+        with self.assertNumQueries(0):
+            response = self.client.get(url, headers={"If-None-Match": '"stale"'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_list_etag_follows_company_renames_and_deletions(self):
+        url = "/api/vacancies/"
+        first = self.client.get(url)
+        self.assertNotIn("Last-Modified", first)
+        self.company.name = "Acme Renamed"
+        self.company.save()
+        cache.clear()
+        renamed = self.client.get(url, headers={"If-None-Match": first["ETag"]})
+        self.assertEqual(renamed.status_code, 200)
+        self.assertEqual(renamed.json()["results"][0]["company"]["name"], "Acme Renamed")
+        # The oldest vacancy: max(updated_at) stays the same, the count doesn't.
+        Vacancy.objects.order_by("updated_at").first().delete()
+        cache.clear()
+        self.assertEqual(self.client.get(url, headers={"If-None-Match": renamed["ETag"]}).status_code, 200)
+
+    def test_not_modified_detail_still_counts_a_view(self):
+        url = f"/api/vacancies/{self.vacancy.pk}/"
+        counter = get_view_counter()
+        # Keep the counts pending for the assertion, and don't leave them behind.
+        self.addCleanup(counter.backend.drain)
+        self.enterContext(mock.patch.multiple(counter, flush_interval=3600, flush_threshold=10**6))
+        etag = self.client.get(url)["ETag"]
+        before = counter.pending(self.vacancy.pk)
+        # Once from the cached entry, once with the cache emptied (a miss).
+        self.assertEqual(self.client.get(url, headers={"If-None-Match": etag}).status_code, 304)
+        cache.clear()
+        self.assertEqual(self.client.get(url, headers={"If-None-Match": etag}).status_code, 304)
+        self.assertEqual(counter.pending(self.vacancy.pk) - before, 2)
+
+
+class ViewCounterTests(APITestCase):
+    def test_failed_flush_keeps_the_counts_and_serves_the_page(self):
+        vacancy = self.create_vacancies(1)[0]
+        counter = get_view_counter()
+        self.addCleanup(counter.backend.drain)
+        self.enterContext(mock.patch.multiple(counter, flush_interval=3600, flush_threshold=1))
+        failing = mock.patch("api.counters.Vacancy", **{"objects.filter.side_effect": OperationalError("locked")})
+        with failing, self.assertLogs("api.counters", "ERROR"):
+            response = self.client.get(f"/api/vacancies/{vacancy.pk}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(counter.pending(vacancy.pk), 1)
+        with failing, self.assertRaises(OperationalError):
+            counter.flush()
+        self.assertEqual(counter.pending(vacancy.pk), 1)
+
+
+@override_settings(CACHES={
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "counter-tests"},
+})
+class CacheViewCounterBackendTests(TestCase):
+    def setUp(self):
+        self.backend = CacheViewCounterBackend()
+        self.backend.cache.clear()
+
+    def test_drain_returns_every_pending_pk_once(self):
+        for pk in (1, 2, 1, 3, 1):
+            self.backend.add(pk)
+        self.assertEqual(self.backend.drain(), {1: 3, 2: 1, 3: 1})
+        self.assertEqual(self.backend.drain(), {})
+        self.assertEqual(self.backend.pending(1), 0)
+
+    def test_hits_after_a_drain_are_registered_again(self):
+        self.backend.add(1)
+        self.backend.drain()
+        self.backend.add(1, 4)
+        self.assertEqual(self.backend.drain(), {1: 4})
+
+    def test_hit_between_marker_clear_and_read_is_not_lost(self):
+        self.backend.add(1)
+        cache_delete = self.backend.cache.delete
+
+        def delete(key, *args, **kwargs):
+            result = cache_delete(key, *args, **kwargs)
+            if key == self.backend._marker_key(1):
+                self.backend.add(1)  # lands after the marker is gone
+            return result
+
+        with mock.patch.object(self.backend.cache, "delete", side_effect=delete):
+            first = self.backend.drain()
+        self.assertEqual(first[1] + self.backend.drain().get(1, 0), 2)
+
+    def test_unwritten_log_entry_is_skipped_after_one_drain(self):
+        self.backend._incr(self.backend.seq_key, 1)  # a writer that died before logging its pk
+        self.backend.add(2)
+        self.assertEqual(self.backend.drain(), {})
+        self.assertEqual(self.backend.drain(), {2: 1})
+
+
+class SharedCacheCheckTests(SimpleTestCase):
+    def test_local_memory_caches_are_refused_with_several_workers(self):
+        counter = {"BACKEND": "api.counters.CacheViewCounterBackend"}
+        with override_settings(WEB_CONCURRENCY=2, VACANCY_VIEW_COUNTER=counter):
+            errors = check_shared_caches(None)
+        self.assertEqual(
+            [error.msg.split()[0] for error in errors], ["RESPONSE_CACHE", "THROTTLING", "VACANCY_VIEW_COUNTER"]
+        )
+        self.assertEqual({error.id for error in errors}, {"api.E001"})
+        with override_settings(WEB_CONCURRENCY=1, VACANCY_VIEW_COUNTER=counter):
+            self.assertEqual(check_shared_caches(None), [])
+
+    def test_shared_caches_pass(self):
+        shared = {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": "/tmp/jobsearch-check"}
+        with override_settings(
+            WEB_CONCURRENCY=2, CACHES={"default": shared, "throttling": shared},
+            VACANCY_VIEW_COUNTER={"BACKEND": "api.counters.LocalViewCounterBackend"},
+        ):
+            self.assertEqual(check_shared_caches(None), [])
+
+
+class VacancyIndexTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        explain_vacancy_queries.Command().seed(2000)
+
+    def test_no_filter_and_sort_combination_scans_or_sorts_the_table(self):
+        for filter_name, sort, queryset in explain_vacancy_queries.first_page_queries():
+            with self.subTest(f"{filter_name} / {sort}"):
+                plan = queryset.explain()
+                self.assertIsNone(explain_vacancy_queries.check_plan(filter_name, sort, plan), plan)
+
+
+class ResumeSkillFilterTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.resumes = {}
+        for name, skills in (("both", "Python, Django"), ("python", "python"), ("go", "Go")):
+            user = CustomUser.objects.create_user(name, password=cls.password, role="seeker")
+            cls.resumes[name] = Resume.objects.create(
+                user=user, full_name=name, desired_position="Developer", skills=skills
+            )
+
+    def names(self, query):
+        response = self.client.get(f"/api/resumes/?{query}")
+        self.assertEqual(response.status_code, 200)
+        return sorted(resume["full_name"] for resume in response.json()["results"])
+
+    def test_all_and_any(self):
+        self.assertEqual(self.names("skill=python,django"), ["both"])
+        self.assertEqual(self.names("skill=python,django&skill_match=all"), ["both"])
+        self.assertEqual(self.names("skill=django,go&skill_match=any"), ["both", "go"])
+        self.assertEqual(self.names("skill=python,rust"), [])
+        self.assertEqual(self.client.get("/api/resumes/?skill=go&skill_match=most").status_code, 400)
+
+    def test_tags_follow_skill_edits(self):
+        resume = self.resumes["python"]
+        resume.skills = "Django;  python"
+        resume.save()
+        self.assertEqual(self.names("skill=python,django"), ["both", "python"])
+        resume.skills = "Rust"
+        resume.save(update_fields=["skills"])
+        self.assertEqual(self.names("skill=python&skill_match=any"), ["both"])
+        self.assertEqual(self.names("skill=rust"), ["python"])
+
+
+class SearchIndexTests(APITestCase):
+    def found(self, query):
+        return list(search_vacancies(Vacancy.objects.all(), query).values_list("id", flat=True))
+
+    def test_index_follows_vacancy_changes(self):
+        vacancy = Vacancy.objects.create(
+            title="Kotlin engineer", company=self.company, author=self.employer, location="Dushanbe",
+        )
+        self.assertEqual(self.found("kotlin"), [vacancy.pk])
+        vacancy.title = "Haskell engineer"
+        vacancy.save()
+        self.assertEqual(self.found("kotlin"), [])
+        self.assertEqual(self.found("haskell"), [vacancy.pk])
+        vacancy.delete()
+        self.assertEqual(self.found("haskell engineer"), [])
+
+    def test_company_rename_reindexes_its_vacancies(self):
+        ids = [
+            Vacancy.objects.create(title=title, company=self.company, author=self.employer, location="Dushanbe").pk
+            for title in ("Tester", "Designer")
+        ]
+        self.assertEqual(sorted(self.found("acme")), ids)
+        self.company.name = "Zenith"
+        self.company.save()
+        self.assertEqual(self.found("acme"), [])
+        self.assertEqual(sorted(self.found("zenith")), ids)
+
+
+class ExpireVacanciesTests(APITestCase):
+    def test_only_vacancies_past_the_cutoff_expire(self):
+        old, older, fresh = self.create_vacancies(3)
+        now = timezone.now()
+        Vacancy.objects.filter(pk=old.pk).update(created_at=now - timedelta(days=31))
+        Vacancy.objects.filter(pk=older.pk).update(created_at=now - timedelta(days=90))
+        Vacancy.objects.filter(pk=fresh.pk).update(created_at=now - timedelta(days=29))
+        self.assertEqual(len(self.client.get("/api/vacancies/").json()["results"]), 3)
+        scopes = ["vacancies", f"vacancy:{old.pk}", f"vacancy:{fresh.pk}"]
+        before = get_versions(scopes)
+
+        call_command("expire_vacancies", days=30, batch_size=1, stdout=StringIO())
+
+        self.assertEqual(list(Vacancy.objects.filter(is_active=True).values_list("pk", flat=True)), [fresh.pk])
+        after = get_versions(scopes)
+        self.assertGreater(after[0], before[0])
+        self.assertGreater(after[1], before[1])
+        self.assertEqual(after[2], before[2])
+        # The cached first page is not served any more.
+        results = self.client.get("/api/vacancies/").json()["results"]
+        self.assertEqual([vacancy["id"] for vacancy in results], [fresh.pk])
+
+
+class VacancyImportTests(APITestCase):
+    def upload(self, content, name="vacancies.csv"):
+        self.client.force_authenticate(self.employer)
+        return self.client.post(
+            "/api/vacancies/import/", {"file": SimpleUploadedFile(name, content)}, format="multipart"
+        )
+
+    def csv(self, rows):
+        header = b"title,company_id,location,description,employment_type,work_format\n"
+        line = f"Developer,{self.company.pk},Dushanbe,{'x' * 100},full_time,remote\n".encode()
+        return header + line * rows
+
+    def test_rows_are_created(self):
+        response = self.upload(self.csv(3))
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["created"], 3)
+        self.assertEqual(Vacancy.objects.count(), 3)
+
+    def test_bad_encoding_late_in_the_file_writes_nothing(self):
+        # Several import chunks and upload chunks of good rows before the bad byte.
+        response = self.upload(self.csv(1500) + b"Caf\xe9,1,x,y,full_time,remote\n")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("file", response.data)
+        self.assertFalse(Vacancy.objects.exists())
+
+
+class MatchRefreshTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.create_vacancies(3)
+        Resume.objects.create(user=cls.seeker, full_name="S", desired_position="Python developer")
+
+    def test_saves_do_not_recompute_by_default(self):
+        vacancy = Vacancy.objects.first()
+        with self.captureOnCommitCallbacks(execute=True):
+            vacancy.title = "Go developer"
+            vacancy.save()
+        self.assertFalse(VacancyMatch.objects.exists())
+
+    def test_only_feature_fields_trigger_a_recompute(self):
+        self.assertTrue(matching.affects_matches(None, matching.VACANCY_FEATURE_FIELDS))
+        self.assertTrue(matching.affects_matches(["title", "updated_at"], matching.VACANCY_FEATURE_FIELDS))
+        self.assertFalse(matching.affects_matches(["views"], matching.VACANCY_FEATURE_FIELDS))
+        self.assertFalse(matching.affects_matches(["about"], matching.RESUME_FEATURE_FIELDS))
+
+    def test_resume_matches_come_from_stored_rows(self):
+        resume = Resume.objects.get()
+        first, second, third = Vacancy.objects.order_by("id")
+        VacancyMatch.objects.bulk_create([
+            VacancyMatch(vacancy=first, resume=resume, score=0.5),
+            VacancyMatch(vacancy=second, resume=resume, score=0.9),
+            VacancyMatch(vacancy=third, resume=resume, score=0.7),
+        ])
+        Vacancy.objects.filter(pk=third.pk).update(is_active=False)
+        self.client.force_authenticate(self.seeker)
+        # Resume, matches, and their vacancies; nothing is scored.
+        with self.assertNumQueries(3):
+            response = self.client.get(f"/api/resumes/{resume.pk}/matches/")
+        ranked = [(match["vacancy"]["id"], match["score"]) for match in response.data]
+        self.assertEqual(ranked, [(second.pk, 0.9), (first.pk, 0.5)])
+
+    def test_vacancy_matches_skip_deactivated_resumes(self):
+        vacancy = Vacancy.objects.first()
+        other = CustomUser.objects.create_user("other", password=self.password, role="seeker")
+        hidden = Resume.objects.create(user=other, full_name="Hidden", desired_position="Python developer")
+        VacancyMatch.objects.bulk_create([
+            VacancyMatch(vacancy=vacancy, resume=Resume.objects.get(user=self.seeker), score=0.5),
+            VacancyMatch(vacancy=vacancy, resume=hidden, score=0.9),
+        ])
+        Resume.objects.filter(pk=hidden.pk).update(is_active=False)
+        self.client.force_authenticate(self.employer)
+        response = self.client.get(f"/api/vacancies/{vacancy.pk}/matches/")
+        self.assertEqual([match["resume"]["full_name"] for match in response.data], ["S"])
+
+    def test_changed_since_refreshes_recent_rows_only(self):
+        since = timezone.now() - timedelta(minutes=5)
+        self.assertEqual(matching.refresh_changed_matches(since), (3, 1))
+        self.assertEqual(VacancyMatch.objects.count(), 3)
+        self.assertEqual(matching.refresh_changed_matches(timezone.now() + timedelta(minutes=1)), (0, 0))
@@ -0,0 +1,138 @@
+"""
+Per-view rate limits kept in a Django cache.
+
+A view opts in with ``throttle_scope``; ``THROTTLING["SCOPES"][scope]``
+picks the algorithm, the rate and whether clients are told apart by user
+(authenticated requests) or by IP:
+
+* ``token_bucket`` holds up to ``BURST`` requests and refills at ``RATE``,
+  so short bursts pass while the sustained rate is capped.
+* ``sliding_window`` allows ``RATE`` requests per window, estimating the
+  trailing window from the current and previous fixed-window counters: two
+  cache reads and one increment per request, however high the limit.
+
+Bucket updates are serialized per process; with a cache shared between
+processes concurrent requests may occasionally both take the last token.
+"""
+import logging
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.throttling import BaseThrottle
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "throttle"
+DURATIONS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+_bucket_lock = threading.Lock()
+
+
+def get_cache():
+    return caches[settings.THROTTLING["CACHE"]]
+
+
+def parse_rate(rate):
+    """``"10/min"`` -> ``(10, 60)``; like DRF, only the unit's first letter counts."""
+    num, period = rate.split("/")
+    return int(num), DURATIONS[period[0]]
+
+
+def _incr(cache, key, timeout):
+    if not cache.add(key, 1, timeout=timeout):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, timeout=timeout)
+
+
+class TokenBucket:
+    def __init__(self, rate, burst=None):
+        num, duration = parse_rate(rate)
+        self.capacity = burst or num
+        self.refill = num / duration
+        self.timeout = math.ceil(self.capacity / self.refill)
+
+    def consume(self, cache, key, now):
+        """Take a token for ``key``; returns None if one was available, else the seconds until one is."""
+        with _bucket_lock:
+            tokens, stamp = cache.get(key) or (self.capacity, now)
+            tokens = min(self.capacity, tokens + (now - stamp) * self.refill)
+            if tokens < 1:
+                return (1 - tokens) / self.refill
+            cache.set(key, (tokens - 1, now), timeout=self.timeout)
+        return None
+
+
+class SlidingWindow:
+    def __init__(self, rate):
+        self.limit, self.window = parse_rate(rate)
+
+    def consume(self, cache, key, now):
+        """Count a request for ``key``; returns None if it is within the limit, else the seconds to wait."""
+        index, offset = divmod(now, self.window)
+        current_key = f"{key}:{int(index)}"
+        previous_key = f"{key}:{int(index) - 1}"
+        counts = cache.get_many([current_key, previous_key])
+        current = counts.get(current_key, 0)
+        previous = counts.get(previous_key, 0)
+        elapsed = offset / self.window
+        if previous * (1 - elapsed) + current + 1 > self.limit:
+            if previous and current + 1 <= self.limit:
+                # When enough of the previous window has slid out.
+                return max(0, (1 - (self.limit - current - 1) / previous - elapsed) * self.window)
+            return (1 - elapsed) * self.window
+        _incr(cache, current_key, timeout=2 * self.window)
+        return None
+
+
+ALGORITHMS = {
+    "token_bucket": lambda config: TokenBucket(config["RATE"], config.get("BURST")),
+    "sliding_window": lambda config: SlidingWindow(config["RATE"]),
+}
+
+
+def _rejections_key(scope):
+    return f"{KEY_PREFIX}:rejected:{scope}"
+
+
+def record_rejection(scope, ident):
+    _incr(get_cache(), _rejections_key(scope), timeout=None)
+    logger.info("Throttled %s request from %s", scope, ident)
+
+
+def get_rejection_stats():
+    scopes = list(settings.THROTTLING["SCOPES"])
+    values = get_cache().get_many([_rejections_key(scope) for scope in scopes])
+    return {scope: values.get(_rejections_key(scope), 0) for scope in scopes}
+
+
+def reset_rejection_stats():
+    get_cache().delete_many([_rejections_key(scope) for scope in settings.THROTTLING["SCOPES"]])
+
+
+class ScopedThrottle(BaseThrottle):
+    """Applies the view's ``throttle_scope`` from ``THROTTLING``; views without one aren't limited."""
+
+    def allow_request(self, request, view):
+        scope = getattr(view, "throttle_scope", None)
+        config = settings.THROTTLING["SCOPES"].get(scope)
+        if not settings.THROTTLING["ENABLED"] or config is None:
+            return True
+
+        if config.get("KEY", "ip") == "user" and request.user.is_authenticated:
+            ident = f"user:{request.user.pk}"
+        else:
+            ident = f"ip:{self.get_ident(request)}"
+        limiter = ALGORITHMS[config["ALGORITHM"]](config)
+        self.delay = limiter.consume(get_cache(), f"{KEY_PREFIX}:{scope}:{ident}", time.time())
+        if self.delay is not None:
+            record_rejection(scope, ident)
+            return False
+        return True
+
+    def wait(self):
+        return self.delay
@@ -2,27 +2,48 @@ from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import (
     VacancyListCreateView,
+    VacancyImportView,
+    VacancyExportView,
     VacancyRetrieveUpdateDeleteView,
     ResumeListCreateView,
     ResumeRetrieveUpdateDeleteView,
     ApplicationCreateView,
+    ApplicationBulkStatusView,
     FavoriteVacancyToggleView,
+    FavoriteStatusView,
     CompanyDetailWithVacanciesView,
     UserProfileView,
+    EmployerApplicationInboxView,
+    VacancyMatchesView,
+    ResumeMatchesView,
 )
+from . import async_views
 
 
 urlpatterns = [
     path("vacancies/", VacancyListCreateView.as_view(), name="vacancy-list-create"),
+    path("vacancies/import/", VacancyImportView.as_view(), name="vacancy-import"),
+    path("vacancies/export/", VacancyExportView.as_view(), name="vacancy-export"),
     path("vacancies/<int:pk>/", VacancyRetrieveUpdateDeleteView.as_view(), name="vacancy-detail"),
+    path("vacancies/<int:pk>/matches/", VacancyMatchesView.as_view(), name="vacancy-matches"),
 
     path("resumes/", ResumeListCreateView.as_view(), name="resume-list-create"),
     path("resumes/<int:pk>/", ResumeRetrieveUpdateDeleteView.as_view(), name="resume-detail"),
+    path("resumes/<int:pk>/matches/", ResumeMatchesView.as_view(), name="resume-matches"),
 
     path("vacancies/<int:vacancy_id>/apply/", ApplicationCreateView.as_view(), name="application-create"),
+    path("applications/bulk-status/", ApplicationBulkStatusView.as_view(), name="application-bulk-status"),
 
     path("vacancies/<int:vacancy_id>/favorite/", FavoriteVacancyToggleView.as_view(), name="favorite-toggle"),
+    path("favorites/status/", FavoriteStatusView.as_view(), name="favorite-status"),
 
     path("companies/<int:pk>/profile/", CompanyDetailWithVacanciesView.as_view(), name="company-profile"),
     path("my-account/", UserProfileView.as_view(), name="user-profile"),
+    path("my-account/applications/", EmployerApplicationInboxView.as_view(), name="employer-application-inbox"),
+
+    # Async variants for ASGI servers (see api.async_views).
+    path("async/vacancies/", async_views.vacancy_list, name="async-vacancy-list"),
+    path("async/vacancies/<int:pk>/", async_views.vacancy_detail, name="async-vacancy-detail"),
+    path("async/vacancies/<int:vacancy_id>/favorite/", async_views.favorite_toggle, name="async-favorite-toggle"),
+    path("async/companies/<int:pk>/profile/", async_views.company_profile, name="async-company-profile"),
 ]
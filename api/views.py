@@ -1,12 +1,33 @@
-from datetime import datetime
+import codecs
+
 from django.shortcuts import get_object_or_404
+from django.http import StreamingHttpResponse
+from django.contrib.auth import get_user_model
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Max, Prefetch
+from django.utils import timezone
 from rest_framework import generics, status
 from rest_framework.views import APIView
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 from .models import Company
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
-from rest_framework.exceptions import PermissionDenied
-from .models import Vacancy, Resume, Application, FavoriteVacancy
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
+from .models import Vacancy, Resume, Application, FavoriteVacancy, VacancyMatch
+from .pagination import VacancyCursorPagination, ResumeCursorPagination, ApplicationCursorPagination
+from .search import search_vacancies
+from .filters import filter_created_between, filter_vacancies, parse_id_list, vacancy_ordering
+from .facets import cached_facets
+from .streaming import (
+    StreamingListMixin, iter_json_array, stream_object_with_array, streaming_json_response, wants_stream,
+)
+from .bulk import FORMATS, check_encoding, export_vacancies, guess_format, import_vacancies
+from .cache import AnonymousResponseCacheMixin, normalized_params
+from .counters import get_view_counter
+from .skills import parse_skills, filter_by_skills
+from .matching import top_k
+from .conditional import ConditionalGetMixin, DetailConditionalGetMixin, ListConditionalGetMixin
 
 from rest_framework import viewsets
 
@@ -16,14 +37,76 @@ from .serializers import (
     ResumeSerializer, 
     ApplicationSerializer,
     FavoriteToggleResponseSerializer,
-    CompanyWithVacanciesSerializer,
+    CompanyProfileSerializer,
     EmployerProfileSerializer,
     SeekerProfileSerializer,
+    BulkApplicationStatusSerializer,
+    BulkApplicationStatusResultSerializer,
+    ApplicationCompactSerializer,
+    ResumeMatchSerializer,
+    VacancyMatchSerializer,
+    VacancyImportResultSerializer,
+    VacancyValuesSerializer,
 )
 
-class CompanyDetailWithVacanciesView(generics.RetrieveAPIView):
-    queryset = Company.objects.all()
-    serializer_class = CompanyWithVacanciesSerializer
+User = get_user_model()
+
+
+class EagerLoadingViewMixin:
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        return self.get_serializer_class().setup_eager_loading(queryset)
+
+
+class CompanyDetailWithVacanciesView(AnonymousResponseCacheMixin, ConditionalGetMixin, generics.RetrieveAPIView):
+    """
+    Company fields and vacancy stats (one aggregate query), plus a cursor-
+    paginated page of its active vacancies without the nested company.
+    """
+
+    queryset = Company.objects.with_vacancy_stats()
+    serializer_class = CompanyProfileSerializer
+    pagination_class = VacancyCursorPagination
+    cache_name = "company-profile"
+
+    def get_cache_scopes(self):
+        return [f"company:{self.kwargs['pk']}"]
+
+    def get_validators(self, request):
+        rows = (
+            Company.objects.filter(pk=self.kwargs["pk"])
+            .values("updated_at")
+            .annotate(vacancies_modified=Max("vacancies__updated_at"), vacancy_count=Count("vacancies"))
+        )
+        stats = next(iter(rows), None)
+        if stats is None:
+            return None, None
+        fingerprint = (
+            f"{self.kwargs['pk']}|{stats['updated_at']}|{stats['vacancies_modified']}|{stats['vacancy_count']}"
+            f"|{normalized_params(request)}"
+        )
+        # No Last-Modified: deleting one of the vacancies only changes the count.
+        return fingerprint, None
+
+    def retrieve(self, request, *args, **kwargs):
+        company = self.get_object()
+        data = self.get_serializer(company).data
+        vacancies = Vacancy.objects.active().filter(company=company)
+        serializer = VacancyValuesSerializer(context=self.get_serializer_context(), include_company=False)
+        ordering = self.paginator.get_ordering(request, vacancies, self)
+        rows = serializer.values(vacancies, *[field.lstrip("-") for field in ordering])
+
+        if wants_stream(request):
+            return streaming_json_response(stream_object_with_array(
+                data, "vacancies", iter_json_array(rows.order_by(*ordering), serializer.represent)
+            ))
+        page = self.paginate_queryset(rows)
+        data["vacancies"] = {
+            "next": self.paginator.get_next_link(),
+            "previous": self.paginator.get_previous_link(),
+            "results": serializer.represent(page),
+        }
+        return Response(data)
 
 
 class UserProfileView(APIView):
@@ -32,43 +115,163 @@ class UserProfileView(APIView):
     def get(self, request):
         user = request.user
         if user.role == "seeker":
-            serializer = SeekerProfileSerializer(user)
+            serializer_class = SeekerProfileSerializer
         else:
-            serializer = EmployerProfileSerializer(user)
+            serializer_class = EmployerProfileSerializer
+        user = serializer_class.setup_eager_loading(User.objects.filter(pk=user.pk)).get()
+        serializer = serializer_class(user)
         return Response(serializer.data)
 
 
-class VacancyListCreateView(generics.ListCreateAPIView):
-    queryset = Vacancy.objects.order_by("-created_at")  
+class EmployerApplicationInboxView(EagerLoadingViewMixin, generics.ListAPIView):
+    queryset = Application.objects.all()
+    serializer_class = ApplicationCompactSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = ApplicationCursorPagination
+
+    def filter_inbox(self, qs):
+        if self.request.user.role != 'employer':
+            raise PermissionDenied("Only employers have an applications inbox")
+        qs = qs.for_employer(self.request.user)
+        vacancy = self.request.query_params.get("vacancy")
+        if vacancy:
+            if not vacancy.isdigit():
+                raise ValidationError({"vacancy": "Expected a vacancy id."})
+            qs = qs.filter(vacancy_id=vacancy)
+        return qs
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        if getattr(self, 'swagger_fake_view', False):
+            return qs.none()
+        qs = self.filter_inbox(qs)
+        status_filter = self.request.query_params.get("status")
+        if status_filter:
+            if status_filter not in dict(Application.STATUS_CHOICES):
+                raise ValidationError({"status": f"Unknown status '{status_filter}'."})
+            qs = qs.filter(status=status_filter)
+        return qs
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        # Counts ignore the status filter so every status tab can show its total.
+        response.data["counts"] = self.filter_inbox(Application.objects.all()).status_counts()
+        return response
+
+
+class VacancyListCreateView(AnonymousResponseCacheMixin, ListConditionalGetMixin, EagerLoadingViewMixin, generics.ListCreateAPIView):
+    queryset = Vacancy.objects.active().order_by("-created_at")
     serializer_class = VacancySerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    pagination_class = VacancyCursorPagination
+    cache_name = "vacancy-list"
+    conditional_fields = ("updated_at", "company__updated_at")
+
+    def get_cache_scopes(self):
+        return ["vacancies"]
 
     def get_queryset(self):
         qs = super().get_queryset()
-        title = self.request.query_params.get("t")
-        if title:
-            qs = qs.filter(title__icontains=title)
-
-        date_obj = self.request.query_params.get("d")
-        if date_obj:
-            filter_date = datetime.strptime(date_obj, "%Y-%m-%d")
-            qs = qs.filter(
-                created_at__year=filter_date.year,
-                created_at__month=filter_date.month,
-                created_at__day=filter_date.day,
-            )
+        query = self.request.query_params.get("t")
+        if query:
+            qs = search_vacancies(qs, query)
+
+        qs = filter_created_between(qs, self.request.query_params)
+        qs = filter_vacancies(qs, self.request.query_params)
         return qs
 
+    def get_cursor_ordering(self, ordering):
+        return vacancy_ordering(self.request.query_params, ordering)
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get("facets") in ("1", "true"):
+            queryset = self.filter_queryset(self.get_queryset())
+            return Response(cached_facets(request, queryset))
+
+        # Read path: flat values() rows rendered by VacancyValuesSerializer.
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = VacancyValuesSerializer(context=self.get_serializer_context())
+        ordering = self.paginator.get_ordering(request, queryset, self)
+        rows = serializer.values(queryset, *[field.lstrip("-") for field in ordering])
+        if wants_stream(request):
+            return streaming_json_response(iter_json_array(rows.order_by(*ordering), serializer.represent))
+        page = self.paginate_queryset(rows)
+        return self.get_paginated_response(serializer.represent(page))
+
     def perform_create(self, serializer):
         if self.request.user.role != 'employer':
             raise PermissionDenied("Only employers can create vacancies")
-        serializer.save(author=self.request.user)
+        serializer.save(author_id=self.request.user.id)
+
+
+class VacancyImportView(APIView):
+    """
+    Bulk-create vacancies from an uploaded CSV or JSONL ``file``. The format
+    comes from ``file_format`` or the file extension; ``dry_run`` only validates.
+    """
 
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request):
+        if request.user.role != 'employer':
+            raise PermissionDenied("Only employers can import vacancies")
+        upload = request.FILES.get("file")
+        if upload is None:
+            raise ValidationError({"file": "Upload a CSV or JSONL file."})
+        fmt = request.data.get("file_format") or guess_format(upload.name)
+        if fmt not in FORMATS:
+            raise ValidationError({"file_format": f"Expected one of: {', '.join(FORMATS)}."})
+        dry_run = request.data.get("dry_run") in ("1", "true")
+
+        try:
+            check_encoding(upload.chunks())
+        except UnicodeDecodeError:
+            raise ValidationError({"file": "The file must be UTF-8 encoded."})
+        upload.seek(0)
+        result = import_vacancies(codecs.iterdecode(upload, "utf-8-sig"), fmt, request.user, dry_run=dry_run)
+        code = status.HTTP_200_OK if dry_run else status.HTTP_201_CREATED
+        return Response(VacancyImportResultSerializer(result).data, status=code)
+
+
+class VacancyExportView(APIView):
+    """Stream the employer's own vacancies as CSV or JSONL (``file_format``)."""
+
+    permission_classes = [IsAuthenticated]
+    content_types = {"csv": "text/csv; charset=utf-8", "jsonl": "application/x-ndjson; charset=utf-8"}
 
-class VacancyRetrieveUpdateDeleteView(generics.RetrieveUpdateDestroyAPIView):
+    def get(self, request):
+        if request.user.role != 'employer':
+            raise PermissionDenied("Only employers can export vacancies")
+        fmt = request.query_params.get("file_format", "csv")
+        if fmt not in FORMATS:
+            raise ValidationError({"file_format": f"Expected one of: {', '.join(FORMATS)}."})
+        queryset = Vacancy.objects.filter(author_id=request.user.id)
+        response = StreamingHttpResponse(export_vacancies(queryset, fmt), content_type=self.content_types[fmt])
+        response["Content-Disposition"] = f'attachment; filename="vacancies.{fmt}"'
+        return response
+
+
+class VacancyRetrieveUpdateDeleteView(AnonymousResponseCacheMixin, DetailConditionalGetMixin, EagerLoadingViewMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = Vacancy.objects.all()
     serializer_class = VacancySerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    cache_name = "vacancy-detail"
+    conditional_fields = ("updated_at", "company__updated_at")
+
+    def get_cache_scopes(self):
+        return [f"vacancy:{self.kwargs['pk']}"]
+
+    def get_queryset(self):
+        # Only the author sees an inactive vacancy, and only while
+        # authenticated, so the anonymous response cache never holds one.
+        return super().get_queryset().visible_to(self.request.user)
+
+    def on_cache_hit(self, request, *args, **kwargs):
+        get_view_counter().hit(kwargs["pk"])
+
+    # A 304 is still a view.
+    on_not_modified = on_cache_hit
 
     def retrieve(self, request, *args, **kwargs):
         vacancy = self.get_object()
@@ -78,65 +281,165 @@ class VacancyRetrieveUpdateDeleteView(generics.RetrieveUpdateDestroyAPIView):
 
     def perform_update(self, serializer):
         vacancy = self.get_object()
-        if vacancy.author != self.request.user:
+        if vacancy.author_id != self.request.user.id:
             raise PermissionDenied("You can only edit your own vacancies")
         serializer.save()
 
     def perform_destroy(self, instance):
-        if instance.author != self.request.user:
+        if instance.author_id != self.request.user.id:
             raise PermissionDenied("You can only delete your own vacancies")
         instance.delete()
 
 
-class ResumeListCreateView(generics.ListCreateAPIView):
+class ResumeListCreateView(ListConditionalGetMixin, EagerLoadingViewMixin, StreamingListMixin, generics.ListCreateAPIView):
     queryset = Resume.objects.filter(is_active=True).order_by("-id")  
     serializer_class = ResumeSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    pagination_class = ResumeCursorPagination
 
     def get_queryset(self):
         qs = super().get_queryset()
         skill = self.request.query_params.get("skill")
         if skill:
-            qs = qs.filter(skills__name__icontains=skill)  
+            names = parse_skills(skill)
+            match = self.request.query_params.get("skill_match", "all")
+            if match not in ("all", "any"):
+                raise ValidationError({"skill_match": "Expected 'all' or 'any'."})
+            if names:
+                qs = filter_by_skills(qs, names, match_all=match == "all")
         return qs
 
     def perform_create(self, serializer):
         if self.request.user.role != 'seeker':
             raise PermissionDenied("Only seekers can create resumes")
-        serializer.save(user=self.request.user)
+        serializer.save(user_id=self.request.user.id)
 
 
-class ResumeRetrieveUpdateDeleteView(generics.RetrieveUpdateDestroyAPIView):
+class ResumeRetrieveUpdateDeleteView(DetailConditionalGetMixin, EagerLoadingViewMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = Resume.objects.all()
     serializer_class = ResumeSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
     def perform_update(self, serializer):
         resume = self.get_object()
-        if resume.user != self.request.user:
+        if resume.user_id != self.request.user.id:
             raise PermissionDenied("You can only edit your own resume")
         serializer.save()
 
     def perform_destroy(self, instance):
-        if instance.user != self.request.user:
+        if instance.user_id != self.request.user.id:
             raise PermissionDenied("You can only delete your own resume")
         instance.delete()
 
 
+class MatchLimitMixin:
+    def get_limit(self):
+        limit = self.request.query_params.get("limit", "20")
+        if not limit.isdigit() or int(limit) < 1:
+            raise ValidationError({"limit": "Expected a positive integer."})
+        return min(int(limit), top_k())
+
+
+class VacancyMatchesView(MatchLimitMixin, generics.ListAPIView):
+    serializer_class = ResumeMatchSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        if getattr(self, 'swagger_fake_view', False):
+            return VacancyMatch.objects.none()
+        vacancy = get_object_or_404(Vacancy, pk=self.kwargs["pk"])
+        if vacancy.author_id != self.request.user.id:
+            raise PermissionDenied("You can only see matches for your own vacancies")
+        return (
+            # Resumes deactivated since the last compute_matches run drop out here.
+            VacancyMatch.objects.filter(vacancy=vacancy, resume__is_active=True)
+            .select_related("resume__user")
+            .order_by("-score", "resume_id")[:self.get_limit()]
+        )
+
+
+class ResumeMatchesView(MatchLimitMixin, generics.ListAPIView):
+    """Vacancies whose stored shortlist (``compute_matches``) includes the resume, best first."""
+
+    serializer_class = VacancyMatchSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        if getattr(self, 'swagger_fake_view', False):
+            return VacancyMatch.objects.none()
+        resume = get_object_or_404(Resume, pk=self.kwargs["pk"])
+        if resume.user_id != self.request.user.id:
+            raise PermissionDenied("You can only see matches for your own resume")
+        return (
+            VacancyMatch.objects.filter(resume=resume, vacancy__is_active=True)
+            .prefetch_related(Prefetch("vacancy", queryset=Vacancy.objects.for_listing()))
+            .order_by("-score", "vacancy_id")[:self.get_limit()]
+        )
+
+
 class ApplicationCreateView(generics.CreateAPIView):
     serializer_class = ApplicationSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    throttle_scope = "apply"
 
     def perform_create(self, serializer):
         if self.request.user.role != 'seeker':
             raise PermissionDenied("Only seekers can apply for vacancies")
         vacancy = get_object_or_404(Vacancy, id=self.kwargs["vacancy_id"])
-        serializer.save(applicant=self.request.user, vacancy=vacancy)
+        serializer.save(applicant_id=self.request.user.id, vacancy=vacancy)
+
+
+class ApplicationBulkStatusView(generics.GenericAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = BulkApplicationStatusSerializer
+
+    def post(self, request):
+        if request.user.role != 'employer':
+            raise PermissionDenied("Only employers can change application status")
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        target = data["status"]
+        sources = Application.TRANSITIONS[target]
+
+        # Ownership is part of the query itself (one join on vacancy.author),
+        # so ids belonging to other employers simply come back as not_found.
+        qs = Application.objects.for_employer(request.user)
+        if "ids" in data:
+            qs = qs.filter(id__in=data["ids"])
+        else:
+            qs = qs.filter(vacancy_id=data["vacancy"])
+            if "current_status" in data:
+                qs = qs.filter(status=data["current_status"])
+
+        with transaction.atomic():
+            current = dict(qs.select_for_update(of=("self",)).values_list("id", "status"))
+            movable = [pk for pk, current_status in current.items() if current_status in sources]
+            updated = 0
+            if movable:
+                updated = Application.objects.filter(id__in=movable, status__in=sources).update(
+                    status=target, updated_at=timezone.now()
+                )
+
+        results = []
+        for pk in dict.fromkeys(data.get("ids") or sorted(current)):
+            if pk not in current:
+                result = "not_found"
+            elif current[pk] == target:
+                result = "unchanged"
+            elif current[pk] in sources:
+                result = "updated"
+            else:
+                result = "invalid_transition"
+            results.append({"id": pk, "result": result})
+
+        return Response(BulkApplicationStatusResultSerializer({"updated": updated, "results": results}).data)
 
 
 class FavoriteVacancyToggleView(generics.GenericAPIView):
     permission_classes = [IsAuthenticatedOrReadOnly]
     serializer_class = FavoriteToggleResponseSerializer
+    throttle_scope = "favorite"
 
     def get_serializer(self, *args, **kwargs):
         if getattr(self, 'swagger_fake_view', False):
@@ -146,10 +449,31 @@ class FavoriteVacancyToggleView(generics.GenericAPIView):
     def post(self, request, vacancy_id):
         if request.user.role != 'seeker':
             raise PermissionDenied("Only seekers can add vacancies to favorites")
-        vacancy = get_object_or_404(Vacancy, id=vacancy_id)
-        if FavoriteVacancy.is_favorited(request.user, vacancy):
-            FavoriteVacancy.objects.filter(user=request.user, vacancy=vacancy).delete()
+        # Delete first: if a row went away this was a removal. Otherwise insert,
+        # letting a concurrent insert of the same pair win quietly instead of
+        # tripping the unique constraint.
+        removed, _ = FavoriteVacancy.objects.filter(user_id=request.user.id, vacancy_id=vacancy_id).delete()
+        if removed:
             return Response({"message": "Removed from favorites"}, status=status.HTTP_200_OK)
-        else:
-            FavoriteVacancy.objects.create(user=request.user, vacancy=vacancy)
-            return Response({"message": "Added to favorites"}, status=status.HTTP_201_CREATED)
\ No newline at end of file
+        try:
+            with transaction.atomic():
+                FavoriteVacancy.objects.bulk_create(
+                    [FavoriteVacancy(user_id=request.user.id, vacancy_id=vacancy_id)], ignore_conflicts=True
+                )
+        except IntegrityError:
+            # The only constraint left to fail is the vacancy foreign key.
+            raise NotFound("No Vacancy matches the given query.")
+        return Response({"message": "Added to favorites"}, status=status.HTTP_201_CREATED)
+
+
+class FavoriteStatusView(APIView):
+    """``?ids=1,2,3`` -> which of those vacancies the user has favorited, in one query."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        ids = parse_id_list(request.query_params, "ids", limit=settings.API_MAX_PAGE_SIZE)
+        favorited = set(
+            FavoriteVacancy.objects.filter(user_id=request.user.id, vacancy_id__in=ids).values_list("vacancy_id", flat=True)
+        )
+        return Response({"favorites": {str(pk): pk in favorited for pk in ids}})
@@ -75,13 +75,123 @@ WSGI_APPLICATION = 'server.wsgi.application'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accounts.authentication.ClaimsJWTAuthentication',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'api.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'api.renderers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
+    'DEFAULT_THROTTLE_CLASSES': (
+        'api.throttling.ScopedThrottle',
+    ),
+    'EXCEPTION_HANDLER': 'accounts.exceptions.exception_handler',
+    # Reverse proxies in front of the app. Throttles key anonymous clients on
+    # the address this many hops from the right of X-Forwarded-For; 0 uses
+    # REMOTE_ADDR and ignores the header, which clients can forge.
+    'NUM_PROXIES': int(os.getenv('NUM_PROXIES', '0')),
+}
+
+# Rate limits for views with a throttle_scope. ALGORITHM is 'token_bucket'
+# (refills at RATE, holds up to BURST) or 'sliding_window' (RATE per window).
+# KEY 'user' limits authenticated requests per user, everything else per IP.
+# Rejections are counted per scope (manage.py throttle_stats). Buckets live in
+# their own cache (CACHES['throttling']) so response caching can't evict them.
+THROTTLING = {
+    'ENABLED': os.getenv('THROTTLING_ENABLED', 'True').strip().lower() in ('true', '1', 'yes'),
+    'CACHE': 'throttling',
+    'SCOPES': {
+        'login': {'ALGORITHM': 'token_bucket', 'RATE': '10/min', 'BURST': 5, 'KEY': 'ip'},
+        'register': {'ALGORITHM': 'sliding_window', 'RATE': '20/hour', 'KEY': 'ip'},
+        'refresh': {'ALGORITHM': 'sliding_window', 'RATE': '30/min', 'KEY': 'ip'},
+        'apply': {'ALGORITHM': 'sliding_window', 'RATE': '30/hour', 'KEY': 'user'},
+        'favorite': {'ALGORITHM': 'token_bucket', 'RATE': '60/min', 'BURST': 20, 'KEY': 'user'},
+    },
+}
+
+# The JSON renderer/parser use orjson when it is installed (pip install
+# orjson); set FAST_JSON=False to force the stdlib json module.
+FAST_JSON = os.getenv('FAST_JSON', 'True').strip().lower() in ('true', '1', 'yes')
+
+# Cursor-paginated lists: default page size and the ceiling for ?page_size=.
+API_PAGE_SIZE = int(os.getenv('API_PAGE_SIZE', '20'))
+API_MAX_PAGE_SIZE = int(os.getenv('API_MAX_PAGE_SIZE', '100'))
+
+# Worker processes serving the app, as gunicorn reads it.
+WEB_CONCURRENCY = int(os.getenv('WEB_CONCURRENCY', '1'))
+
+# Local-memory by default, which only suits a single worker: cached responses
+# are invalidated in the process that handled the write, so other workers
+# would serve stale JSON until RESPONSE_CACHE TIMEOUT. With WEB_CONCURRENCY > 1
+# `manage.py check` requires shared caches (api.E001): set CACHE_BACKEND /
+# THROTTLE_CACHE_BACKEND to e.g. django.core.cache.backends.redis.RedisCache
+# with a redis:// LOCATION. FileBasedCache shares the response cache too, but
+# its add/incr aren't atomic, which the view counter needs.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'jobsearch'),
+    },
+    # One entry per throttled client and scope; MAX_ENTRIES should cover the
+    # clients expected within the longest throttle window.
+    'throttling': {
+        'BACKEND': os.getenv('THROTTLE_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('THROTTLE_CACHE_LOCATION', 'jobsearch-throttling'),
+        'OPTIONS': {'MAX_ENTRIES': int(os.getenv('THROTTLE_CACHE_MAX_ENTRIES', '100000'))},
+    },
+}
+
+# Pre-rendered JSON for anonymous reads of the vacancy and company endpoints.
+RESPONSE_CACHE = {
+    'CACHE': 'default',
+    'TIMEOUT': int(os.getenv('RESPONSE_CACHE_TIMEOUT', '60')),
 }
 
+# Vacancy views are buffered and written back in bulk. LocalViewCounterBackend
+# keeps them in the worker process, so with several workers (WEB_CONCURRENCY > 1,
+# as gunicorn reads it) pending counts must go through
+# api.counters.CacheViewCounterBackend instead, on a shared Redis or Memcached
+# cache, or `manage.py flush_vacancy_views` never sees them.
+VACANCY_VIEW_COUNTER = {
+    'BACKEND': os.getenv(
+        'VIEW_COUNTER_BACKEND',
+        'api.counters.CacheViewCounterBackend' if WEB_CONCURRENCY > 1 else 'api.counters.LocalViewCounterBackend',
+    ),
+    'FLUSH_INTERVAL': int(os.getenv('VIEW_COUNTER_FLUSH_INTERVAL', '30')),
+    'FLUSH_THRESHOLD': int(os.getenv('VIEW_COUNTER_FLUSH_THRESHOLD', '100')),
+}
+
+# Vacancy/resume matching: how many candidates to keep per vacancy. Scoring a
+# save reads every active row on the other side, so it is left to
+# `manage.py compute_matches --changed-since MINUTES` run from cron;
+# RECOMPUTE_ON_SAVE does it right after commit instead (small datasets only).
+MATCHING = {
+    'TOP_K': int(os.getenv('MATCHING_TOP_K', '50')),
+    'RECOMPUTE_ON_SAVE': os.getenv('MATCHING_RECOMPUTE_ON_SAVE', 'False').strip().lower() in ('true', '1', 'yes'),
+}
+
+# Active vacancies older than this many days are deactivated by the
+# expire_vacancies command (run it from cron).
+VACANCY_EXPIRY_DAYS = int(os.getenv('VACANCY_EXPIRY_DAYS', '30'))
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=int(os.getenv('ACCESS_TOKEN_LIFETIME_MINUTES', '15'))),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=int(os.getenv('REFRESH_TOKEN_LIFETIME_DAYS', '1'))),
+    'TOKEN_USER_CLASS': 'accounts.authentication.ClaimsUser',
+}
+
+# API requests are authorized from the token's id/role claims; views that need
+# the rest of the user load it through a per-user cache kept this many seconds.
+AUTH_USER_CACHE_TTL = int(os.getenv('AUTH_USER_CACHE_TTL', '60'))
+
+# Blacklisted refresh-token ids are checked in memory; each process reloads
+# them from the database this often to see logouts handled elsewhere.
+TOKEN_BLACKLIST = {
+    'SYNC_INTERVAL': int(os.getenv('TOKEN_BLACKLIST_SYNC_INTERVAL', '60')),
 }
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
@@ -97,6 +207,23 @@ DATABASES = {
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
+# PBKDF2 runs on a pool of WORKERS threads (0 hashes on the request thread);
+# once MAX_PENDING hashes are queued or running, sign-ins get a 503. Changing
+# ITERATIONS rehashes each password on its owner's next login.
+PASSWORD_HASHING = {
+    'ITERATIONS': int(os.getenv('PASSWORD_HASH_ITERATIONS', '1000000')),
+    'WORKERS': int(os.getenv('PASSWORD_HASHING_WORKERS', str(max(1, (os.cpu_count() or 2) // 2)))),
+    'MAX_PENDING': int(os.getenv('PASSWORD_HASHING_MAX_PENDING', '64')),
+}
+
+PASSWORD_HASHERS = [
+    'accounts.hashers.TunablePBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',